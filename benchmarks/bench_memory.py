@@ -0,0 +1,149 @@
+"""Benchmark the memory used by each class of `paddles`.
+
+For each class, this script measures
+- the memory of an empty instance, in bytes: the average over many instances,
+  including the objects each instance refers to, like its lists and locks
+- the size of an empty instance itself, in bytes (with `sys.getsizeof`)
+- the memory of an instance with n members, in bytes, in total and per member.
+
+Memory is measured with `tracemalloc`. The members are integers that are
+created before measuring, so that only the memory of the instances is measured.
+
+The results are written in CSV or JSON format, one row or object per class,
+to compare the implementations and to detect memory regressions.
+
+To run all benchmarks, enter `uv run python -m benchmarks.bench_memory`.
+Enter `uv run python -m benchmarks.bench_memory -h` to see the options,
+e.g. to select the classes and the number of members.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import TextIO
+
+import paddles
+
+# The function that creates an instance of each class with the given members.
+# Classes with a capacity get the number of members as capacity, or 1 if there
+# are none, as a bounded queue must have a positive capacity.
+# Priority queue members are their own priorities.
+CLASSES = {
+    "AsyncDeque": lambda items: paddles.AsyncDeque(None, items),
+    "AsyncQueue": lambda items: paddles.AsyncQueue(None, items),
+    "BoundedQueue": lambda items: paddles.BoundedQueue(
+        max(1, len(items)), "block", items
+    ),
+    "ChunkedSortedList": paddles.ChunkedSortedList,
+    "ChunkedStack": paddles.ChunkedStack,
+    "DynamicArrayStack": paddles.DynamicArrayStack,
+    "HashTableBag": paddles.HashTableBag,
+    "HeapPriorityQueue": lambda items: paddles.HeapPriorityQueue(
+        (item, item) for item in items
+    ),
+    "IndexedHeapPriorityQueue": lambda items: paddles.IndexedHeapPriorityQueue(
+        (item, item) for item in items
+    ),
+    "LinkedListDeque": paddles.LinkedListDeque,
+    "LinkedListQueue": paddles.LinkedListQueue,
+    "LinkedListStack": paddles.LinkedListStack,
+    "StaticArrayStack": lambda items: paddles.StaticArrayStack(len(items), items),
+    "TypedArrayStack": lambda items: paddles.TypedArrayStack("q", items),
+}
+
+FIELDS = [
+    "class",
+    "empty_bytes",
+    "instance_bytes",
+    "size",
+    "bytes",
+    "bytes_per_member",
+]
+
+
+def traced_bytes(function: Callable[[], object]) -> tuple[object, int]:
+    """Call `function` and return its result and the memory it allocated."""
+    tracemalloc.start()
+    result = function()
+    used_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, used_bytes
+
+
+def measure(create: Callable, size: int, instances: int) -> dict:
+    """Return the memory of empty instances and of an instance with `size` members."""
+    empty = [None] * instances
+
+    def fill() -> None:
+        """Put new empty instances in the list `empty`."""
+        for index in range(instances):
+            empty[index] = create([])
+
+    _, empty_bytes = traced_bytes(fill)
+    items = list(range(size))
+    _, used_bytes = traced_bytes(lambda: create(items))
+    return {
+        "empty_bytes": empty_bytes / instances,
+        "instance_bytes": sys.getsizeof(empty[0]),
+        "size": size,
+        "bytes": used_bytes,
+        "bytes_per_member": used_bytes / size,
+    }
+
+
+def benchmark(classes: list[str], size: int, instances: int) -> list[dict]:
+    """Return the measurements for the classes."""
+    results = []
+    for name in classes:
+        result = {"class": name}
+        result.update(measure(CLASSES[name], size, instances))
+        results.append(result)
+    return results
+
+
+def write(results: list[dict], output_format: str, output: TextIO) -> None:
+    """Write the results to `output`, in CSV or JSON format."""
+    if output_format == "json":
+        json.dump(results, output, indent=2)
+    else:
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main() -> None:
+    """Parse the command line, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--classes",
+        nargs="+",
+        choices=CLASSES,
+        default=list(CLASSES),
+        help="classes to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--size", type=int, default=100_000, help="members (default: 100000)"
+    )
+    parser.add_argument(
+        "--instances",
+        type=int,
+        default=1_000,
+        help="empty instances to average over (default: 1000)",
+    )
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--output", type=Path, help="file (default: standard output)")
+    args = parser.parse_args()
+    results = benchmark(args.classes, args.size, args.instances)
+    if args.output is None:
+        write(results, args.format, sys.stdout)
+    else:
+        with args.output.open("w", newline="") as output:
+            write(results, args.format, output)
+
+
+if __name__ == "__main__":
+    main()
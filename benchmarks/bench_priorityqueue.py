@@ -0,0 +1,161 @@
+"""Benchmark the priority queue implementations for various arities and sizes.
+
+For each priority queue class, heap arity d and number of members n,
+this script measures, in seconds (the best of several runs):
+- the time to create a priority queue from n (member, priority) pairs
+- the time to add n members, one at a time
+- the time to remove all n members, with `take_min`
+- for indexed heaps, the time to decrease the priority of all n members.
+
+The priorities are random floats generated from a seed,
+so that results can be reproduced.
+The results are written in CSV or JSON format, one row or object per run,
+to choose an arity and to detect performance regressions.
+
+To run all benchmarks, enter `uv run python -m benchmarks.bench_priorityqueue`.
+Enter `uv run python -m benchmarks.bench_priorityqueue -h` to see the options,
+e.g. to select the classes, arities and sizes.
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TextIO
+
+from paddles import priorityqueue
+
+CLASSES = {
+    "HeapPriorityQueue": priorityqueue.HeapPriorityQueue,
+    "IndexedHeapPriorityQueue": priorityqueue.IndexedHeapPriorityQueue,
+}
+
+ARITIES = [2, 4, 8]
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+FIELDS = [
+    "class",
+    "arity",
+    "size",
+    "create_seconds",
+    "add_seconds",
+    "take_seconds",
+    "change_seconds",
+]
+
+
+def timed(function: Callable, *args: object) -> tuple[object, float]:
+    """Call `function(*args)` and return its result and the time it took."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def add_all(create: Callable, pairs: list, arity: int) -> object:
+    """Return a new priority queue to which the `pairs` were added one by one."""
+    queue = create([], arity)
+    for item, priority in pairs:
+        queue.add(item, priority)
+    return queue
+
+
+def take_all(queue: priorityqueue.HeapPriorityQueue) -> None:
+    """Remove all members of the priority queue."""
+    for _ in range(queue.size()):
+        queue.take_min()
+
+
+def decrease_all(queue: priorityqueue.IndexedHeapPriorityQueue) -> None:
+    """Decrease the priority of each member to below all initial priorities.
+
+    The handles are 0 to n-1, for the n members created with the queue,
+    and the initial priorities are from 0 to 1.
+    """
+    for handle in range(queue.size()):
+        queue.change_priority(handle, -handle)
+
+
+def measure(name: str, arity: int, size: int, repeat: int, seed: int) -> dict:
+    """Return the shortest times of each operation on a queue of `size` members."""
+    create = CLASSES[name]
+    random.seed(seed)
+    pairs = [(item, random.random()) for item in range(size)]  # noqa: S311
+    times = {"create": [], "add": [], "take": [], "change": []}
+    for _ in range(repeat):
+        _, seconds = timed(create, pairs, arity)
+        times["create"].append(seconds)
+        queue, seconds = timed(add_all, create, pairs, arity)
+        times["add"].append(seconds)
+        if name == "IndexedHeapPriorityQueue":
+            _, seconds = timed(decrease_all, queue)
+            times["change"].append(seconds)
+        _, seconds = timed(take_all, queue)
+        times["take"].append(seconds)
+    return {
+        f"{operation}_seconds": min(seconds) if seconds else None
+        for operation, seconds in times.items()
+    }
+
+
+def benchmark(
+    classes: list[str], arities: list[int], sizes: list[int], repeat: int, seed: int
+) -> list[dict]:
+    """Return the measurements for all combinations of classes, arities and sizes."""
+    results = []
+    for size in sizes:
+        for arity in arities:
+            for name in classes:
+                result = {"class": name, "arity": arity, "size": size}
+                result.update(measure(name, arity, size, repeat, seed))
+                results.append(result)
+    return results
+
+
+def write(results: list[dict], output_format: str, output: TextIO) -> None:
+    """Write the results to `output`, in CSV or JSON format."""
+    if output_format == "json":
+        json.dump(results, output, indent=2)
+    else:
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main() -> None:
+    """Parse the command line, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--classes",
+        nargs="+",
+        choices=CLASSES,
+        default=list(CLASSES),
+        help="classes to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--arities", nargs="+", type=int, default=ARITIES, help="heap arities"
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=SIZES, help="numbers of members"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per timing (default: 3)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--output", type=Path, help="file (default: standard output)")
+    args = parser.parse_args()
+    results = benchmark(args.classes, args.arities, args.sizes, args.repeat, args.seed)
+    if args.output is None:
+        write(results, args.format, sys.stdout)
+    else:
+        with args.output.open("w", newline="") as output:
+            write(results, args.format, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""Benchmark the queue implementations.
+
+This script has a command for each benchmark:
+- `async`: for each queue class and number of tasks t, the time for
+  t producer coroutines to enqueue items, while t consumer coroutines
+  dequeue them, all on a single event loop, and the throughput, i.e.
+  the number of items that went through the queue per second.
+  The `AsyncQueue` class is compared with the standard `asyncio.Queue` class.
+- `batch`: for each batch size b, the time per item to enqueue and dequeue items
+  with a `LinkedListQueue`, one at a time and b at a time
+  with `enqueue_many` and `dequeue_many`.
+- `pool`: for each linked class and pool size, the steady-state throughput,
+  i.e. the number of operations per second when a queue of fixed size
+  repeatedly enqueues a member at the back and dequeues one from the front,
+  and the number and total duration of garbage collections during the run.
+  A `LinkedListDeque` is used as a queue, adding at the back and taking
+  from the front. A pool size of 0 means no pool.
+- `shared`: for each class and record size, the throughput, i.e. the number
+  of records and megabytes per second that a producer process sends to
+  the consumer process through the queue. The time is measured by the consumer,
+  from the first record to the last, so that it excludes the process start-up.
+  The `SharedMemoryQueue` class is compared with `multiprocessing.Queue`.
+
+The times are in seconds (the best of several runs).
+The results are written in CSV or JSON format, one row or object per run,
+to compare the implementations and to detect performance regressions.
+
+To run a benchmark, enter e.g. `uv run python -m benchmarks.bench_queue batch`.
+Enter `uv run python -m benchmarks.bench_queue <command> -h` to see the options,
+e.g. to select the classes and numbers of tasks.
+"""
+
+import argparse
+import asyncio
+import csv
+import gc
+import json
+import multiprocessing
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TextIO
+
+from paddles import AsyncQueue, LinkedListDeque, LinkedListQueue, SharedMemoryQueue
+
+# For each class: the function that creates an empty queue with a given capacity
+# and the names of the methods to enqueue and dequeue an item.
+ASYNC_QUEUES = {
+    "AsyncQueue": (AsyncQueue, "enqueue", "dequeue"),
+    "asyncio.Queue": (asyncio.Queue, "put", "get"),
+}
+
+TASKS = [1, 10, 100, 1_000]
+
+BATCHES = [1, 8, 64, 512, 4_096]
+
+# For each linked class: the names of the methods to enqueue and dequeue an item.
+LINKED_QUEUES = {
+    "LinkedListQueue": (LinkedListQueue, "enqueue", "dequeue"),
+    "LinkedListDeque": (LinkedListDeque, "add_back", "take_front"),
+}
+
+POOL_SIZES = [0, 16, 1_024]
+
+# For each class of queue between processes:
+# the names of the methods to enqueue and dequeue an item.
+SHARED_QUEUES = {
+    "SharedMemoryQueue": ("enqueue", "dequeue"),
+    "multiprocessing.Queue": ("put", "get"),
+}
+
+RECORD_SIZES = [8, 64, 512, 4_096]
+
+# The columns of the results of each command.
+FIELDS = {
+    "async": ["class", "tasks", "items", "capacity", "seconds", "items_per_second"],
+    "batch": [
+        "batch",
+        "items",
+        "seconds",
+        "many_seconds",
+        "seconds_per_item",
+        "many_seconds_per_item",
+    ],
+    "pool": [
+        "class",
+        "pool_size",
+        "size",
+        "operations",
+        "seconds",
+        "operations_per_second",
+        "collections",
+        "gc_seconds",
+    ],
+    "shared": [
+        "class",
+        "record_size",
+        "items",
+        "capacity",
+        "seconds",
+        "items_per_second",
+        "megabytes_per_second",
+    ],
+}
+
+
+async def produce_consume(name: str, tasks: int, items: int, capacity: int) -> None:
+    """Run `tasks` producers and consumers of `items` items each on one queue."""
+    create, enqueue_name, dequeue_name = ASYNC_QUEUES[name]
+    queue = create(capacity)
+    enqueue = getattr(queue, enqueue_name)
+    dequeue = getattr(queue, dequeue_name)
+
+    async def produce() -> None:
+        """Enqueue the items."""
+        for item in range(items):
+            await enqueue(item)
+
+    async def consume() -> None:
+        """Dequeue as many items as a producer enqueues."""
+        for _ in range(items):
+            await dequeue()
+
+    await asyncio.gather(
+        *[produce() for _ in range(tasks)], *[consume() for _ in range(tasks)]
+    )
+
+
+def enqueue_dequeue(batch: int, items: int) -> None:
+    """Enqueue and dequeue `items` items, in groups of `batch`, one at a time."""
+    queue = LinkedListQueue()
+    for start in range(0, items, batch):
+        for item in range(start, start + batch):
+            queue.enqueue(item)
+        for _ in range(batch):
+            queue.dequeue()
+
+
+def enqueue_dequeue_many(batch: int, items: int) -> None:
+    """Enqueue and dequeue `items` items, `batch` items at a time."""
+    queue = LinkedListQueue()
+    for start in range(0, items, batch):
+        queue.enqueue_many(range(start, start + batch))
+        queue.dequeue_many(batch)
+
+
+def turn_over(name: str, pool_size: int, size: int, operations: int) -> dict:
+    """Enqueue and dequeue `operations` items on a queue with `size` members.
+
+    Return the time taken and the number and duration of garbage collections.
+    """
+    create, enqueue_name, dequeue_name = LINKED_QUEUES[name]
+    queue = create(range(size), pool_size=pool_size)
+    enqueue = getattr(queue, enqueue_name)
+    dequeue = getattr(queue, dequeue_name)
+    pauses = []
+    started = []
+
+    def on_collection(phase: str, _: dict) -> None:
+        """Record the duration of each garbage collection."""
+        if phase == "start":
+            started.append(time.perf_counter())
+        else:
+            pauses.append(time.perf_counter() - started.pop())
+
+    gc.collect()
+    gc.callbacks.append(on_collection)
+    start = time.perf_counter()
+    for item in range(operations):
+        enqueue(item)
+        dequeue()
+    seconds = time.perf_counter() - start
+    gc.callbacks.remove(on_collection)
+    return {"seconds": seconds, "collections": len(pauses), "gc_seconds": sum(pauses)}
+
+
+def send(queue: Any, enqueue_name: str, record_size: int, items: int) -> None:
+    """Enqueue `items` records of `record_size` bytes, in the producer process."""
+    record = bytes(record_size)
+    enqueue = getattr(queue, enqueue_name)
+    for _ in range(items):
+        enqueue(record)
+    queue.close()
+
+
+def transfer(name: str, record_size: int, items: int, capacity: int) -> float:
+    """Dequeue the records that a new producer process enqueues.
+
+    Return the time from dequeuing the first record to dequeuing the last one.
+    """
+    context = multiprocessing.get_context("spawn")
+    if name == "SharedMemoryQueue":
+        queue = SharedMemoryQueue(capacity, record_size)
+    else:
+        queue = context.Queue(capacity)
+    enqueue_name, dequeue_name = SHARED_QUEUES[name]
+    producer = context.Process(
+        target=send, args=(queue, enqueue_name, record_size, items)
+    )
+    producer.start()
+    dequeue = getattr(queue, dequeue_name)
+    dequeue()
+    start = time.perf_counter()
+    for _ in range(items - 1):
+        dequeue()
+    seconds = time.perf_counter() - start
+    producer.join()
+    queue.close()
+    if isinstance(queue, SharedMemoryQueue):
+        queue.unlink()
+    return seconds
+
+
+def run_async(name: str, tasks: int, items: int, capacity: int) -> None:
+    """Run `produce_consume` on a new event loop."""
+    asyncio.run(produce_consume(name, tasks, items, capacity))
+
+
+def best_time(function: Callable, arguments: tuple, repeat: int) -> float:
+    """Return the shortest time, in seconds, of `repeat` calls of `function`."""
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*arguments)
+        seconds = min(seconds, time.perf_counter() - start)
+    return seconds
+
+
+def benchmark_async(
+    classes: list[str], tasks: list[int], items: int, capacity: int, repeat: int
+) -> list[dict]:
+    """Return the measurements for all combinations of classes and tasks."""
+    results = []
+    for task_count in tasks:
+        # Each producer enqueues a share of the items, so that runs are comparable.
+        per_task = max(1, items // task_count)
+        total = per_task * task_count
+        for name in classes:
+            arguments = (name, task_count, per_task, capacity)
+            seconds = best_time(run_async, arguments, repeat)
+            results.append(
+                {
+                    "class": name,
+                    "tasks": task_count,
+                    "items": total,
+                    "capacity": capacity,
+                    "seconds": seconds,
+                    "items_per_second": total / seconds,
+                }
+            )
+    return results
+
+
+def benchmark_batch(batches: list[int], items: int, repeat: int) -> list[dict]:
+    """Return the measurements for all batch sizes."""
+    results = []
+    for batch in batches:
+        # Each run has a whole number of batches, so that runs are comparable.
+        total = max(1, items // batch) * batch
+        seconds = best_time(enqueue_dequeue, (batch, total), repeat)
+        many_seconds = best_time(enqueue_dequeue_many, (batch, total), repeat)
+        results.append(
+            {
+                "batch": batch,
+                "items": total,
+                "seconds": seconds,
+                "many_seconds": many_seconds,
+                "seconds_per_item": seconds / total,
+                "many_seconds_per_item": many_seconds / total,
+            }
+        )
+    return results
+
+
+def benchmark_pool(
+    classes: list[str], pool_sizes: list[int], size: int, operations: int, repeat: int
+) -> list[dict]:
+    """Return the fastest run for all combinations of classes and pool sizes."""
+    results = []
+    for pool_size in pool_sizes:
+        for name in classes:
+            runs = [turn_over(name, pool_size, size, operations) for _ in range(repeat)]
+            fastest = min(runs, key=lambda run: run["seconds"])
+            result = {
+                "class": name,
+                "pool_size": pool_size,
+                "size": size,
+                "operations": operations,
+                "operations_per_second": operations / fastest["seconds"],
+            }
+            result.update(fastest)
+            results.append(result)
+    return results
+
+
+def benchmark_shared(
+    classes: list[str], record_sizes: list[int], items: int, capacity: int, repeat: int
+) -> list[dict]:
+    """Return the fastest run for all combinations of classes and record sizes."""
+    results = []
+    for record_size in record_sizes:
+        for name in classes:
+            seconds = min(
+                transfer(name, record_size, items, capacity) for _ in range(repeat)
+            )
+            # The time covers all records but the first.
+            results.append(
+                {
+                    "class": name,
+                    "record_size": record_size,
+                    "items": items,
+                    "capacity": capacity,
+                    "seconds": seconds,
+                    "items_per_second": (items - 1) / seconds,
+                    "megabytes_per_second": (items - 1) * record_size / seconds / 1e6,
+                }
+            )
+    return results
+
+
+def write(
+    results: list[dict], fields: list[str], output_format: str, output: TextIO
+) -> None:
+    """Write the results with the given `fields` to `output`, in CSV or JSON format."""
+    if output_format == "json":
+        json.dump(results, output, indent=2)
+    else:
+        writer = csv.DictWriter(output, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main() -> None:
+    """Parse the command line, run a benchmark and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per timing (default: 3)"
+    )
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--output", type=Path, help="file (default: standard output)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    async_parser = commands.add_parser("async", help="queues for asyncio programs")
+    async_parser.add_argument(
+        "--classes",
+        nargs="+",
+        choices=ASYNC_QUEUES,
+        default=list(ASYNC_QUEUES),
+        help="classes to benchmark (default: all)",
+    )
+    async_parser.add_argument(
+        "--tasks",
+        nargs="+",
+        type=int,
+        default=TASKS,
+        help="numbers of producers (and of consumers)",
+    )
+    batch_parser = commands.add_parser("batch", help="enqueue_many and dequeue_many")
+    batch_parser.add_argument(
+        "--batches", nargs="+", type=int, default=BATCHES, help="batch sizes"
+    )
+    pool_parser = commands.add_parser("pool", help="linked queues with node pools")
+    pool_parser.add_argument(
+        "--classes",
+        nargs="+",
+        choices=LINKED_QUEUES,
+        default=list(LINKED_QUEUES),
+        help="classes to benchmark (default: all)",
+    )
+    pool_parser.add_argument(
+        "--pool-sizes", nargs="+", type=int, default=POOL_SIZES, help="pool sizes"
+    )
+    pool_parser.add_argument(
+        "--size", type=int, default=1_000, help="queue size (default: 1000)"
+    )
+    pool_parser.add_argument(
+        "--operations",
+        type=int,
+        default=1_000_000,
+        help="enqueues and dequeues per run (default: 1000000)",
+    )
+    shared_parser = commands.add_parser("shared", help="queues between processes")
+    shared_parser.add_argument(
+        "--classes",
+        nargs="+",
+        choices=SHARED_QUEUES,
+        default=list(SHARED_QUEUES),
+        help="classes to benchmark (default: all)",
+    )
+    shared_parser.add_argument(
+        "--record-sizes",
+        nargs="+",
+        type=int,
+        default=RECORD_SIZES,
+        help="record sizes, in bytes",
+    )
+    for command_parser in (async_parser, shared_parser):
+        command_parser.add_argument(
+            "--capacity", type=int, default=100, help="queue capacity (default: 100)"
+        )
+    for command_parser in (async_parser, batch_parser, shared_parser):
+        command_parser.add_argument(
+            "--items", type=int, default=100_000, help="items per run (default: 100000)"
+        )
+    args = parser.parse_args()
+    if args.command == "async":
+        results = benchmark_async(
+            args.classes, args.tasks, args.items, args.capacity, args.repeat
+        )
+    elif args.command == "batch":
+        results = benchmark_batch(args.batches, args.items, args.repeat)
+    elif args.command == "shared":
+        results = benchmark_shared(
+            args.classes, args.record_sizes, args.items, args.capacity, args.repeat
+        )
+    else:
+        results = benchmark_pool(
+            args.classes, args.pool_sizes, args.size, args.operations, args.repeat
+        )
+    if args.output is None:
+        write(results, FIELDS[args.command], args.format, sys.stdout)
+    else:
+        with args.output.open("w", newline="") as output:
+            write(results, FIELDS[args.command], args.format, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""Benchmark the sorting functions for various input sizes and shapes.
+
+For each sorting function, input size and input shape, this script measures
+- the run time, in seconds (the best of several runs)
+- the peak memory allocated during a run, in bytes (with `tracemalloc`)
+- the number of comparisons (with `paddles.sorting.count_operations`).
+
+The results are written in CSV or JSON format, one row or object per run,
+to check the complexities given in the `paddles.sorting` docstring
+and to detect performance regressions.
+The inputs are generated from a seed, so that results can be reproduced.
+
+Functions that are too slow for large inputs, like Bogo Sort and the
+quadratic sorting algorithms, are skipped for sizes above their limit.
+If a function exceeds Python's recursion limit, the error is reported.
+Quick Sort always takes the first item as pivot, so it's quadratic on sorted
+and few-unique inputs, where it exceeds the recursion limit after copying
+the items once per level: it has the same limit as the quadratic algorithms.
+
+With the `--numpy` option, the inputs are NumPy arrays instead of lists,
+to measure the vectorized backend of `merge_sorted`, `quick_sorted` and
+`quick_sorted_3way` against the same functions on lists (NumPy must be installed).
+
+To run all benchmarks, enter `uv run python -m benchmarks.bench_sorting`.
+Enter `uv run python -m benchmarks.bench_sorting -h` to see the options,
+e.g. to select the functions, sizes and shapes.
+"""
+
+import argparse
+import csv
+import inspect
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from paddles import sorting
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+# The largest input size for each slow function. Other functions have no limit.
+# The automatic functions are limited too, so that a poor choice can't make
+# the default run take hours.
+LIMITS = {
+    "auto_sort": 100_000,
+    "auto_sorted": 100_000,
+    "auto_sorted_with_algorithm": 100_000,
+    "bogo_sort": 8,
+    "bogo_sorted": 8,
+    "bubble_sort": 10_000,
+    "insertion_sort": 10_000,
+    "quick_sorted": 10_000,
+    "selection_sort": 10_000,
+}
+
+FIELDS = ["function", "shape", "size", "seconds", "peak_bytes", "comparisons", "error"]
+
+
+def random_items(size: int, rng: random.Random) -> list:
+    """Return `size` random integers from 0 to `size` - 1."""
+    return [rng.randrange(size) for _ in range(size)]
+
+
+def sorted_items(size: int, rng: random.Random) -> list:  # noqa: ARG001
+    """Return the integers from 0 to `size` - 1 in ascending order."""
+    return list(range(size))
+
+
+def reversed_items(size: int, rng: random.Random) -> list:  # noqa: ARG001
+    """Return the integers from 0 to `size` - 1 in descending order."""
+    return list(range(size - 1, -1, -1))
+
+
+def few_unique_items(size: int, rng: random.Random) -> list:
+    """Return `size` random integers from 0 to 9."""
+    return [rng.randrange(10) for _ in range(size)]
+
+
+def organ_pipe_items(size: int, rng: random.Random) -> list:  # noqa: ARG001
+    """Return ascending and then descending integers, e.g. 0, 1, 2, 2, 1, 0."""
+    middle = size // 2
+    return list(range(middle)) + list(range(size - middle - 1, -1, -1))
+
+
+def nearly_sorted_items(size: int, rng: random.Random) -> list:
+    """Return ascending integers with 1% of random pairs of them swapped."""
+    items = list(range(size))
+    for _ in range(max(1, size // 100)):
+        first = rng.randrange(size)
+        second = rng.randrange(size)
+        items[first], items[second] = items[second], items[first]
+    return items
+
+
+SHAPES = {
+    "random": random_items,
+    "sorted": sorted_items,
+    "reversed": reversed_items,
+    "few-unique": few_unique_items,
+    "organ-pipe": organ_pipe_items,
+    "nearly-sorted": nearly_sorted_items,
+}
+
+
+def sorting_functions() -> dict[str, Callable]:
+    """Return the module's functions that sort all items given as sole argument."""
+    functions = {}
+    for name in sorting.__all__:
+        parameters = inspect.signature(getattr(sorting, name)).parameters.values()
+        required = [p for p in parameters if p.default is inspect.Parameter.empty]
+        if "_sort" in name and len(required) == 1:
+            functions[name] = getattr(sorting, name)
+    return functions
+
+
+def sort(function: Callable, items: list) -> None:
+    """Sort `items` with `function`, generating all items if it's a generator."""
+    result = function(items)
+    if isinstance(result, Iterator):
+        for _ in result:
+            pass
+
+
+def measure(function: Callable, items: Any, repeat: int, seed: int) -> dict:
+    """Return the time, peak memory and comparisons of sorting `items`.
+
+    The items are a list or a NumPy array. The comparisons are always counted
+    on a list, as counting them requires wrapping each item in an object.
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        random.seed(seed)  # for functions that make random choices
+        copied = items.copy()
+        start = time.perf_counter()
+        sort(function, copied)
+        seconds = min(seconds, time.perf_counter() - start)
+    random.seed(seed)
+    copied = items.copy()
+    tracemalloc.start()
+    sort(function, copied)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    random.seed(seed)
+    _, counts = sorting.count_operations(function, list(items))
+    return {
+        "seconds": seconds,
+        "peak_bytes": peak_bytes,
+        "comparisons": counts["comparisons"],
+        "error": "",
+    }
+
+
+def as_array(generate: Callable) -> Callable:
+    """Return a function that generates the same input as a NumPy array."""
+    import numpy as np  # noqa: PLC0415
+
+    def generate_array(size: int, rng: random.Random) -> np.ndarray:
+        """Generate the input with `generate` and convert it to a NumPy array."""
+        return np.array(generate(size, rng))
+
+    return generate_array
+
+
+def benchmark(
+    functions: list[str],
+    sizes: list[int],
+    shapes: dict[str, Callable],
+    repeat: int,
+    seed: int,
+) -> list[dict]:
+    """Return the measurements for all combinations of functions, sizes and shapes.
+
+    Each shape has a function that generates an input of a given size.
+    """
+    available = sorting_functions()
+    results = []
+    for size in sizes:
+        for shape, generate in shapes.items():
+            items = generate(size, random.Random(seed))  # noqa: S311
+            for name in functions:
+                if size > LIMITS.get(name, size):
+                    continue
+                result = {"function": name, "shape": shape, "size": size}
+                try:
+                    result.update(measure(available[name], items, repeat, seed))
+                except RecursionError:
+                    tracemalloc.stop()
+                    result.update(
+                        seconds="",
+                        peak_bytes="",
+                        comparisons="",
+                        error="RecursionError",
+                    )
+                results.append(result)
+    return results
+
+
+def write(results: list[dict], output_format: str, output: TextIO) -> None:
+    """Write the results to `output`, in CSV or JSON format."""
+    if output_format == "json":
+        json.dump(results, output, indent=2)
+    else:
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main() -> None:
+    """Parse the command line, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--functions",
+        nargs="+",
+        choices=sorting_functions(),
+        default=list(sorting_functions()),
+        help="functions to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=SIZES, help="input sizes"
+    )
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        choices=SHAPES,
+        default=list(SHAPES),
+        help="input shapes (default: all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per timing (default: 3)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument(
+        "--numpy", action="store_true", help="sort NumPy arrays instead of lists"
+    )
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--output", type=Path, help="file (default: standard output)")
+    args = parser.parse_args()
+    shapes: dict[str, Callable] = {shape: SHAPES[shape] for shape in args.shapes}
+    if args.numpy:
+        shapes = {shape: as_array(generate) for shape, generate in shapes.items()}
+    results = benchmark(args.functions, args.sizes, shapes, args.repeat, args.seed)
+    if args.output is None:
+        write(results, args.format, sys.stdout)
+    else:
+        with args.output.open("w", newline="") as output:
+            write(results, args.format, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark the stack implementations for various numbers of members.
+
+For each stack class and number of members n, this script measures
+- the time to push n members and then pop them, in seconds (the best of several runs),
+  one at a time and with `push_many` and `pop_many`
+- the memory used by a stack with n members, in bytes (with `tracemalloc`).
+
+The results are written in CSV or JSON format, one row or object per run,
+to compare the implementations and to detect performance regressions.
+
+To run all benchmarks, enter `uv run python -m benchmarks.bench_stack`.
+Enter `uv run python -m benchmarks.bench_stack -h` to see the options,
+e.g. to select the classes and sizes.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import TextIO
+
+from paddles import stack
+
+# The function that creates an empty stack of each class, for a given size.
+# Static stacks get that size as capacity. Typed stacks store 64-bit integers,
+# like the benchmarks push.
+STACKS = {
+    "ChunkedStack": lambda _: stack.ChunkedStack(),
+    "DynamicArrayStack": lambda _: stack.DynamicArrayStack(),
+    "LinkedListStack": lambda _: stack.LinkedListStack(),
+    "StaticArrayStack": stack.StaticArrayStack,
+    "TypedArrayStack": lambda _: stack.TypedArrayStack("q"),
+}
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+FIELDS = ["class", "size", "seconds", "many_seconds", "bytes", "bytes_per_member"]
+
+
+def push_pop(create: Callable, size: int) -> None:
+    """Push `size` members on a stack made by `create` and pop them one by one."""
+    new_stack = create(size)
+    for item in range(size):
+        new_stack.push(item)
+    for _ in range(size):
+        new_stack.pop()
+
+
+def push_pop_many(create: Callable, size: int) -> None:
+    """Push `size` members on a stack made by `create` and pop them at once."""
+    new_stack = create(size)
+    new_stack.push_many(range(size))
+    new_stack.pop_many(size)
+
+
+def best_time(function: Callable, create: Callable, size: int, repeat: int) -> float:
+    """Return the shortest time, in seconds, of `repeat` calls of `function`."""
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(create, size)
+        seconds = min(seconds, time.perf_counter() - start)
+    return seconds
+
+
+def measure(create: Callable, size: int, repeat: int) -> dict:
+    """Return the push and pop times and the memory of a stack of `size` members."""
+    seconds = best_time(push_pop, create, size, repeat)
+    many_seconds = best_time(push_pop_many, create, size, repeat)
+    # The pushed integers are created before tracing, to only measure the stack.
+    items = list(range(size))
+    tracemalloc.start()
+    new_stack = create(size)
+    for item in items:
+        new_stack.push(item)
+    used_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {
+        "seconds": seconds,
+        "many_seconds": many_seconds,
+        "bytes": used_bytes,
+        "bytes_per_member": used_bytes / size,
+    }
+
+
+def benchmark(classes: list[str], sizes: list[int], repeat: int) -> list[dict]:
+    """Return the measurements for all combinations of classes and sizes."""
+    results = []
+    for size in sizes:
+        for name in classes:
+            result = {"class": name, "size": size}
+            result.update(measure(STACKS[name], size, repeat))
+            results.append(result)
+    return results
+
+
+def write(results: list[dict], output_format: str, output: TextIO) -> None:
+    """Write the results to `output`, in CSV or JSON format."""
+    if output_format == "json":
+        json.dump(results, output, indent=2)
+    else:
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main() -> None:
+    """Parse the command line, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--classes",
+        nargs="+",
+        choices=STACKS,
+        default=list(STACKS),
+        help="classes to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=SIZES, help="numbers of members"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per timing (default: 3)"
+    )
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--output", type=Path, help="file (default: standard output)")
+    args = parser.parse_args()
+    results = benchmark(args.classes, args.sizes, args.repeat)
+    if args.output is None:
+        write(results, args.format, sys.stdout)
+    else:
+        with args.output.open("w", newline="") as output:
+            write(results, args.format, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,15 @@
 """  # noqa: D200, D400
 
 from .bag import HashTableBag
-from .deque import LinkedListDeque
-from .queue import LinkedListQueue
+from .deque import AsyncDeque, LinkedListDeque
+from .priorityqueue import HeapPriorityQueue, IndexedHeapPriorityQueue
+from .queue import AsyncQueue, BoundedQueue, LinkedListQueue, SharedMemoryQueue
+from .sortedlist import ChunkedSortedList
 from .sorting import *
-from .stack import DynamicArrayStack, LinkedListStack
+from .stack import (
+    ChunkedStack,
+    DynamicArrayStack,
+    LinkedListStack,
+    StaticArrayStack,
+    TypedArrayStack,
+)
@@ -0,0 +1,96 @@
+"""Helper functions shared by the stack, queue and deque modules.
+
+The helpers build the brief representations of the linked structures,
+sort chains of linked nodes, and wait on `asyncio` conditions.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from typing import Any
+
+
+class _Head:
+    """A temporary node before the first node of a chain: it has only a next link."""
+
+    __slots__ = ("next",)
+
+    def __init__(self) -> None:
+        """Create a node without a next node."""
+        self.next = None
+
+
+def short_repr(name: str, size: int, first: list, last: list) -> str:
+    """Return '<name: size n, [first members, ..., last members]>'.
+
+    The ellipsis is shown only if some members are neither in `first` nor in `last`.
+    """
+    members = [repr(member) for member in first]
+    if len(first) + len(last) < size:
+        members.append("...")
+    members.extend(repr(member) for member in last)
+    return f"<{name}: size {size}, [{', '.join(members)}]>"
+
+
+def merge_sort(first: Any, length: int) -> tuple:
+    """Sort the `length` nodes starting at node `first`, with Merge Sort.
+
+    The nodes are relinked via their next links only, so that their members
+    are in non-decreasing order. The nodes of a doubly-linked list, like those
+    of `LinkedListDeque`, must have their previous links fixed afterwards.
+    Return the first and last node of the sorted chain, and the node that was
+    after the `length` nodes before sorting them.
+    """
+    if length == 1:
+        rest = first.next
+        first.next = None
+        return first, first, rest
+    middle = length // 2
+    left, left_last, rest = merge_sort(first, middle)
+    right, right_last, rest = merge_sort(rest, length - middle)
+    # Merge the two chains after a temporary node. For stability,
+    # a node is taken from the right chain only if its member is smaller.
+    before_first: Any = _Head()
+    last = before_first
+    while left and right:
+        if right.data < left.data:
+            last.next = right
+            last = right
+            right = right.next
+        else:
+            last.next = left
+            last = left
+            left = left.next
+    if left:
+        last.next = left
+        last = left_last
+    else:
+        last.next = right
+        last = right_last
+    return before_first.next, last, rest
+
+
+async def wait(
+    condition: asyncio.Condition, predicate: Callable[[], Any], timeout: float | None
+) -> bool:
+    """Wait at most `timeout` seconds until `predicate()` is true.
+
+    The `condition`'s lock must be acquired. Return whether the predicate is true.
+    """
+    if predicate():
+        return True
+    woken = False
+    try:
+        if timeout is None:
+            # Avoid the task that `asyncio.wait_for` creates to enforce the timeout.
+            woken = await condition.wait_for(predicate)
+        else:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(condition.wait_for(predicate), timeout)
+                woken = True
+    finally:
+        # A task that stops waiting, due to the timeout or to being cancelled,
+        # may have been notified instead of another waiting task: pass it on.
+        if not woken and predicate():
+            condition.notify()
+    return woken
@@ -77,6 +77,11 @@ class HashTableBag:
     HashTableBag({'e': 1, 'o': 1, 'u': 1})
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_members",
+    )
+
     def __init__(self, items: Iterable[Hashable] = []) -> None:
         """Initialize the bag with the `items`.
 
@@ -99,6 +104,23 @@ class HashTableBag:
         """
         return f"HashTableBag({self._members})"
 
+    def __getstate__(self) -> tuple[dict[Hashable, int]]:
+        """Return a 1-tuple with the members and their copies, for pickling.
+
+        The dictionary is in a tuple because pickle protocols 0 and 1
+        don't call `__setstate__` if the state is empty.
+
+        Complexity: O(1)
+        """
+        return (self._members,)
+
+    def __setstate__(self, state: tuple[dict[Hashable, int]]) -> None:
+        """Restore the bag's members from the 1-tuple returned by `__getstate__`.
+
+        Complexity: O(1)
+        """
+        (self._members,) = state
+
     def add(self, item: Hashable, copies: int = 1) -> None:
         """Add the given number of copies of `item` to the bag.
 
@@ -39,26 +39,62 @@ or a doubly-linked list (see `LinkedListDeque`).
 In both cases, the operations take constant time.
 A doubly-linked list uses much more memory than a static array of the same length,
 but a dynamic array may have wasted capacity and requires resizing.
+To use less memory, the nodes are objects with `__slots__`: unlike lists
+or other objects, they don't need a separate array or dictionary for their three fields.
+
+In programs that use `asyncio`, coroutines can share a deque (see `AsyncDeque`)
+and wait for space or members by awaiting the deque's operations.
 """
 
-from collections.abc import Sequence
+import asyncio
+import itertools
+from collections.abc import Callable, Iterator, Sequence
 from typing import Any
 
-__all__ = ["LinkedListDeque"]
+from ._util import merge_sort, short_repr, wait
+
+__all__ = ["AsyncDeque", "LinkedListDeque"]
+
+
+class _Node:
+    """A node of a doubly-linked list: the previous node, a member and the next node.
+
+    The first node has no previous node and the last node has no next node:
+    the corresponding attribute is `None`.
+    With `__slots__`, a node takes less memory than a list [previous, item, next],
+    as it has no per-instance dictionary and no separate array of items.
+    """
+
+    __slots__ = ("data", "next", "prev")
+
+    prev: "_Node | None"
+    data: Any
+    next: "_Node | None"
+
+    def __init__(self, prev: Any, data: Any, next_node: Any) -> None:
+        """Create a node with member `data`, between nodes `prev` and `next_node`."""
+        self.prev = prev
+        self.data = data
+        self.next = next_node
 
-# A doubly-linked list node is a list [previous, item, next].
-# These constants make the code more readable.
-PREV = 0
-DATA = 1
-NEXT = 2
+
+# How many members at each reachable end of a deque `repr` shows.
+REPR_MEMBERS = 3
 
 
 class LinkedListDeque:
     """An implementation of the Deque ADT, using a doubly-linked list.
 
-    Besides the ADT's operations, this class provides two convenience operations:
+    Besides the ADT's operations, this class provides nine convenience operations:
     - create a non-empty deque from a given sequence
-    - convert a deque to a string, to see its members listed from front to back.
+    - convert a deque to a string, to see its members listed from front to back
+    - move all members of another deque to the back, in constant time
+    - split a deque in two at a given position
+    - reuse the nodes of removed members, with an optional pool
+    - sort the members in non-decreasing order, from front to back
+    - copy and pickle a deque, even with millions of members
+    - iterate over the members in either direction, without removing them
+    - represent a deque briefly, with its size and its front and back members.
 
     >>> from paddles import LinkedListDeque
     >>> deque = LinkedListDeque("abc")          # create a non-empty deque
@@ -74,19 +110,54 @@ class LinkedListDeque:
     >>> deque.add_front("A")                    # add a new member at the front
     >>> print(deque)                            # str(deque) also possible
     LinkedListDeque(['A', 'b', 'C'])
+    >>> list(reversed(deque))                   # iterate from back to front
+    ['C', 'b', 'A']
+    >>> deque                                   # repr(deque) shows both ends
+    <LinkedListDeque: size 3, ['A', 'b', 'C']>
+    >>> deque.extend_from(LinkedListDeque("de"))    # move members to the back
+    >>> back = deque.split_at(2)                # remove members from position 2
+    >>> print(deque, back)
+    LinkedListDeque(['A', 'b']) LinkedListDeque(['C', 'd', 'e'])
     """
 
-    def __init__(self, sequence: Sequence[Any] = []) -> None:
+    __slots__ = (
+        "__weakref__",
+        "_head",
+        "_length",
+        "_pool",
+        "_pool_size",
+        "_pooled",
+        "_tail",
+    )
+
+    def __init__(self, sequence: Sequence[Any] = [], pool_size: int = 0) -> None:
         """Initialize the deque with the members of `sequence`.
 
         The members are added to the deque in the order they are in `sequence`.
         To create an empty deque, call `LinkedListDeque()` or `LinkedListDeque([])`.
 
+        If `pool_size` is positive, up to that many nodes of removed members
+        are kept in a pool and reused when adding members, instead of being
+        discarded and created anew. Reusing nodes saves allocating them and,
+        if the deque often grows and shrinks, reduces the work of the garbage
+        collector, but a pooled node takes memory while unused and reusing it
+        has its own overhead. Measure with `benchmarks/bench_queue.py`
+        before using a pool.
+        Raise `ValueError` if `pool_size` is negative.
+
         Complexity: O(n), with n = `len(sequence)`
         """
-        self._head = None
-        self._tail = None
+        if pool_size < 0:
+            msg = f"can't create a deque with pool size {pool_size}"
+            raise ValueError(msg)
+        # The type checker can't tell that the nodes exist, if there are members.
+        self._head: Any = None
+        self._tail: Any = None
         self._length = 0
+        # The pool is a chain of unused nodes, linked by their next attribute.
+        self._pool: Any = None  # the first unused node
+        self._pooled = 0  # the number of unused nodes
+        self._pool_size = pool_size
         if sequence:
             for item in sequence:
                 self.add_back(item)
@@ -101,10 +172,88 @@ class LinkedListDeque:
         strings = []
         current = self._head
         while current:
-            strings.append(repr(current[DATA]))
-            current = current[NEXT]
+            strings.append(repr(current.data))
+            current = current.next
         return f"LinkedListDeque([{', '.join(strings)}])"
 
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from front to back.
+
+        The members aren't removed or copied.
+        The deque must not be modified while iterating over it.
+
+        Complexity: O(1) per member
+        """
+        current = self._head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from back to front.
+
+        The members aren't removed or copied.
+        The deque must not be modified while iterating over it.
+
+        Complexity: O(1) per member
+        """
+        current = self._tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    def __repr__(self) -> str:
+        """Return a short representation of the deque, for logging and debugging.
+
+        The string is '<LinkedListDeque: size n, [front member, ..., back member]>',
+        with at most `REPR_MEMBERS` members at each end,
+        so that it's short for large deques.
+
+        Complexity: O(1)
+        """
+        first = list(itertools.islice(self, REPR_MEMBERS))
+        last_count = min(REPR_MEMBERS, self.size() - len(first))
+        last = list(itertools.islice(reversed(self), last_count))[::-1]
+        return short_repr("LinkedListDeque", self.size(), first, last)
+
+    def __getstate__(self) -> tuple[list[Any], int]:
+        """Return a list of the members, from front to back, and the pool size.
+
+        The nodes are visited in a loop, so that pickling and copying a deque
+        with many members doesn't exceed Python's recursion limit.
+        The pooled nodes aren't pickled or copied.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        members = []
+        current = self._head
+        while current:
+            members.append(current.data)
+            current = current.next
+        return members, self._pool_size
+
+    def __setstate__(self, state: tuple[list[Any], int]) -> None:
+        """Restore the deque from the members and pool size of `__getstate__`.
+
+        Complexity: O(n), with n = `len(state[0])`
+        """
+        members, self._pool_size = state
+        self._pool = None
+        self._pooled = 0
+        # Link the nodes after a temporary node, in a single pass.
+        before_first = _Node(None, None, None)
+        last = before_first
+        for item in members:
+            node = _Node(last, item, None)
+            last.next = node
+            last = node
+        first = before_first.next
+        if first:
+            first.prev = None
+        self._head = first
+        self._tail = last if members else None
+        self._length = len(members)
+
     def size(self) -> int:
         """Return how many members the deque has.
 
@@ -122,7 +271,7 @@ class LinkedListDeque:
         if self.size() == 0:
             msg = "can't access the front of an empty deque"
             raise ValueError(msg)
-        return self._head[DATA]
+        return self._head.data
 
     def back(self) -> Any:
         """Return the member at the back of the deque, without removing it.
@@ -134,18 +283,25 @@ class LinkedListDeque:
         if self.size() == 0:
             msg = "can't access the back of an empty deque"
             raise ValueError(msg)
-        return self._tail[DATA]
+        return self._tail.data
 
     def add_front(self, item: Any) -> None:
         """Put `item` at the front of the deque.
 
         Complexity: O(1)
         """
-        node = [None, item, self._head]
+        if self._pool:
+            node = self._pool
+            self._pool = node.next
+            self._pooled -= 1
+            node.data = item
+            node.next = self._head
+        else:
+            node = _Node(None, item, self._head)
         if self.size() == 0:
             self._tail = node
         else:
-            self._head[PREV] = node
+            self._head.prev = node
         self._head = node
         self._length += 1
 
@@ -154,11 +310,19 @@ class LinkedListDeque:
 
         Complexity: O(1)
         """
-        node = [self._tail, item, None]
+        if self._pool:
+            node = self._pool
+            self._pool = node.next
+            self._pooled -= 1
+            node.prev = self._tail
+            node.data = item
+            node.next = None
+        else:
+            node = _Node(self._tail, item, None)
         if self.size() == 0:
             self._head = node
         else:
-            self._tail[NEXT] = node
+            self._tail.next = node
         self._tail = node
         self._length += 1
 
@@ -172,13 +336,21 @@ class LinkedListDeque:
         if self.size() == 0:
             msg = "can't remove a member from an empty deque"
             raise ValueError(msg)
-        item = self._head[DATA]
-        self._head = self._head[NEXT]
+        node = self._head
+        item = node.data
+        self._head = node.next
         self._length -= 1
         if self.size() == 0:
             self._tail = None
         else:
-            self._head[PREV] = None
+            self._head.prev = None
+        if self._pooled < self._pool_size:
+            # Clear the member and links and put the node at the start of the pool.
+            node.prev = None
+            node.data = None
+            node.next = self._pool
+            self._pool = node
+            self._pooled += 1
         return item
 
     def take_back(self) -> Any:
@@ -191,11 +363,327 @@ class LinkedListDeque:
         if self.size() == 0:
             msg = "can't remove a member from an empty deque"
             raise ValueError(msg)
-        item = self._tail[DATA]
-        self._tail = self._tail[PREV]
+        node = self._tail
+        item = node.data
+        self._tail = node.prev
         self._length -= 1
         if self.size() == 0:
             self._head = None
         else:
-            self._tail[NEXT] = None
+            self._tail.next = None
+        if self._pooled < self._pool_size:
+            # Clear the member and links and put the node at the start of the pool.
+            node.prev = None
+            node.data = None
+            node.next = self._pool
+            self._pool = node
+            self._pooled += 1
         return item
+
+    def extend_from(self, other: "LinkedListDeque") -> None:
+        """Move all members of deque `other` to the back of this deque.
+
+        The members keep their order. The nodes of `other` are linked
+        to the back of this deque without being copied, so `other` becomes empty.
+        Raise `ValueError` if `other` is this deque, or `TypeError` if it isn't
+        a `LinkedListDeque`. In both cases, neither deque is changed.
+
+        Complexity: O(1)
+        """
+        if other is self:
+            msg = "can't extend a deque with itself"
+            raise ValueError(msg)
+        if not isinstance(other, LinkedListDeque):
+            msg = f"can't extend a deque with a {type(other).__name__}"
+            raise TypeError(msg)
+        other_head, other_tail, other_length = other._detach()  # noqa: SLF001
+        if other_length > 0:
+            if self.size() == 0:
+                self._head = other_head
+            else:
+                self._tail.next = other_head
+                other_head.prev = self._tail
+            self._tail = other_tail
+            self._length += other_length
+
+    def split_at(self, k: int) -> "LinkedListDeque":
+        """Remove the members from position `k` onwards and return them as a deque.
+
+        The front member is at position 0. Afterwards, this deque has
+        the first `k` members and the returned deque has the others, in order.
+        The nodes are unlinked, not copied, after walking to position `k`
+        from the nearer end of the deque.
+        Raise `ValueError` if `k` is negative or larger than the deque's size.
+
+        Complexity: O(min(k, n - k)), with n = `self.size()`
+        """
+        if not 0 <= k <= self.size():
+            msg = f"can't split a deque with {self.size()} members at position {k}"
+            raise ValueError(msg)
+        back = LinkedListDeque(pool_size=self._pool_size)
+        if k == self.size():
+            return back
+        if k == 0:
+            back.extend_from(self)
+            return back
+        # Find the first node of the back part, walking from the nearer end.
+        if k <= self.size() // 2:
+            first = self._head
+            for _ in range(k):
+                first = first.next
+        else:
+            first = self._tail
+            for _ in range(self.size() - k - 1):
+                first = first.prev
+        back._head = first
+        back._tail = self._tail
+        back._length = self.size() - k
+        self._tail = first.prev
+        self._tail.next = None
+        first.prev = None
+        self._length = k
+        return back
+
+    def sort(self) -> None:
+        """Put the members of the deque in non-decreasing order, from front to back.
+
+        The nodes are relinked with Merge Sort, without creating new nodes.
+        The sort is stable: members that are equal keep their order.
+
+        Complexity: O(n log n), with n = `self.size()`
+        """
+        if self.size() > 1:
+            self._head, self._tail, _ = merge_sort(self._head, self.size())
+            previous = None
+            current = self._head
+            while current:
+                current.prev = previous
+                previous = current
+                current = current.next
+
+    # Helper methods
+
+    def _detach(self) -> tuple:
+        """Empty the deque and return its former first node, last node and size."""
+        nodes = (self._head, self._tail, self._length)
+        self._head = None
+        self._tail = None
+        self._length = 0
+        return nodes
+
+
+class AsyncDeque:
+    """An implementation of the Deque ADT for `asyncio` programs.
+
+    The members are kept in a `LinkedListDeque`. The deque may have a capacity.
+    Adding and removing members are coroutines: instead of raising an error,
+    they wait while the deque is full or empty, letting other coroutines run.
+    Waiting coroutines resume in the order they started to wait.
+    Like `asyncio.Queue`, a deque must only be used by coroutines of one event loop.
+
+    Besides the ADT's operations, this class provides four convenience operations:
+    - create a non-empty deque from a given sequence
+    - convert a deque to a string, to see its members listed from front to back
+    - return the capacity of the deque
+    - take several members from the front at once, waiting a limited time for them.
+
+    >>> import asyncio
+    >>> from paddles import AsyncDeque
+    >>> async def example():
+    ...     deque = AsyncDeque(3, "b")          # create a non-empty deque
+    ...     await deque.add_front("a")          # add a member at the front
+    ...     await deque.add_back("c")           # add a member at the back
+    ...     print(deque)                        # str(deque) also possible
+    ...     print(deque.front(), deque.back(), deque.size(), deque.capacity())
+    ...     print(await deque.take_back())      # remove the back member
+    ...     print(await deque.take_front())     # remove the front member
+    ...     print(await deque.take_front_batch(5, 0.01))  # wait 0.01s for 5
+    >>> asyncio.run(example())
+    AsyncDeque(['a', 'b', 'c'])
+    a c 3 3
+    c
+    a
+    ['b']
+    """
+
+    __slots__ = ("__weakref__", "_capacity", "_members", "_not_empty", "_not_full")
+
+    def __init__(
+        self, capacity: int | None = None, sequence: Sequence[Any] = []
+    ) -> None:
+        """Initialize the deque with a capacity and the members of `sequence`.
+
+        The members are added to the deque in the order they are in `sequence`.
+        If `capacity` is `None`, the deque has no maximum size.
+        To create an empty deque, call `AsyncDeque()` or `AsyncDeque(capacity)`.
+        Raise `ValueError` if `capacity` isn't positive or
+        `sequence` has more than `capacity` members.
+
+        Complexity: O(n), with n = `len(sequence)`
+        """
+        if capacity is not None and capacity < 1:
+            msg = f"can't create a deque with capacity {capacity}"
+            raise ValueError(msg)
+        if capacity is not None and len(sequence) > capacity:
+            msg = "can't create a deque with more members than its capacity"
+            raise ValueError(msg)
+        self._members = LinkedListDeque(sequence)
+        self._capacity = capacity
+        # Both conditions share a lock, so that each operation is atomic.
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)  # notified when adding
+        self._not_full = asyncio.Condition(lock)  # notified when removing
+
+    def __str__(self) -> str:
+        """Return a string representation of the deque.
+
+        The string is 'AsyncDeque([front member, ..., back member])'.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return f"AsyncDeque({list(self._members)})"
+
+    def __getstate__(self) -> tuple[LinkedListDeque, int | None]:
+        """Return the members and the capacity, for pickling.
+
+        The lock isn't pickled: no coroutine can wait on an unpickled deque.
+
+        Complexity: O(1)
+        """
+        return self._members, self._capacity
+
+    def __setstate__(self, state: tuple[LinkedListDeque, int | None]) -> None:
+        """Restore the deque from the pair returned by `__getstate__`, with a new lock.
+
+        Complexity: O(1)
+        """
+        self._members, self._capacity = state
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    def size(self) -> int:
+        """Return how many members the deque has.
+
+        Complexity: O(1)
+        """
+        return self._members.size()
+
+    def capacity(self) -> int | None:
+        """Return the maximum size of the deque, or `None` if it has none.
+
+        Complexity: O(1)
+        """
+        return self._capacity
+
+    def front(self) -> Any:
+        """Return the member at the front of the deque, without removing it.
+
+        Raise `ValueError` if the deque is empty. This method doesn't wait.
+
+        Complexity: O(1)
+        """
+        return self._members.front()
+
+    def back(self) -> Any:
+        """Return the member at the back of the deque, without removing it.
+
+        Raise `ValueError` if the deque is empty. This method doesn't wait.
+
+        Complexity: O(1)
+        """
+        return self._members.back()
+
+    async def add_front(self, item: Any, timeout: float | None = None) -> None:
+        """Put `item` at the front of the deque.
+
+        If the deque is full, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for another coroutine to remove a member.
+        Raise `ValueError` if the deque is still full after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        await self._add(self._members.add_front, item, timeout)
+
+    async def add_back(self, item: Any, timeout: float | None = None) -> None:
+        """Put `item` at the back of the deque.
+
+        If the deque is full, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for another coroutine to remove a member.
+        Raise `ValueError` if the deque is still full after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        await self._add(self._members.add_back, item, timeout)
+
+    async def take_front(self, timeout: float | None = None) -> Any:
+        """Remove and return the member at the front of the deque.
+
+        If the deque is empty, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for another coroutine to add a member.
+        Raise `ValueError` if the deque is still empty after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        return await self._take(self._members.take_front, timeout)
+
+    async def take_back(self, timeout: float | None = None) -> Any:
+        """Remove and return the member at the back of the deque.
+
+        If the deque is empty, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for another coroutine to add a member.
+        Raise `ValueError` if the deque is still empty after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        return await self._take(self._members.take_back, timeout)
+
+    async def take_front_batch(self, n: int, timeout: float | None = None) -> list[Any]:
+        """Remove and return up to `n` members, from the front of the deque.
+
+        Wait at most `timeout` seconds, or indefinitely if `timeout` is `None`,
+        until `n` members have been taken. Return the members taken until then,
+        possibly none. This allows consumers to process members in batches,
+        without waiting too long for a batch to be complete.
+
+        Complexity: O(n), besides the time waiting
+        """
+        batch = []
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        async with self._not_empty:
+            while len(batch) < n:
+                remaining = None if deadline is None else deadline - loop.time()
+                if not await wait(self._not_empty, self._members.size, remaining):
+                    break
+                taken = min(n - len(batch), self._members.size())
+                batch.extend(self._members.take_front() for _ in range(taken))
+                self._not_full.notify(taken)
+        return batch
+
+    # Helper methods
+
+    async def _add(
+        self, add: Callable[[Any], None], item: Any, timeout: float | None
+    ) -> None:
+        """Add `item` with the `add` method, once the deque has space."""
+        async with self._not_full:
+            if not await wait(self._not_full, self._has_space, timeout):
+                msg = "can't add a member to a full deque"
+                raise ValueError(msg)
+            add(item)
+            self._not_empty.notify()
+
+    async def _take(self, take: Callable[[], Any], timeout: float | None) -> Any:
+        """Remove and return a member with the `take` method, once there's one."""
+        async with self._not_empty:
+            if not await wait(self._not_empty, self._members.size, timeout):
+                msg = "can't remove a member from an empty deque"
+                raise ValueError(msg)
+            item = take()
+            self._not_full.notify()
+            return item
+
+    def _has_space(self) -> bool:
+        """Check if the deque has fewer members than its capacity."""
+        return self._capacity is None or self._members.size() < self._capacity
@@ -0,0 +1,385 @@
+"""This module implements the Priority Queue ADT.
+
+## Intuition
+
+The Priority Queue ADT models a waiting line where the most urgent object
+is served first, e.g. patients in a hospital's emergency department.
+
+## Definition
+
+A **priority queue** is a collection where each member has a **priority**.
+The priorities must be comparable with each other.
+The member with the smallest priority value, called the **minimum**,
+is removed first, whatever the order in which the members were added.
+Members with the same priority are removed in the order they were added.
+
+## Operations
+
+The Priority Queue ADT provides operations to:
+- create a new empty priority queue
+- add a new member with a given priority
+- remove the minimum, i.e. the member with the smallest priority
+- access the minimum without removing it
+- compute the size of the priority queue (number of members).
+
+## Applications
+
+Priority queues are used to implement Dijkstra's shortest path algorithm,
+Prim's minimum spanning tree algorithm and event-driven simulations.
+You should consider using a priority queue when you need to:
+- schedule tasks by urgency or deadline, like timers or print jobs
+- repeatedly process the smallest (or largest) item of a changing collection.
+
+## Implementations
+
+A priority queue can be stored in a sorted list, where removing the minimum
+takes constant time but adding a member takes linear time.
+
+A **binary heap** stores the members in a dynamic array that represents
+a complete binary tree: the children of the node at index i are at
+indices 2i+1 and 2i+2. Each node's priority is at most its children's,
+so the minimum is at the root, index 0. Adding a member and removing the minimum
+move a member up or down one path of the tree, which takes logarithmic time.
+A heap can be built from n members in linear time (see `HeapPriorityQueue`).
+
+In a **d-ary heap**, each node has d children instead of two.
+The tree is shallower, so adding a member is faster and the nodes on
+a path are closer to each other in memory, but removing the minimum
+compares each node with d children instead of two.
+
+Some algorithms, like Dijkstra's, need to change the priority of a member,
+or remove a member that isn't the minimum. For that, an indexed heap
+(see `IndexedHeapPriorityQueue`) gives each member a handle and
+keeps track of where each member is in the array.
+
+## Practice
+
+LeetCode has several [problems about heaps](https://leetcode.com/tag/heap-priority-queue).
+You can sort or filter the problems by difficulty or other criteria,
+using the up/down or funnel buttons above the list of problems.
+Clicking on the up/down button and then on 'Tags' will show
+the algorithmic techniques and ADTs related to each problem.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+__all__ = ["HeapPriorityQueue", "IndexedHeapPriorityQueue"]
+
+# Each heap entry is a list [priority, order, member, index], where order is
+# the number of members added before it and index is the entry's position
+# in the heap. Entries are compared by priority and then by order, which is
+# unique, so that members are never compared and ties are broken by age.
+# These constants make the code more readable.
+PRIORITY = 0
+ORDER = 1
+DATA = 2
+INDEX = 3
+
+
+def _sift_up(heap: list, index: int, arity: int) -> None:
+    """Move the entry at `index` up the heap, until its parent isn't larger."""
+    entry = heap[index]
+    while index > 0:
+        parent = (index - 1) // arity
+        if not entry < heap[parent]:
+            break
+        # Move the parent down, instead of swapping it with the entry,
+        # and put the entry in its final place after the loop.
+        heap[index] = heap[parent]
+        heap[index][INDEX] = index
+        index = parent
+    heap[index] = entry
+    entry[INDEX] = index
+
+
+def _sift_down(heap: list, index: int, arity: int) -> None:
+    """Move the entry at `index` down the heap, until no child is smaller."""
+    entry = heap[index]
+    size = len(heap)
+    while True:
+        first = arity * index + 1
+        if first >= size:
+            break
+        smallest = first
+        for child in range(first + 1, min(first + arity, size)):
+            if heap[child] < heap[smallest]:
+                smallest = child
+        if not heap[smallest] < entry:
+            break
+        heap[index] = heap[smallest]
+        heap[index][INDEX] = index
+        index = smallest
+    heap[index] = entry
+    entry[INDEX] = index
+
+
+class _Heap:
+    """The operations shared by both heap-based implementations.
+
+    Subclasses provide the `add` operation.
+    """
+
+    __slots__ = ("__weakref__", "_added", "_arity", "_heap")
+
+    def __init__(self, pairs: Iterable[tuple[Any, Any]] = [], arity: int = 2) -> None:
+        """Initialize the priority queue with the (member, priority) `pairs`.
+
+        The heap is built bottom-up, which is faster than adding one pair at a time.
+        Members with the same priority are ordered as in `pairs`.
+        Each node of the heap has up to `arity` children.
+        To create an empty priority queue, call `HeapPriorityQueue()`.
+        Raise `ValueError` if `arity` is less than 2.
+
+        Complexity: O(n), with n = `len(pairs)`
+        """
+        if arity < 2:  # noqa: PLR2004
+            msg = f"can't create a heap with arity {arity}"
+            raise ValueError(msg)
+        self._arity = arity
+        self._heap = [
+            [priority, order, item, order]
+            for order, (item, priority) in enumerate(pairs)
+        ]
+        self._added = len(self._heap)  # the number of members ever added
+        # Sift down each node with children, from the last one to the root.
+        for index in range((len(self._heap) - 2) // arity, -1, -1):
+            _sift_down(self._heap, index, arity)
+
+    def __str__(self) -> str:
+        """Return a string representation of the priority queue.
+
+        The string is 'HeapPriorityQueue([(minimum, priority), ...])',
+        with the members in the order they would be removed.
+        The class name is the name of the object's class.
+
+        Complexity: O(n log n), with n = `self.size()`
+        """
+        pairs = [(entry[DATA], entry[PRIORITY]) for entry in sorted(self._heap)]
+        return f"{type(self).__name__}({pairs})"
+
+    def __getstate__(self) -> tuple[list[list], int, int]:
+        """Return the heap, the arity and the number of added members, for pickling.
+
+        Complexity: O(1)
+        """
+        return self._heap, self._arity, self._added
+
+    def __setstate__(self, state: tuple[list[list], int, int]) -> None:
+        """Restore the priority queue from the triple returned by `__getstate__`.
+
+        Complexity: O(1)
+        """
+        self._heap, self._arity, self._added = state
+
+    def size(self) -> int:
+        """Return how many members the priority queue has.
+
+        Complexity: O(1)
+        """
+        return len(self._heap)
+
+    def arity(self) -> int:
+        """Return the maximum number of children of each node of the heap.
+
+        Complexity: O(1)
+        """
+        return self._arity
+
+    def peek(self) -> tuple[Any, Any]:
+        """Return the minimum and its priority, without removing the minimum.
+
+        Raise `ValueError` if the priority queue is empty.
+
+        Complexity: O(1)
+        """
+        if self.size() == 0:
+            msg = "can't peek into an empty priority queue"
+            raise ValueError(msg)
+        entry = self._heap[0]
+        return entry[DATA], entry[PRIORITY]
+
+    def take_min(self) -> tuple[Any, Any]:
+        """Remove and return the minimum and its priority.
+
+        Raise `ValueError` if the priority queue is empty.
+
+        Complexity: O(d log n), with d = `self.arity()` and n = `self.size()`
+        """
+        if self.size() == 0:
+            msg = "can't take the minimum of an empty priority queue"
+            raise ValueError(msg)
+        entry = self._remove_at(0)
+        return entry[DATA], entry[PRIORITY]
+
+    # Helper methods
+
+    def _add(self, item: Any, priority: Any) -> list:
+        """Add `item` with the given `priority` and return its new heap entry."""
+        entry = [priority, self._added, item, len(self._heap)]
+        self._added += 1
+        self._heap.append(entry)
+        _sift_up(self._heap, entry[INDEX], self._arity)
+        return entry
+
+    def _remove_at(self, index: int) -> list:
+        """Remove the entry at the given position of the heap and return it."""
+        heap = self._heap
+        entry = heap[index]
+        last = heap.pop()
+        if index < len(heap):
+            # Fill the gap with the last entry and move it to its place.
+            heap[index] = last
+            last[INDEX] = index
+            if last < entry:
+                _sift_up(heap, index, self._arity)
+            else:
+                _sift_down(heap, index, self._arity)
+        return entry
+
+
+class HeapPriorityQueue(_Heap):
+    """An implementation of the Priority Queue ADT, using a d-ary heap.
+
+    The heap is stored in a Python list. By default, it's a binary heap.
+
+    Besides the ADT's operations, this class provides three convenience operations:
+    - create a non-empty priority queue from (member, priority) pairs
+    - convert a priority queue to a string, to see its members in priority order
+    - return the number of children of each node of the heap.
+
+    >>> from paddles import HeapPriorityQueue
+    >>> tasks = HeapPriorityQueue([("eat", 2), ("code", 1)])    # create from pairs
+    >>> tasks.add("sleep", 3)                   # add a member with priority 3
+    >>> tasks.add("test", 1)
+    >>> tasks.size()                            # number of members
+    4
+    >>> tasks.peek()                            # return but don't remove the minimum
+    ('code', 1)
+    >>> tasks.take_min()                        # remove and return the minimum
+    ('code', 1)
+    >>> print(tasks)                            # str(tasks) also possible
+    HeapPriorityQueue([('test', 1), ('eat', 2), ('sleep', 3)])
+    >>> HeapPriorityQueue(arity=4).arity()      # each node has up to 4 children
+    4
+    """
+
+    __slots__ = ()
+
+    def add(self, item: Any, priority: Any) -> None:
+        """Add `item` to the priority queue, with the given `priority`.
+
+        Complexity: O(log n), with n = `self.size()`
+        """
+        self._add(item, priority)
+
+
+class IndexedHeapPriorityQueue(_Heap):
+    """An implementation of the Priority Queue ADT, using an indexed d-ary heap.
+
+    Adding a member returns a **handle**, an integer that identifies the member
+    until it's removed. Each heap entry knows its position in the heap,
+    so that a member can be found from its handle in constant time.
+
+    Besides the operations of `HeapPriorityQueue`, this class provides
+    three convenience operations:
+    - check if a handle identifies a member of the priority queue
+    - change the priority of a member, given its handle
+    - remove a member, given its handle.
+
+    >>> from paddles import IndexedHeapPriorityQueue
+    >>> distances = IndexedHeapPriorityQueue()
+    >>> a = distances.add("A", 7)               # add a member and get its handle
+    >>> b = distances.add("B", 5)
+    >>> c = distances.add("C", 9)
+    >>> distances.change_priority(a, 3)         # decrease the priority of "A"
+    >>> distances.remove(b)                     # remove "B"
+    ('B', 5)
+    >>> distances.has(b)                        # b no longer identifies a member
+    False
+    >>> print(distances)
+    IndexedHeapPriorityQueue([('A', 3), ('C', 9)])
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, pairs: Iterable[tuple[Any, Any]] = [], arity: int = 2) -> None:
+        """Initialize the priority queue with the (member, priority) `pairs`.
+
+        The members of `pairs` get handles 0, 1, 2, etc., in order.
+        See `HeapPriorityQueue` for the other parameters.
+
+        Complexity: O(n), with n = `len(pairs)`
+        """
+        super().__init__(pairs, arity)
+        self._entries = {entry[ORDER]: entry for entry in self._heap}
+
+    def __setstate__(self, state: tuple[list[list], int, int]) -> None:
+        """Restore the priority queue from the triple returned by `__getstate__`.
+
+        The handles are mapped to the heap's entries again.
+
+        Complexity: O(n), with n the number of members
+        """
+        super().__setstate__(state)
+        self._entries = {entry[ORDER]: entry for entry in self._heap}
+
+    def has(self, handle: int) -> bool:
+        """Check if `handle` identifies a member of the priority queue.
+
+        Complexity: O(1)
+        """
+        return handle in self._entries
+
+    def add(self, item: Any, priority: Any) -> int:
+        """Add `item` with the given `priority` and return the member's handle.
+
+        Complexity: O(log n), with n = `self.size()`
+        """
+        entry = self._add(item, priority)
+        self._entries[entry[ORDER]] = entry
+        return entry[ORDER]
+
+    def change_priority(self, handle: int, priority: Any) -> None:
+        """Change the priority of the member identified by `handle`.
+
+        The member keeps its age, for ordering members with the same priority.
+        Raise `ValueError` if `handle` doesn't identify a member.
+
+        Complexity: O(d log n), with d = `self.arity()` and n = `self.size()`
+        """
+        if handle not in self._entries:
+            msg = f"can't change the priority of unknown handle {handle}"
+            raise ValueError(msg)
+        entry = self._entries[handle]
+        old_priority = entry[PRIORITY]
+        entry[PRIORITY] = priority
+        if priority < old_priority:
+            _sift_up(self._heap, entry[INDEX], self._arity)
+        else:
+            _sift_down(self._heap, entry[INDEX], self._arity)
+
+    def remove(self, handle: int) -> tuple[Any, Any]:
+        """Remove and return the member identified by `handle`, and its priority.
+
+        The handle no longer identifies a member.
+        Raise `ValueError` if `handle` doesn't identify a member.
+
+        Complexity: O(d log n), with d = `self.arity()` and n = `self.size()`
+        """
+        if handle not in self._entries:
+            msg = f"can't remove the member with unknown handle {handle}"
+            raise ValueError(msg)
+        entry = self._remove_at(self._entries[handle][INDEX])
+        return entry[DATA], entry[PRIORITY]
+
+    # Helper methods
+
+    def _remove_at(self, index: int) -> list:
+        """Remove the entry at the given position of the heap and return it.
+
+        The entry's handle no longer identifies a member.
+        """
+        entry = super()._remove_at(index)
+        del self._entries[entry[ORDER]]
+        return entry
@@ -41,6 +41,22 @@ or a singly-linked list (see `LinkedListQueue`).
 In both cases, the operations take constant time.
 A singly-linked list uses much more memory than a static array of the same length,
 but a dynamic array may have wasted capacity and requires resizing.
+To use less memory, the nodes are objects with `__slots__`: unlike lists
+or other objects, they don't need a separate array or dictionary for their two fields.
+
+If members are added by some threads (the producers) and removed by others
+(the consumers), a queue with a maximum size (see `BoundedQueue`) stops
+the producers from using up memory when the consumers fall behind.
+The queue applies an overflow policy when it's full: it can reject new members,
+make producers wait, or drop the oldest or newest members.
+
+In programs that use `asyncio`, producers and consumers are coroutines
+of the same thread. With `AsyncQueue`, they wait for space or members by
+awaiting the queue's operations, while other coroutines run.
+
+If the producer and the consumer are separate processes, the queue can be
+a circular array in shared memory (see `SharedMemoryQueue`), which both
+processes access directly, instead of sending each member through a pipe.
 
 ## Practice
 
@@ -51,23 +67,60 @@ Clicking on the up/down button and then on 'Tags' will show
 the algorithmic techniques and ADTs related to each problem.
 """
 
-from collections.abc import Sequence
+import asyncio
+import contextlib
+import itertools
+import os
+import platform
+import threading
+import time
+import warnings
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from multiprocessing import resource_tracker, shared_memory
 from typing import Any
 
-__all__ = ["LinkedListQueue"]
+from ._util import merge_sort, short_repr, wait
+
+__all__ = ["AsyncQueue", "BoundedQueue", "LinkedListQueue", "SharedMemoryQueue"]
+
+
+class _Node:
+    """A node of a singly-linked list: a member and the next node, or `None`.
+
+    With `__slots__`, a node takes less memory than a list [member, next],
+    as it has no per-instance dictionary and no separate array of items.
+    """
+
+    __slots__ = ("data", "next")
+
+    data: Any
+    next: "_Node | None"
+
+    def __init__(self, data: Any, next_node: Any) -> None:
+        """Create a node with member `data`, followed by node `next_node`."""
+        self.data = data
+        self.next = next_node
 
-# Each linked list node is a list [member, next].
-# These constants make the code more readable.
-DATA = 0
-NEXT = 1
+
+# How many members at each reachable end of a queue `repr` shows.
+REPR_MEMBERS = 3
 
 
 class LinkedListQueue:
     """An implementation of the Queue ADT, using a singly-linked list.
 
-    Besides the ADT's operations, this class provides two convenience operations:
+    Besides the ADT's operations, this class provides eleven convenience operations:
     - create a non-empty queue from a given sequence
-    - convert a queue to a string, to see its members listed from front to back.
+    - convert a queue to a string, to see its members listed from front to back
+    - enqueue several items at once
+    - dequeue several members at once
+    - dequeue all members at once
+    - move all members of another queue to the back, in constant time
+    - reuse the nodes of dequeued members, with an optional pool
+    - sort the members, so that they're dequeued in non-decreasing order
+    - copy and pickle a queue, even with millions of members
+    - iterate over the members, from front to back, without removing them
+    - represent a queue briefly, with its size and its front and back members.
 
     >>> from paddles import LinkedListQueue
     >>> q = LinkedListQueue("abc")  # create a non-empty queue
@@ -80,19 +133,59 @@ class LinkedListQueue:
     >>> q.enqueue("d")              # add a new member at the back
     >>> print(q)                    # str(q) also possible
     LinkedListQueue(['b', 'c', 'd'])
+    >>> list(q)                     # iterate from front to back
+    ['b', 'c', 'd']
+    >>> q                           # repr(q) shows the front and back members
+    <LinkedListQueue: size 3, ['b', 'c', 'd']>
+    >>> q.enqueue_many("ef")        # enqueue 'e' and then 'f'
+    >>> q.dequeue_many(2)           # dequeue 2 members, front member first
+    ['b', 'c']
+    >>> q.drain()                   # dequeue all members
+    ['d', 'e', 'f']
+    >>> other = LinkedListQueue("xy")
+    >>> q.extend_from(other)        # move the members of other to q
+    >>> print(q, other)
+    LinkedListQueue(['x', 'y']) LinkedListQueue([])
     """
 
-    def __init__(self, sequence: Sequence[Any] = []) -> None:
+    __slots__ = (
+        "__weakref__",
+        "_head",
+        "_length",
+        "_pool",
+        "_pool_size",
+        "_pooled",
+        "_tail",
+    )
+
+    def __init__(self, sequence: Sequence[Any] = [], pool_size: int = 0) -> None:
         """Initialize the queue with the members of `sequence`.
 
         The members are added to the queue in the order they are in `sequence`.
         To create an empty queue, call `LinkedListQueue()` or `LinkedListQueue([])`.
 
+        If `pool_size` is positive, up to that many nodes of dequeued members
+        are kept in a pool and reused when enqueuing, instead of being discarded
+        and created anew. Reusing nodes saves allocating them and, if the queue
+        often grows and shrinks, reduces the work of the garbage collector,
+        but a pooled node takes memory while unused and reusing it has
+        its own overhead. Measure with `benchmarks/bench_queue.py`
+        before using a pool.
+        Raise `ValueError` if `pool_size` is negative.
+
         Complexity: O(n), with n = `len(sequence)`
         """
-        self._head = None
-        self._tail = None
+        if pool_size < 0:
+            msg = f"can't create a queue with pool size {pool_size}"
+            raise ValueError(msg)
+        # The type checker can't tell that the nodes exist, if there are members.
+        self._head: Any = None
+        self._tail: Any = None
         self._length = 0
+        # The pool is a chain of unused nodes, linked by their next attribute.
+        self._pool: Any = None  # the first unused node
+        self._pooled = 0  # the number of unused nodes
+        self._pool_size = pool_size
         if sequence:
             for item in sequence:
                 self.enqueue(item)
@@ -107,10 +200,72 @@ class LinkedListQueue:
         strings = []
         current = self._head
         while current:
-            strings.append(repr(current[DATA]))
-            current = current[NEXT]
+            strings.append(repr(current.data))
+            current = current.next
         return f"LinkedListQueue([{', '.join(strings)}])"
 
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from front to back.
+
+        The members are produced in the order they would be dequeued,
+        without removing or copying them.
+        The queue must not be modified while iterating over it.
+
+        Complexity: O(1) per member
+        """
+        current = self._head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __repr__(self) -> str:
+        """Return a short representation of the queue, for logging and debugging.
+
+        The string is '<LinkedListQueue: size n, [front member, ..., back member]>',
+        with at most `REPR_MEMBERS` members at the front and the back member,
+        so that it's short for large queues.
+
+        Complexity: O(1)
+        """
+        first = list(itertools.islice(self, REPR_MEMBERS))
+        last = [self._tail.data] if self.size() > REPR_MEMBERS else []
+        return short_repr("LinkedListQueue", self.size(), first, last)
+
+    def __getstate__(self) -> tuple[list[Any], int]:
+        """Return a list of the members, from front to back, and the pool size.
+
+        The nodes are visited in a loop, so that pickling and copying a queue
+        with many members doesn't exceed Python's recursion limit.
+        The pooled nodes aren't pickled or copied.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        members = []
+        current = self._head
+        while current:
+            members.append(current.data)
+            current = current.next
+        return members, self._pool_size
+
+    def __setstate__(self, state: tuple[list[Any], int]) -> None:
+        """Restore the queue from the members and pool size of `__getstate__`.
+
+        Complexity: O(n), with n = `len(state[0])`
+        """
+        members, self._pool_size = state
+        self._pool = None
+        self._pooled = 0
+        # Link the nodes after a temporary node, in a single pass.
+        before_first = _Node(None, None)
+        last = before_first
+        for item in members:
+            node = self._new_node(item)
+            last.next = node
+            last = node
+        self._head = before_first.next
+        self._tail = last if members else None
+        self._length = len(members)
+
     def size(self) -> int:
         """Return how many members the queue has.
 
@@ -128,19 +283,19 @@ class LinkedListQueue:
         if self.size() == 0:
             msg = "can't access the front of an empty queue"
             raise ValueError(msg)
-        return self._head[DATA]
+        return self._head.data
 
     def enqueue(self, item: Any) -> None:
         """Put `item` at the back of the queue.
 
         Complexity: O(1)
         """
-        node = [item, None]
+        node = self._new_node(item)
         if self.size() == 0:
             self._head = node
             self._tail = node
         else:
-            self._tail[NEXT] = node
+            self._tail.next = node
             self._tail = node
         self._length += 1
 
@@ -154,9 +309,943 @@ class LinkedListQueue:
         if self.size() == 0:
             msg = "can't dequeue from an empty queue"
             raise ValueError(msg)
-        item = self._head[DATA]
-        self._head = self._head[NEXT]
+        node = self._head
+        item = node.data
+        self._head = node.next
         self._length -= 1
         if self.size() == 0:
             self._tail = None
+        self._recycle(node)
         return item
+
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """Put the `items` at the back of the queue, in the order they're given.
+
+        The new nodes are linked to each other first and then to the back
+        of the queue, in one step. This is faster than enqueuing one item at a time.
+
+        Complexity: O(k), with k = `len(items)`
+        """
+        # Link the new nodes after a temporary node, in a single pass.
+        before_first = _Node(None, None)
+        last = before_first
+        added = 0
+        for item in items:
+            node = self._new_node(item)
+            last.next = node
+            last = node
+            added += 1
+        if added:
+            if self.size() == 0:
+                self._head = before_first.next
+            else:
+                self._tail.next = before_first.next
+            self._tail = last
+            self._length += added
+
+    def dequeue_many(self, n: int) -> list[Any]:
+        """Remove and return the front `n` members, in the order they're dequeued.
+
+        The first member of the returned list is the front member of the queue.
+        The `n` nodes are detached from the queue in one step.
+        This is faster than dequeuing one member at a time.
+        Raise `ValueError` if `n` is negative or larger than the queue's size.
+
+        Complexity: O(n)
+        """
+        if not 0 <= n <= self.size():
+            msg = f"can't dequeue {n} members from a queue with {self.size()}"
+            raise ValueError(msg)
+        members = []
+        head = self._head
+        for _ in range(n):
+            node = head
+            members.append(node.data)
+            head = node.next
+            self._recycle(node)
+        self._head = head
+        self._length -= n
+        if self.size() == 0:
+            self._tail = None
+        return members
+
+    def drain(self) -> list[Any]:
+        """Remove and return all members, from front to back.
+
+        Afterwards, the queue is empty.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return self.dequeue_many(self.size())
+
+    def extend_from(self, other: "LinkedListQueue") -> None:
+        """Move all members of queue `other` to the back of this queue.
+
+        The members keep their order. The nodes of `other` are linked
+        to the back of this queue without being copied, so `other` becomes empty.
+        Raise `ValueError` if `other` is this queue, or `TypeError` if it isn't
+        a `LinkedListQueue`. In both cases, neither queue is changed.
+
+        Complexity: O(1)
+        """
+        if other is self:
+            msg = "can't extend a queue with itself"
+            raise ValueError(msg)
+        if not isinstance(other, LinkedListQueue):
+            msg = f"can't extend a queue with a {type(other).__name__}"
+            raise TypeError(msg)
+        other_head, other_tail, other_length = other._detach()  # noqa: SLF001
+        if other_length > 0:
+            if self.size() == 0:
+                self._head = other_head
+            else:
+                self._tail.next = other_head
+            self._tail = other_tail
+            self._length += other_length
+
+    def sort(self) -> None:
+        """Put the members of the queue in non-decreasing order.
+
+        The nodes are relinked with Merge Sort, without creating new nodes.
+        The sort is stable: members that are equal keep their order.
+
+        Complexity: O(n log n), with n = `self.size()`
+        """
+        if self.size() > 1:
+            self._head, self._tail, _ = merge_sort(self._head, self.size())
+
+    # Helper methods
+
+    def _new_node(self, item: Any) -> _Node:
+        """Return a node with member `item` and no next node, from the pool if any."""
+        node = self._pool
+        if node is None:
+            return _Node(item, None)
+        self._pool = node.next
+        self._pooled -= 1
+        node.data = item
+        node.next = None
+        return node
+
+    def _recycle(self, node: _Node) -> None:
+        """Put the removed `node` in the pool, unless the pool is full."""
+        if self._pooled < self._pool_size:
+            # Clear the member and put the node at the start of the pool.
+            node.data = None
+            node.next = self._pool
+            self._pool = node
+            self._pooled += 1
+
+    def _detach(self) -> tuple:
+        """Empty the queue and return its former first node, last node and size."""
+        nodes = (self._head, self._tail, self._length)
+        self._head = None
+        self._tail = None
+        self._length = 0
+        return nodes
+
+
+# The overflow policies of a BoundedQueue, i.e. what enqueuing does if it's full.
+POLICIES = ("reject", "block", "drop_oldest", "drop_newest")
+
+
+class BoundedQueue:
+    """A thread-safe implementation of the Queue ADT, with a maximum size.
+
+    The members are kept in a `LinkedListQueue`. A lock makes each operation
+    atomic, so that several threads can enqueue and dequeue members.
+
+    The queue's capacity is its maximum size. Enqueuing onto a full queue
+    follows the queue's overflow policy, one of `POLICIES`:
+    - 'reject': raise `ValueError`
+    - 'block': wait until another thread dequeues a member, then enqueue
+    - 'drop_oldest': dequeue and discard the front member, then enqueue
+    - 'drop_newest': discard the new item, i.e. don't enqueue it.
+
+    Dequeuing from an empty queue waits until another thread enqueues a member.
+    Both operations take an optional timeout, in seconds, after which
+    they give up waiting and raise `ValueError`.
+
+    Besides the ADT's operations, this class provides seven convenience operations:
+    - create a non-empty queue from a given sequence
+    - convert a queue to a string, to see its members listed from front to back
+    - return the capacity of the queue
+    - return the largest size the queue ever had (its high-water mark)
+    - return how many members or items were dropped due to a full queue
+    - iterate over the members, from front to back, without removing them
+    - represent a queue briefly, with its size and its front and back members.
+
+    >>> from paddles import BoundedQueue
+    >>> q = BoundedQueue(3, "drop_oldest", "abc")   # create a full queue
+    >>> q.enqueue("d")                              # drops 'a' to add 'd'
+    >>> print(q)                                    # str(q) also possible
+    BoundedQueue(['b', 'c', 'd'])
+    >>> q.dequeue()                                 # remove and return the front
+    'b'
+    >>> q.front()                                   # return but don't remove it
+    'c'
+    >>> q.size(), q.capacity(), q.high_water_mark(), q.dropped()
+    (2, 3, 3, 1)
+    >>> list(q)                                     # iterate from front to back
+    ['c', 'd']
+    >>> q                                           # repr(q) shows some members
+    <BoundedQueue: size 2, ['c', 'd']>
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_capacity",
+        "_dropped",
+        "_high_water_mark",
+        "_lock",
+        "_members",
+        "_not_empty",
+        "_not_full",
+        "_policy",
+    )
+
+    def __init__(
+        self, capacity: int, policy: str = "block", sequence: Sequence[Any] = []
+    ) -> None:
+        """Initialize the queue with a capacity, a policy and the members of `sequence`.
+
+        The members are added to the queue in the order they are in `sequence`,
+        following the overflow policy if there are more than `capacity` members.
+        To create an empty queue, call `BoundedQueue(capacity)` or
+        `BoundedQueue(capacity, policy)`.
+        Raise `ValueError` if `capacity` isn't positive or `policy` isn't
+        one of `POLICIES`, or if the policy is 'reject' or 'block' and
+        `sequence` has more than `capacity` members.
+
+        Complexity: O(n), with n = `len(sequence)`
+        """
+        if capacity < 1:
+            msg = f"can't create a bounded queue with capacity {capacity}"
+            raise ValueError(msg)
+        if policy not in POLICIES:
+            msg = f"can't use unknown overflow policy {policy!r}"
+            raise ValueError(msg)
+        self._members = LinkedListQueue()
+        self._capacity = capacity
+        self._policy = policy
+        self._high_water_mark = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)  # notified by enqueue
+        self._not_full = threading.Condition(self._lock)  # notified by dequeue
+        for item in sequence:
+            self.enqueue(item, 0)
+
+    def __str__(self) -> str:
+        """Return a string representation of the queue.
+
+        The string is 'BoundedQueue([front member, ..., back member])'.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        with self._lock:
+            return f"BoundedQueue({list(self._members)})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from front to back.
+
+        The members are copied while the lock is held, so that other threads
+        may change the queue during the iteration, which doesn't show the changes.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        with self._lock:
+            return iter(list(self._members))
+
+    def __repr__(self) -> str:
+        """Return a short representation of the queue, for logging and debugging.
+
+        The string is '<BoundedQueue: size n, [front members, ..., back member]>',
+        with at most `REPR_MEMBERS` front members, so that it's short for
+        large queues.
+
+        Complexity: O(1)
+        """
+        with self._lock:
+            members = self._members
+            size = members.size()
+            first = list(itertools.islice(members, REPR_MEMBERS))
+            last = [members._tail.data] if size > REPR_MEMBERS else []  # noqa: SLF001
+        return short_repr("BoundedQueue", size, first, last)
+
+    def size(self) -> int:
+        """Return how many members the queue has.
+
+        Complexity: O(1)
+        """
+        with self._lock:
+            return self._members.size()
+
+    def capacity(self) -> int:
+        """Return how many members the queue can have.
+
+        Complexity: O(1)
+        """
+        return self._capacity
+
+    def high_water_mark(self) -> int:
+        """Return the largest number of members the queue has had.
+
+        Complexity: O(1)
+        """
+        with self._lock:
+            return self._high_water_mark
+
+    def dropped(self) -> int:
+        """Return how many members or new items were discarded, due to a full queue.
+
+        Complexity: O(1)
+        """
+        with self._lock:
+            return self._dropped
+
+    def front(self) -> Any:
+        """Return the member at the front of the queue, without removing it.
+
+        Raise `ValueError` if the queue is empty. This method doesn't wait.
+
+        Complexity: O(1)
+        """
+        with self._lock:
+            return self._members.front()
+
+    def enqueue(self, item: Any, timeout: float | None = None) -> None:
+        """Put `item` at the back of the queue, following the policy if it's full.
+
+        With the 'block' policy, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for the queue to have space.
+        Raise `ValueError` if the policy is 'reject' and the queue is full, or
+        if the policy is 'block' and the queue is still full after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        with self._not_full:
+            if self._members.size() == self._capacity:
+                if self._policy == "drop_newest":
+                    self._dropped += 1
+                    return
+                if self._policy == "drop_oldest":
+                    self._members.dequeue()
+                    self._dropped += 1
+                elif self._policy == "reject" or not self._not_full.wait_for(
+                    self._has_space, timeout
+                ):
+                    msg = "can't enqueue onto a full queue"
+                    raise ValueError(msg)
+            self._members.enqueue(item)
+            self._high_water_mark = max(self._high_water_mark, self._members.size())
+            self._not_empty.notify()
+
+    def dequeue(self, timeout: float | None = None) -> Any:
+        """Remove and return the member at the front of the queue.
+
+        If the queue is empty, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for another thread to enqueue a member.
+        Raise `ValueError` if the queue is still empty after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._members.size, timeout):
+                msg = "can't dequeue from an empty queue"
+                raise ValueError(msg)
+            item = self._members.dequeue()
+            self._not_full.notify()
+            return item
+
+    def _has_space(self) -> bool:
+        """Check if the queue has fewer members than its capacity."""
+        return self._members.size() < self._capacity
+
+
+class AsyncQueue:
+    """An implementation of the Queue ADT for `asyncio` programs.
+
+    The members are kept in a `LinkedListQueue`. The queue may have a capacity.
+    Enqueuing and dequeuing are coroutines: instead of raising an error,
+    they wait while the queue is full or empty, letting other coroutines run.
+    Waiting coroutines resume in the order they started to wait.
+    Like `asyncio.Queue`, a queue must only be used by coroutines of one event loop.
+
+    Besides the ADT's operations, this class provides four convenience operations:
+    - create a non-empty queue from a given sequence
+    - convert a queue to a string, to see its members listed from front to back
+    - return the capacity of the queue
+    - dequeue several members at once, waiting a limited time for them.
+
+    >>> import asyncio
+    >>> from paddles import AsyncQueue
+    >>> async def example():
+    ...     q = AsyncQueue(2, "a")                  # create a non-empty queue
+    ...     await q.enqueue("b")                    # add a member at the back
+    ...     print(q)                                # str(q) also possible
+    ...     print(q.front(), q.size(), q.capacity())
+    ...     print(await q.dequeue())                # remove the front member
+    ...     print(await q.dequeue_batch(5, 0.01))   # wait 0.01s for 5 members
+    >>> asyncio.run(example())
+    AsyncQueue(['a', 'b'])
+    a 2 2
+    a
+    ['b']
+    """
+
+    __slots__ = ("__weakref__", "_capacity", "_members", "_not_empty", "_not_full")
+
+    def __init__(
+        self, capacity: int | None = None, sequence: Sequence[Any] = []
+    ) -> None:
+        """Initialize the queue with a capacity and the members of `sequence`.
+
+        The members are added to the queue in the order they are in `sequence`.
+        If `capacity` is `None`, the queue has no maximum size.
+        To create an empty queue, call `AsyncQueue()` or `AsyncQueue(capacity)`.
+        Raise `ValueError` if `capacity` isn't positive or
+        `sequence` has more than `capacity` members.
+
+        Complexity: O(n), with n = `len(sequence)`
+        """
+        if capacity is not None and capacity < 1:
+            msg = f"can't create a queue with capacity {capacity}"
+            raise ValueError(msg)
+        if capacity is not None and len(sequence) > capacity:
+            msg = "can't create a queue with more members than its capacity"
+            raise ValueError(msg)
+        self._members = LinkedListQueue(sequence)
+        self._capacity = capacity
+        # Both conditions share a lock, so that each operation is atomic.
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)  # notified by enqueue
+        self._not_full = asyncio.Condition(lock)  # notified by dequeue
+
+    def __str__(self) -> str:
+        """Return a string representation of the queue.
+
+        The string is 'AsyncQueue([front member, ..., back member])'.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return f"AsyncQueue({list(self._members)})"
+
+    def __getstate__(self) -> tuple[LinkedListQueue, int | None]:
+        """Return the members and the capacity, for pickling.
+
+        The lock isn't pickled: no coroutine can wait on an unpickled queue.
+
+        Complexity: O(1)
+        """
+        return self._members, self._capacity
+
+    def __setstate__(self, state: tuple[LinkedListQueue, int | None]) -> None:
+        """Restore the queue from the pair returned by `__getstate__`, with a new lock.
+
+        Complexity: O(1)
+        """
+        self._members, self._capacity = state
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    def size(self) -> int:
+        """Return how many members the queue has.
+
+        Complexity: O(1)
+        """
+        return self._members.size()
+
+    def capacity(self) -> int | None:
+        """Return the maximum size of the queue, or `None` if it has none.
+
+        Complexity: O(1)
+        """
+        return self._capacity
+
+    def front(self) -> Any:
+        """Return the member at the front of the queue, without removing it.
+
+        Raise `ValueError` if the queue is empty. This method doesn't wait.
+
+        Complexity: O(1)
+        """
+        return self._members.front()
+
+    async def enqueue(self, item: Any, timeout: float | None = None) -> None:
+        """Put `item` at the back of the queue.
+
+        If the queue is full, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for another coroutine to dequeue a member.
+        Raise `ValueError` if the queue is still full after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        async with self._not_full:
+            if not await wait(self._not_full, self._has_space, timeout):
+                msg = "can't enqueue onto a full queue"
+                raise ValueError(msg)
+            self._members.enqueue(item)
+            self._not_empty.notify()
+
+    async def dequeue(self, timeout: float | None = None) -> Any:
+        """Remove and return the member at the front of the queue.
+
+        If the queue is empty, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for another coroutine to enqueue a member.
+        Raise `ValueError` if the queue is still empty after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        async with self._not_empty:
+            if not await wait(self._not_empty, self._members.size, timeout):
+                msg = "can't dequeue from an empty queue"
+                raise ValueError(msg)
+            item = self._members.dequeue()
+            self._not_full.notify()
+            return item
+
+    async def dequeue_batch(self, n: int, timeout: float | None = None) -> list[Any]:
+        """Remove and return up to `n` members, from the front of the queue.
+
+        Wait at most `timeout` seconds, or indefinitely if `timeout` is `None`,
+        until `n` members have been dequeued. Return the members dequeued until
+        then, possibly none. This allows consumers to process members in batches,
+        without waiting too long for a batch to be complete.
+
+        Complexity: O(n), besides the time waiting
+        """
+        batch = []
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        async with self._not_empty:
+            while len(batch) < n:
+                remaining = None if deadline is None else deadline - loop.time()
+                if not await wait(self._not_empty, self._members.size, remaining):
+                    break
+                taken = min(n - len(batch), self._members.size())
+                batch.extend(self._members.dequeue_many(taken))
+                self._not_full.notify(taken)
+        return batch
+
+    def _has_space(self) -> bool:
+        """Check if the queue has fewer members than its capacity."""
+        return self._capacity is None or self._members.size() < self._capacity
+
+
+# The layout of a shared memory queue, in 8-byte words: the number of members
+# ever dequeued (the head) and ever enqueued (the tail), on separate 64-byte
+# cache lines, as each is written by a different process; then the capacity
+# and record size, so that other processes can find them; and then the slots.
+# Each slot has the record's length, followed by the record's bytes.
+WORD = 8
+HEAD = 0
+TAIL = 8
+CAPACITY = 16
+RECORD_SIZE = 17
+HEADER = 24 * WORD
+
+# The shortest and longest pauses, in seconds, while waiting for another process.
+MIN_PAUSE = 1e-6
+MAX_PAUSE = 1e-3
+
+# The machine types of x86 processors, which make the writes of a process
+# visible to other processes in the order they were made.
+X86_MACHINES = ("AMD64", "amd64", "i386", "i686", "x86", "x86_64")
+
+
+def _poll(predicate: Callable[[], bool], timeout: float | None) -> bool:
+    """Wait at most `timeout` seconds until `predicate()` is true.
+
+    Processes can't notify each other through shared memory, so the predicate
+    is checked repeatedly, with ever longer pauses to not waste the processor.
+    Return whether the predicate is true.
+    """
+    if predicate():
+        return True
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pause = MIN_PAUSE
+    while not predicate():
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(pause)
+        pause = min(2 * pause, MAX_PAUSE)
+    return True
+
+
+def _words(memory: shared_memory.SharedMemory) -> memoryview:
+    """Return a view of the shared memory as an array of 8-byte words."""
+    # The buffer is only `None` after the shared memory is closed.
+    buffer: memoryview = memory.buf  # ty: ignore[invalid-assignment]
+    return buffer.cast("Q")
+
+
+def _track(memory: shared_memory.SharedMemory, *, tracked: bool) -> None:
+    """Register or unregister the shared memory with the resource tracker.
+
+    On POSIX systems, the tracker unlinks the registered shared memory
+    when the processes that use the tracker end.
+    """
+    if os.name == "posix":
+        # The tracker knows the memory by its full name, with a leading slash.
+        name = memory._name  # ty: ignore[unresolved-attribute] # noqa: SLF001
+        if tracked:
+            resource_tracker.register(name, "shared_memory")
+        else:
+            resource_tracker.unregister(name, "shared_memory")
+
+
+class SharedMemoryQueue:
+    """An implementation of the Queue ADT, shared by two processes.
+
+    The members are records of up to a fixed number of bytes, stored in
+    a circular array of slots in a block of shared memory. One process
+    (the producer) enqueues records and another (the consumer) dequeues them.
+    Unlike `multiprocessing.Queue`, records aren't pickled and sent through
+    a pipe: they're copied into the shared memory and read from it.
+    Each process writes only its own counter of enqueued or dequeued records,
+    so no lock is needed, but there must be at most one producer and one consumer.
+    The records must be written before the tail counter that publishes them,
+    which x86 processors guarantee but others, like ARM, may not: on them,
+    the consumer may read a record before it's written. Creating or attaching
+    to a queue on a processor other than x86 gives a `RuntimeWarning`.
+
+    When the queue is passed to another process, e.g. as an argument of
+    `multiprocessing.Process`, it's pickled as the name of its shared memory,
+    and the other process gets a queue that uses the same memory.
+    Each process must call `close` once it no longer uses the queue,
+    and one process must then call `unlink` to free the shared memory.
+
+    Enqueuing onto a full queue waits for the consumer to dequeue a member,
+    and dequeuing from an empty queue waits for the producer to enqueue one.
+    Both operations take an optional timeout, in seconds, after which
+    they give up waiting and raise `ValueError`.
+
+    Besides the ADT's operations, this class provides eleven convenience operations:
+    - create a non-empty queue from a given sequence
+    - convert a queue to a string, to see its members listed from front to back
+    - iterate over the members, from front to back, without removing them
+    - represent a queue briefly, with its size and its front and back members
+    - return the capacity of the queue and the maximum size of a record
+    - return the name of the shared memory
+    - connect to the queue of another process, given the name of its shared memory
+    - remove the front member without copying it, after reading it with `front`
+    - stop using the queue in this process
+    - use the queue in a `with` statement, which stops using it at the end
+    - free the shared memory.
+
+    >>> import struct
+    >>> from paddles import SharedMemoryQueue
+    >>> q = SharedMemoryQueue(3, 8, [b"ab"])        # 3 records of up to 8 bytes
+    >>> q.enqueue(b"cde")                           # add a member at the back
+    >>> print(q)                                    # str(q) also possible
+    SharedMemoryQueue([b'ab', b'cde'])
+    >>> list(q)                                     # iterate from front to back
+    [b'ab', b'cde']
+    >>> q                                           # repr(q) shows some members
+    <SharedMemoryQueue: size 2, [b'ab', b'cde']>
+    >>> q.dequeue()                                 # remove and return a copy
+    b'ab'
+    >>> q.dequeue()
+    b'cde'
+    >>> q.enqueue(struct.pack("<hh", 5, -1))        # a record with two shorts
+    >>> struct.unpack("<hh", q.front())             # read it without copying
+    (5, -1)
+    >>> q.discard()                                 # remove it without copying
+    >>> q.size(), q.capacity(), q.record_size()
+    (0, 3, 8)
+    >>> q.close()
+    >>> q.unlink()
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_bytes",
+        "_capacity",
+        "_memory",
+        "_record_size",
+        "_slot_size",
+        "_words",
+    )
+
+    def __init__(
+        self, capacity: int, record_size: int, sequence: Sequence[bytes] = []
+    ) -> None:
+        """Initialize the queue with new shared memory and the members of `sequence`.
+
+        The queue can have up to `capacity` members, of up to `record_size` bytes.
+        The members are added to the queue in the order they are in `sequence`.
+        To create an empty queue, call `SharedMemoryQueue(capacity, record_size)`.
+        Raise `ValueError` if `capacity` or `record_size` isn't positive,
+        or if `sequence` has more than `capacity` members.
+
+        Complexity: O(n + c), with n = `len(sequence)` and c = `capacity`
+        """
+        if capacity < 1:
+            msg = f"can't create a shared memory queue with capacity {capacity}"
+            raise ValueError(msg)
+        if record_size < 1:
+            msg = f"can't create a shared memory queue with record size {record_size}"
+            raise ValueError(msg)
+        # Each slot takes whole words, so that the lengths are aligned.
+        slot_size = WORD + (record_size + WORD - 1) // WORD * WORD
+        memory = shared_memory.SharedMemory(
+            create=True, size=HEADER + capacity * slot_size
+        )
+        # New shared memory is filled with zeros, so the head and tail are 0.
+        with _words(memory) as header:
+            header[CAPACITY] = capacity
+            header[RECORD_SIZE] = record_size
+        self._open(memory)
+        for item in sequence:
+            self.enqueue(item, 0)
+
+    def __del__(self) -> None:
+        """Release the views of the shared memory, if the queue wasn't closed.
+
+        Otherwise, the shared memory can't be closed when it's garbage collected.
+        """
+        # There are no views if creating or attaching the queue failed.
+        with contextlib.suppress(AttributeError):
+            self._words.release()
+            self._bytes.release()
+
+    def __str__(self) -> str:
+        """Return a string representation of the queue.
+
+        The string is 'SharedMemoryQueue([front member, ..., back member])'.
+        It shows the members at the time of the call, if the queue is in use.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        head = self._words[HEAD]
+        tail = self._words[TAIL]
+        members = [bytes(self._record(count)) for count in range(head, tail)]
+        return f"SharedMemoryQueue({members})"
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Return an iterator over copies of the members, from front to back.
+
+        The members are copied at the time of the call, if the queue is in use,
+        so the iteration doesn't show later changes.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        head = self._words[HEAD]
+        tail = self._words[TAIL]
+        return iter([bytes(self._record(count)) for count in range(head, tail)])
+
+    def __repr__(self) -> str:
+        """Return a short representation of the queue, for logging and debugging.
+
+        The string is '<SharedMemoryQueue: size n, [front members, ..., back member]>',
+        with at most `REPR_MEMBERS` front members, so that it's short for
+        large queues.
+
+        Complexity: O(1)
+        """
+        head = self._words[HEAD]
+        tail = self._words[TAIL]
+        size = tail - head
+        shown = min(size, REPR_MEMBERS)
+        first = [bytes(self._record(count)) for count in range(head, head + shown)]
+        last = [bytes(self._record(tail - 1))] if size > REPR_MEMBERS else []
+        return short_repr("SharedMemoryQueue", size, first, last)
+
+    def __getstate__(self) -> str:
+        """Return the name of the shared memory, to pickle the queue."""
+        return self._memory.name
+
+    def __setstate__(self, name: str) -> None:
+        """Use the shared memory with the given name, to unpickle the queue.
+
+        Attaching registers the memory with this process's resource tracker,
+        which would unlink it when this process ends, while others still use it.
+        Only the process that created the memory must have it tracked.
+        """
+        memory = shared_memory.SharedMemory(name)
+        _track(memory, tracked=False)
+        self._open(memory)
+
+    def __enter__(self) -> "SharedMemoryQueue":  # noqa: PYI034 (Self needs 3.11)
+        """Return the queue, to use it in a `with` statement."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop using the queue in this process, at the end of a `with` statement."""
+        self.close()
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryQueue":
+        """Return a queue that uses the shared memory with the given `name`.
+
+        This allows a process to use a queue created by an unrelated process.
+        Raise `FileNotFoundError` if there's no shared memory with that name.
+
+        Complexity: O(1)
+        """
+        queue = cls.__new__(cls)
+        queue.__setstate__(name)
+        return queue
+
+    def name(self) -> str:
+        """Return the name of the queue's shared memory.
+
+        Complexity: O(1)
+        """
+        return self._memory.name
+
+    def size(self) -> int:
+        """Return how many members the queue has.
+
+        If the queue is in use, the size may change right after the call.
+
+        Complexity: O(1)
+        """
+        head = self._words[HEAD]
+        # The head may have changed before the tail is read: don't exceed capacity.
+        return min(self._words[TAIL] - head, self._capacity)
+
+    def capacity(self) -> int:
+        """Return how many members the queue can have.
+
+        Complexity: O(1)
+        """
+        return self._capacity
+
+    def record_size(self) -> int:
+        """Return the maximum number of bytes of each member.
+
+        Complexity: O(1)
+        """
+        return self._record_size
+
+    def front(self, timeout: float | None = None) -> memoryview:
+        """Return a read-only view of the member at the front of the queue.
+
+        The member isn't copied. The view must not be used after the member
+        is removed, as its memory is then reused for new members.
+        If the queue is empty, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for the producer to enqueue a member.
+        Raise `ValueError` if the queue is still empty after the timeout.
+
+        Complexity: O(1), besides the time waiting
+        """
+        if not _poll(self._has_member, timeout):
+            msg = "can't access the front of an empty queue"
+            raise ValueError(msg)
+        return self._record(self._words[HEAD]).toreadonly()
+
+    def enqueue(
+        self, item: bytes | bytearray | memoryview, timeout: float | None = None
+    ) -> None:
+        """Copy `item` to the back of the queue.
+
+        If the queue is full, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for the consumer to dequeue a member.
+        Raise `ValueError` if `item` has more than `self.record_size()` bytes,
+        or if the queue is still full after the timeout.
+
+        Complexity: O(r), with r = `self.record_size()`, besides the time waiting
+        """
+        data = memoryview(item).cast("B")
+        if data.nbytes > self._record_size:
+            msg = (
+                f"can't enqueue {data.nbytes} bytes into records of {self._record_size}"
+            )
+            raise ValueError(msg)
+        if not _poll(self._has_space, timeout):
+            msg = "can't enqueue onto a full queue"
+            raise ValueError(msg)
+        tail = self._words[TAIL]
+        start = HEADER + tail % self._capacity * self._slot_size
+        self._words[start // WORD] = data.nbytes
+        self._bytes[start + WORD : start + WORD + data.nbytes] = data
+        # Only now may the consumer read the new member.
+        self._words[TAIL] = tail + 1
+
+    def dequeue(self, timeout: float | None = None) -> bytes:
+        """Remove and return a copy of the member at the front of the queue.
+
+        If the queue is empty, wait at most `timeout` seconds, or indefinitely
+        if `timeout` is `None`, for the producer to enqueue a member.
+        Raise `ValueError` if the queue is still empty after the timeout.
+
+        Complexity: O(r), with r = `self.record_size()`, besides the time waiting
+        """
+        if not _poll(self._has_member, timeout):
+            msg = "can't dequeue from an empty queue"
+            raise ValueError(msg)
+        head = self._words[HEAD]
+        item = bytes(self._record(head))
+        # Only now may the producer reuse the member's slot.
+        self._words[HEAD] = head + 1
+        return item
+
+    def discard(self) -> None:
+        """Remove the member at the front of the queue, without copying it.
+
+        Raise `ValueError` if the queue is empty. This method doesn't wait.
+
+        Complexity: O(1)
+        """
+        if not self._has_member():
+            msg = "can't discard the front of an empty queue"
+            raise ValueError(msg)
+        self._words[HEAD] += 1
+
+    def close(self) -> None:
+        """Stop using the queue in this process.
+
+        The views returned by `front` must no longer be in use.
+        The queue's shared memory remains available to other processes.
+
+        Complexity: O(1)
+        """
+        self._words.release()
+        self._bytes.release()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Free the queue's shared memory, once no process needs it.
+
+        Processes that use the queue can continue, until they call `close`,
+        but no other process can attach to it.
+
+        Complexity: O(1)
+        """
+        # A child process shares its parent's resource tracker, so attaching
+        # in the child also unregistered the memory for the parent. Register it
+        # again, so that the tracker doesn't fail to unregister it when unlinking.
+        _track(self._memory, tracked=True)
+        self._memory.unlink()
+
+    # Helper methods
+
+    def _open(self, memory: shared_memory.SharedMemory) -> None:
+        """Use the given shared memory, which has the layout of a queue."""
+        machine = platform.machine()
+        if machine not in X86_MACHINES:
+            msg = f"records may be read before they're written on {machine} machines"
+            warnings.warn(msg, RuntimeWarning, stacklevel=3)
+        self._memory = memory
+        self._words = _words(memory)
+        self._bytes = self._words.cast("B")
+        self._capacity = self._words[CAPACITY]
+        self._record_size = self._words[RECORD_SIZE]
+        self._slot_size = WORD + (self._record_size + WORD - 1) // WORD * WORD
+
+    def _record(self, count: int) -> memoryview:
+        """Return a view of the member that was enqueued after `count` others."""
+        start = HEADER + count % self._capacity * self._slot_size
+        length = self._words[start // WORD]
+        return self._bytes[start + WORD : start + WORD + length]
+
+    def _has_member(self) -> bool:
+        """Check if the queue isn't empty."""
+        return self._words[HEAD] != self._words[TAIL]
+
+    def _has_space(self) -> bool:
+        """Check if the queue has fewer members than its capacity."""
+        return self._words[TAIL] - self._words[HEAD] < self._capacity
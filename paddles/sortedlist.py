@@ -0,0 +1,331 @@
+"""This module implements the Sorted List ADT.
+
+## Intuition
+
+The Sorted List ADT models a collection that is kept in order,
+e.g. a phone book where each new entry is written in its alphabetical place.
+
+## Definition
+
+A **sorted list** is a sequence of members in non-decreasing order.
+The members must be comparable with each other and there may be duplicates.
+Members aren't added at a given position: their position is determined by their value.
+
+## Operations
+
+The Sorted List ADT provides operations to:
+- create a new empty sorted list
+- add a new member, at its position in the order
+- remove one copy of an existing member
+- check whether an item is in the list
+- count how many copies of a given item are in the list (0 if it isn't)
+- compute the index (position) of the first copy of a member
+- iterate over the members that are within a range of values
+- add several items at once
+- compute the size of the list (number of members).
+
+## Applications
+
+As explained in [the sorting module](sorting.html), you should consider sorting
+a collection when you repeatedly need to search it.
+If members are added and removed in between searches, consider using a sorted list:
+it's kept in order, so that it doesn't have to be sorted again before each search.
+
+## Implementations
+
+A sorted list can be stored in a dynamic array, where binary search finds
+the position of an item in logarithmic time. However, adding or removing a member
+takes linear time, as all members after it must be shifted.
+
+A sorted list can also be stored in a balanced binary search tree,
+where all operations take logarithmic time, but each member needs its own node.
+
+`ChunkedSortedList` takes a middle road: the members are stored in
+a list of sorted chunks (dynamic arrays) of limited size.
+Only the members of one chunk must be shifted when adding or removing a member.
+"""
+
+import bisect
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .sorting import merge, merge_sorted
+
+__all__ = ["ChunkedSortedList"]
+
+# A chunk with more than twice this number of members is split in two,
+# and a chunk with less than half this number is joined with the next one.
+LOAD = 1000
+
+
+class ChunkedSortedList:
+    """An implementation of the Sorted List ADT, with a list of sorted chunks.
+
+    Besides the ADT's operations, this class provides two convenience operations:
+    - create a non-empty sorted list from an iterable collection of items
+    - convert a sorted list to a string, to see its members in order.
+
+    >>> from paddles import ChunkedSortedList
+    >>> scores = ChunkedSortedList([7, 3, 9, 3])    # create a non-empty sorted list
+    >>> scores.size()                               # number of members
+    4
+    >>> scores.add(5)                               # add a member
+    >>> scores.remove(9)                            # remove one copy of a member
+    >>> print(scores)                               # str(scores) also possible
+    ChunkedSortedList([3, 3, 5, 7])
+    >>> scores.has(9)
+    False
+    >>> scores.frequency(3)
+    2
+    >>> scores.index(5)                             # position of the first copy
+    2
+    >>> list(scores.between(3, 7))                  # members from 3 up to 7
+    [3, 3, 5]
+    >>> scores.update([8, 1, 5])                    # add several items at once
+    >>> print(scores)
+    ChunkedSortedList([1, 3, 3, 5, 5, 7, 8])
+    """
+
+    __slots__ = ("__weakref__", "_chunks", "_index", "_length", "_maxes")
+
+    def __init__(self, items: Iterable[Any] = []) -> None:
+        """Initialize the sorted list with the `items`.
+
+        To create an empty sorted list, call `ChunkedSortedList()`.
+
+        Complexity: O(n log n), with n = `len(items)`
+        """
+        self._chunks = []  # the non-empty sorted chunks
+        self._maxes = []  # the last (largest) member of each chunk
+        self._length = 0
+        self._index = [0]  # see method _rebuild_index
+        self.update(items)
+
+    def __str__(self) -> str:
+        """Return a string representation of the sorted list.
+
+        The string is 'ChunkedSortedList([smallest member, ..., largest member])'.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return f"ChunkedSortedList({self._members()})"
+
+    def __getstate__(self) -> tuple[list[Any]]:
+        """Return a 1-tuple with a new list of the members in order, for pickling.
+
+        The list is in a tuple because pickle protocols 0 and 1
+        don't call `__setstate__` if the state is empty.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return (self._members(),)
+
+    def __setstate__(self, state: tuple[list[Any]]) -> None:
+        """Restore the sorted list from the 1-tuple returned by `__getstate__`.
+
+        Complexity: O(n), with n = `len(state[0])`
+        """
+        (members,) = state
+        self._chunks = [
+            members[start : start + LOAD] for start in range(0, len(members), LOAD)
+        ]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._length = len(members)
+        self._rebuild_index()
+
+    def size(self) -> int:
+        """Return how many members the sorted list has.
+
+        Complexity: O(1)
+        """
+        return self._length
+
+    def has(self, item: Any) -> bool:
+        """Check if `item` is in the sorted list.
+
+        Complexity: O(log n), with n = `self.size()`
+        """
+        chunk = bisect.bisect_left(self._maxes, item)
+        if chunk == len(self._chunks):
+            return False
+        members = self._chunks[chunk]
+        return members[bisect.bisect_left(members, item)] == item
+
+    def frequency(self, item: Any) -> int:
+        """Return how many times `item` occurs in the sorted list.
+
+        Complexity: O(log n), with n = `self.size()`
+        """
+        return self._rank(item, bisect.bisect_right) - self._rank(
+            item, bisect.bisect_left
+        )
+
+    def index(self, item: Any) -> int:
+        """Return the position of the first copy of `item` in the sorted list.
+
+        The smallest member is at position 0.
+        Raise `ValueError` if `item` isn't in the sorted list.
+
+        Complexity: O(log n), with n = `self.size()`
+        """
+        if not self.has(item):
+            msg = "can't find the index of a non-member"
+            raise ValueError(msg)
+        return self._rank(item, bisect.bisect_left)
+
+    def between(self, low: Any, high: Any) -> Iterator[Any]:
+        """Return an iterator over the members from `low` up to, but excluding, `high`.
+
+        The members are produced in non-decreasing order.
+        The sorted list must not be modified while iterating over it.
+
+        Complexity: O(log n + k), with n = `self.size()` and
+        k the number of members from `low` to `high`
+        """
+        chunk = bisect.bisect_left(self._maxes, low)
+        if chunk < len(self._chunks):
+            start = bisect.bisect_left(self._chunks[chunk], low)
+            for members in self._chunks[chunk:]:
+                for index in range(start, len(members)):
+                    if not members[index] < high:
+                        return
+                    yield members[index]
+                start = 0
+
+    def add(self, item: Any) -> None:
+        """Add `item` to the sorted list, after any copies of it.
+
+        Complexity: O(log n + L) amortised, with n = `self.size()` and
+        L the maximum size of a chunk
+        """
+        self._length += 1
+        if not self._chunks:
+            self._chunks.append([item])
+            self._maxes.append(item)
+            self._rebuild_index()
+            return
+        chunk = bisect.bisect_right(self._maxes, item)
+        if chunk == len(self._chunks):
+            # The item is the new largest member: append it to the last chunk.
+            chunk = chunk - 1
+            self._chunks[chunk].append(item)
+            self._maxes[chunk] = item
+        else:
+            bisect.insort_right(self._chunks[chunk], item)
+        if len(self._chunks[chunk]) > 2 * LOAD:
+            self._split(chunk)
+        else:
+            self._add_to_index(chunk, 1)
+
+    def remove(self, item: Any) -> None:
+        """Remove one copy of `item` from the sorted list.
+
+        Raise `ValueError` if `item` isn't in the sorted list.
+
+        Complexity: O(log n + L) amortised, with n = `self.size()` and
+        L the maximum size of a chunk
+        """
+        if not self.has(item):
+            msg = "can't remove a non-member"
+            raise ValueError(msg)
+        self._length -= 1
+        chunk = bisect.bisect_left(self._maxes, item)
+        members = self._chunks[chunk]
+        del members[bisect.bisect_left(members, item)]
+        if not members:
+            del self._chunks[chunk]
+            del self._maxes[chunk]
+            self._rebuild_index()
+        elif len(members) < LOAD // 2 and chunk + 1 < len(self._chunks):
+            self._join(chunk)
+        else:
+            self._maxes[chunk] = members[-1]
+            self._add_to_index(chunk, -1)
+
+    def update(self, items: Iterable[Any]) -> None:
+        """Add all `items` to the sorted list.
+
+        The items are sorted and then merged with the members, in a single pass,
+        instead of being added one by one.
+
+        Complexity: O(n + k log k), with n = `self.size()` and k = `len(items)`
+        """
+        new_members = merge_sorted(list(items))
+        if new_members:
+            members = merge(self._members(), new_members)
+            self._length = len(members)
+            self._chunks = [
+                members[start : start + LOAD] for start in range(0, len(members), LOAD)
+            ]
+            self._maxes = [members[-1] for members in self._chunks]
+            self._rebuild_index()
+
+    # Helper methods
+
+    def _members(self) -> list:
+        """Return a new list with all members in order."""
+        members = []
+        for chunk in self._chunks:
+            members.extend(chunk)
+        return members
+
+    def _split(self, chunk: int) -> None:
+        """Split the chunk at the given position in two."""
+        members = self._chunks[chunk]
+        self._chunks.insert(chunk + 1, members[LOAD:])
+        del members[LOAD:]
+        self._maxes.insert(chunk + 1, self._maxes[chunk])
+        self._maxes[chunk] = members[-1]
+        self._rebuild_index()
+
+    def _join(self, chunk: int) -> None:
+        """Join the chunk at the given position with the next one."""
+        self._chunks[chunk].extend(self._chunks[chunk + 1])
+        del self._chunks[chunk + 1]
+        del self._maxes[chunk]
+        if len(self._chunks[chunk]) > 2 * LOAD:
+            self._split(chunk)
+        else:
+            self._rebuild_index()
+
+    def _rank(self, item: Any, bisect_function: Any) -> int:
+        """Return the position where `item` would be inserted.
+
+        With `bisect.bisect_left`, the position is before all copies of `item`;
+        with `bisect.bisect_right`, it's after all copies.
+        """
+        chunk = bisect_function(self._maxes, item)
+        if chunk == len(self._chunks):
+            return self._length
+        return self._members_before(chunk) + bisect_function(self._chunks[chunk], item)
+
+    # The chunk sizes are kept in a Fenwick tree, stored in a list.
+    # It computes how many members come before a chunk in O(log m) time,
+    # with m the number of chunks, and is updated in O(log m) time
+    # if a chunk gains or loses a member. It's rebuilt in O(m) time
+    # if a chunk is created or removed, which only happens every L changes.
+
+    def _rebuild_index(self) -> None:
+        """Build the tree of chunk sizes from scratch."""
+        tree = [0] + [len(members) for members in self._chunks]
+        for position in range(1, len(tree)):
+            parent = position + (position & -position)
+            if parent < len(tree):
+                tree[parent] += tree[position]
+        self._index = tree
+
+    def _add_to_index(self, chunk: int, change: int) -> None:
+        """Add `change` to the size of the chunk at the given position."""
+        position = chunk + 1
+        while position < len(self._index):
+            self._index[position] += change
+            position += position & -position
+
+    def _members_before(self, chunk: int) -> int:
+        """Return how many members are in the chunks before the given one."""
+        total = 0
+        position = chunk
+        while position > 0:
+            total += self._index[position]
+            position -= position & -position
+        return total
@@ -30,6 +30,11 @@ The aim is to convey the algorithms as clearly as possible, keeping the code sim
 Therefore, all functions only sort in **non-descending order**,
 with Python's `<=` operator.
 
+To sort items by a **key**, e.g. records by one of their fields,
+use `keyed_sort` or `keyed_sorted` with any of the sorting algorithms.
+They compute the key of each item once and sort pairs of keys and indices,
+which is faster than comparing items with a custom method that computes their keys.
+
 ## Applications
 
 Sorting is a fundamental computational operation, as it makes items easier to look up,
@@ -43,14 +48,35 @@ Function | In-place | Stable | Adaptive | Worst Time Complexity
 `bogo_sort` | ✔️ | | | O(∞)
 `bogo_sorted` | | | | O(n·n!)
 `bubble_sort` | ✔️ | ✔️ | ✔️ | O(n²)
+`heap_sort` | ✔️ | | | O(n log n)
 `insertion_sort` | ✔️ | ✔️ | ✔️ | O(n²)
 `merge_sorted` | | ✔️ | | O(n log n)
 `quick_sorted` | | ✔️ | | O(n²)
 `quick_sorted_3way` | | ✔️ | | O(n²)
 `selection_sort` | ✔️ | | | O(n²)
+`shell_sort` | ✔️ | | ✔️ | O(n²)
 
 Other functions:
 - `quick_select`: find the k-th smallest item with a variant of `quick_sorted`
+- `smallest`: return the k smallest items of any iterable, in order, using a heap
+- `partial_sort`: put the k smallest items of a list in order at its start
+- `lazy_quick_sorted`: generate the items in order, sorting only as much as needed
+- `argsort`: return the indices of the items in the order that sorts them
+- `keyed_sort` and `keyed_sorted`: sort items by a key, with any sorting algorithm
+- `auto_sort` and `auto_sorted`: sort with the algorithm chosen by `choose_algorithm`
+- `auto_sorted_with_algorithm`: like `auto_sorted`, but also return the algorithm
+- `count_operations`: count the comparisons, moves and recursive calls of a function
+
+If [NumPy](https://numpy.org) is installed, then `merge_sorted`, `quick_sorted`,
+`quick_sorted_3way` and `quick_select` have a **vectorized** backend for
+NumPy arrays and `array.array`s of numbers. Instead of comparing one pair of items
+at a time, the backend merges and partitions whole arrays with NumPy operations,
+processing all runs or partitions of the same size or recursion depth at once.
+The input is only converted to a Python list at the end, as the result.
+The algorithms are the same, so the results are equal to those for lists.
+Arrays with NaNs, and arrays that NumPy would have to convert to floats
+to merge them, are processed like lists, to get the same results.
+NumPy is optional: without it, all functions process arrays like any other sequence.
 
 ## Practice
 
@@ -62,30 +88,147 @@ the algorithmic techniques and ADTs related to each problem.
 """
 
 __all__ = [
+    "argsort",
+    "auto_sort",
+    "auto_sorted",
+    "auto_sorted_with_algorithm",
     "bogo_sort",
     "bogo_sorted",
     "bubble_sort",
+    "choose_algorithm",
+    "count_operations",
+    "heap_sort",
     "insertion_sort",
+    "keyed_sort",
+    "keyed_sorted",
+    "lazy_quick_sorted",
     "merge_sorted",
+    "partial_sort",
     "quick_select",
     "quick_sorted",
     "quick_sorted_3way",
     "selection_sort",
+    "shell_sort",
+    "smallest",
 ]
 
+import array
 import itertools
+import logging
 import random
-from collections.abc import Sequence
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from types import FunctionType
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np: Any = None
+
+# The `array.array` type codes for integers and floating-point numbers.
+NUMERIC_TYPECODES = "bBhHiIlLqQfd"
+
+# `auto_sort` and `auto_sorted` log which algorithm they chose, for diagnostics.
+logger = logging.getLogger(__name__)
 
 
 def is_non_decreasing(items: Sequence) -> bool:
     """Check if `items[0] <= items[1] <= ... <= items[-1]`."""
+    numbers = _numeric_array(items)
+    if numbers is not None:
+        return not bool(np.any(numbers[:-1] > numbers[1:]))
     for index in range(len(items) - 1):
         if items[index] > items[index + 1]:
             return False
     return True
 
 
+def argsort(
+    items: Sequence, key: Callable | None = None, algorithm: Callable | None = None
+) -> list[int]:
+    """Return the indices of `items` in the order that sorts them by `key`.
+
+    If `key` is omitted, the items are sorted by their own value.
+    Otherwise, `key` is called once for each item. Instead of the items,
+    the pairs `(key(items[index]), index)` are sorted with the given `algorithm`,
+    which can be any `..._sort` or `..._sorted` function of this module.
+    The default is `merge_sorted`.
+
+    As pairs with equal keys are ordered by index, the result is stable,
+    even if the algorithm isn't.
+
+    >>> from paddles.sorting import argsort, heap_sort
+    >>> argsort(["bb", "c", "aaa", "d"], key=len, algorithm=heap_sort)
+    [1, 3, 0, 2]
+
+    Complexity: O(n) calls of `key` plus the complexity of `algorithm`,
+    with n = `len(items)`
+    """
+    if key is None:
+        pairs = [(items[index], index) for index in range(len(items))]
+    else:
+        pairs = [(key(items[index]), index) for index in range(len(items))]
+    if algorithm is None:
+        algorithm = merge_sorted
+    sorted_pairs = algorithm(pairs)
+    if sorted_pairs is None:  # the algorithm sorted the pairs in-place
+        sorted_pairs = pairs
+    return [index for (_, index) in sorted_pairs]
+
+
+def auto_sort(items: list) -> None:
+    """Put `items` in non-descending order, in-place, using the best algorithm.
+
+    The algorithm is chosen by `choose_algorithm`. If it returns a new list,
+    the items are replaced by the sorted ones.
+    The choice is logged at debug level, with the `paddles.sorting` logger.
+
+    Complexity: O(n²), with n = `len(items)`, as the chosen algorithm may be quadratic
+    """
+    algorithm = choose_algorithm(items)
+    logger.debug("auto_sort chose %s for %d items", algorithm.__name__, len(items))
+    sorted_items = algorithm(items)
+    if sorted_items is not None:
+        items[:] = sorted_items
+
+
+def auto_sorted(items: Sequence) -> list:
+    """Return a new list with `items` in non-decreasing order, using the best algorithm.
+
+    The algorithm is chosen by `choose_algorithm`. If it sorts in-place,
+    it's applied to a copy of the items.
+    The choice is logged at debug level, with the `paddles.sorting` logger,
+    and returned by `auto_sorted_with_algorithm`.
+
+    Complexity: O(n²), with n = `len(items)`, as the chosen algorithm may be quadratic
+    """
+    return auto_sorted_with_algorithm(items)[0]
+
+
+def auto_sorted_with_algorithm(items: Sequence) -> tuple[list, FunctionType]:
+    """Return a new list with `items` in non-decreasing order and the algorithm used.
+
+    This is like `auto_sorted`, but also returns the function chosen by
+    `choose_algorithm`, e.g. to check or record the choice, which may vary
+    for the same input, as it's based on a random sample.
+
+    >>> from paddles.sorting import auto_sorted_with_algorithm
+    >>> result, algorithm = auto_sorted_with_algorithm([3, 1, 2])
+    >>> result, algorithm.__name__
+    ([1, 2, 3], 'insertion_sort')
+
+    Complexity: O(n²), with n = `len(items)`, as the chosen algorithm may be quadratic
+    """
+    algorithm = choose_algorithm(items)
+    logger.debug("auto_sorted chose %s for %d items", algorithm.__name__, len(items))
+    if algorithm.__name__.endswith("_sort"):
+        sorted_items = list(items)
+        algorithm(sorted_items)
+        return sorted_items, algorithm
+    return algorithm(items), algorithm
+
+
 def bogo_sort(items: list) -> None:
     """Put `items` in non-descending order, in-place, using Bogo Sort.
 
@@ -134,6 +277,63 @@ def bubble_sort(items: list) -> None:
             return
 
 
+# Parameters for `choose_algorithm`.
+SHORT = 16  # the maximum length of a sequence considered short
+SAMPLE = 64  # how many items are sampled
+DUPLICATES = 0.5  # the ratio of duplicates from which there are many
+
+
+def choose_algorithm(items: Sequence) -> FunctionType:
+    """Return the function of this module that is expected to sort `items` fastest.
+
+    The choice is based on the length and order of `items` and a random sample:
+    - `insertion_sort` for short sequences and non-decreasing sequences,
+      because Insertion Sort is then fast: it does O(n + i) steps, with i
+      the number of **inversions** (pairs of items that are out of order)
+    - `merge_sorted` for NumPy arrays and arrays of numbers,
+      because it uses the vectorized backend
+    - `quick_sorted_3way` for sequences with many duplicates, estimated by
+      sorting the sample, because equal items are then put in place in one go
+    - `merge_sorted` otherwise, because it has the best worst-case complexity.
+
+    Long sequences that are only nearly sorted don't get `insertion_sort`:
+    a few items far from their place can make many inversions, which
+    neither a sample of pairs nor a count of adjacent items out of order
+    can reliably rule out, and Insertion Sort is then quadratic.
+    The sample is random, so the choice may vary for the same input.
+
+    Complexity: O(n), with n = `len(items)`
+    """
+    length = len(items)
+    if length <= SHORT:
+        return insertion_sort
+    if _numeric_array(items) is not None:
+        return merge_sorted
+    if is_non_decreasing(items):
+        return insertion_sort
+    sample = merge_sorted([random.choice(items) for _ in range(SAMPLE)])  # noqa: S311
+    duplicates = 0
+    for index in range(1, SAMPLE):
+        if sample[index - 1] == sample[index]:
+            duplicates = duplicates + 1
+    if duplicates / (SAMPLE - 1) >= DUPLICATES:
+        return quick_sorted_3way
+    return merge_sorted
+
+
+def heap_sort(items: list) -> None:
+    """Put `items` in non-descending order, in-place, using Heap Sort.
+
+    [Heap Sort](https://en.wikipedia.org/wiki/Heapsort) rearranges the items
+    into a max-heap and then repeatedly swaps the largest unsorted item,
+    at the top of the heap, with the last unsorted item.
+
+    Complexity: O(n log n), with n = `len(items)`
+    """
+    _heapify(items, len(items))
+    _sort_heap(items, len(items))
+
+
 def insertion_sort(items: list) -> None:
     """Put `items` in non-descending order, in-place, using Insertion Sort.
 
@@ -151,8 +351,90 @@ def insertion_sort(items: list) -> None:
         items[index] = to_sort
 
 
+def keyed_sort(items: list, key: Callable, algorithm: Callable | None = None) -> None:
+    """Put `items` in non-decreasing order of `key`, in-place, using `algorithm`.
+
+    The items are rearranged in the order given by `argsort`.
+
+    Complexity: the same as for `argsort(items, key, algorithm)`
+    """
+    items[:] = keyed_sorted(items, key, algorithm)
+
+
+def keyed_sorted(
+    items: Sequence, key: Callable, algorithm: Callable | None = None
+) -> list:
+    """Return a new list with `items` in non-decreasing order of `key`.
+
+    The order is computed with `argsort`, using the given `algorithm`.
+
+    >>> from paddles.sorting import keyed_sorted
+    >>> keyed_sorted(["bb", "c", "aaa", "d"], key=len)
+    ['c', 'd', 'bb', 'aaa']
+
+    Complexity: the same as for `argsort(items, key, algorithm)`
+    """
+    return [items[index] for index in argsort(items, key, algorithm)]
+
+
+def lazy_quick_sorted(items: Iterable) -> Iterator:
+    """Generate `items` in non-decreasing order, using incremental 3-way Quick Sort.
+
+    [Incremental Quick Sort](https://en.wikipedia.org/wiki/Partial_sorting)
+    only partitions the group of unsorted items that contains the next smallest item.
+    The groups with larger items are kept unsorted until they're needed,
+    so that stopping the iteration early avoids the work of a full sort.
+
+    >>> from paddles.sorting import lazy_quick_sorted
+    >>> sorted_items = lazy_quick_sorted([5, 3, 8, 1, 9, 2])
+    >>> next(sorted_items), next(sorted_items)      # only the 2 smallest are sorted
+    (1, 2)
+
+    Complexity: O(n²), with n the number of items.
+    The expected complexity to generate the first k items is O(n + k log k).
+    """
+    # A stack of the groups of unsorted items, with the smallest items on top.
+    # Each group has only items that are smaller than those of the groups below.
+    groups = []
+    group = list(items)
+    if group:
+        groups.append(group)
+    while groups:
+        group = groups.pop()
+        pivot = random.choice(group)  # noqa: S311
+        smaller = []
+        equal = []
+        larger = []
+        for item in group:
+            if item < pivot:
+                smaller.append(item)
+            elif item == pivot:
+                equal.append(item)
+            else:
+                larger.append(item)
+        if larger:
+            groups.append(larger)
+        if smaller:
+            # Partition the smaller items first; the equal ones are after them.
+            groups.append(equal)
+            groups.append(smaller)
+        else:
+            # The equal items are the smallest ones left.
+            yield from equal
+
+
 def merge(left: Sequence, right: Sequence) -> list:
     """Return a new non-decreasing list by merging two non-decreasing sequences."""
+    left_numbers = _numeric_array(left)
+    right_numbers = _numeric_array(right)
+    if left_numbers is not None and right_numbers is not None:
+        # Merging integers with floats, or signed with unsigned 64-bit integers,
+        # converts them to floats, which may round them: merge Python numbers.
+        kinds = {left_numbers.dtype.kind, right_numbers.dtype.kind}
+        if kinds == {"f"} or np.result_type(left_numbers, right_numbers).kind in "iu":
+            return _merge_arrays(left_numbers, right_numbers).tolist()
+        left = left_numbers.tolist()
+        right = right_numbers.tolist()
     left_index = 0
     right_index = 0
     merged = []
@@ -180,6 +462,9 @@ def merge_sorted(items: Sequence) -> list:
 
     Complexity: O(n log n) with n = `len(items)`
     """
+    numbers = _numeric_array(items)
+    if numbers is not None:
+        return _merge_sorted_array(numbers).tolist()
     if len(items) < 2:  # noqa: PLR2004
         return list(items)
     middle = len(items) // 2
@@ -188,6 +473,70 @@ def merge_sorted(items: Sequence) -> list:
     return merge(left_sorted, right_sorted)
 
 
+# A max-heap is a list where each item is at least as large as its children,
+# i.e. `heap[i] >= heap[2*i + 1]` and `heap[i] >= heap[2*i + 2]` for every `i`.
+# Therefore, the largest item is at the top of the heap, i.e. `heap[0]`.
+# The following functions handle a max-heap in the first `end` items of a list.
+
+
+def _sift_down(items: list, index: int, end: int) -> None:
+    """Move `items[index]` down the max-heap `items[:end]` to its right position."""
+    item = items[index]
+    child = 2 * index + 1
+    while child < end:
+        # Pick the larger child.
+        if child + 1 < end and items[child] < items[child + 1]:
+            child = child + 1
+        if not item < items[child]:
+            break
+        items[index] = items[child]
+        index = child
+        child = 2 * index + 1
+    items[index] = item
+
+
+def _heapify(items: list, end: int) -> None:
+    """Rearrange `items[:end]` into a max-heap, in O(end) time."""
+    for index in range(end // 2 - 1, -1, -1):
+        _sift_down(items, index, end)
+
+
+def _sort_heap(items: list, end: int) -> None:
+    """Put the max-heap `items[:end]` in non-decreasing order, in O(end log end)."""
+    for last in range(end - 1, 0, -1):
+        # Swap the largest item with the last one and restore the smaller heap.
+        largest = items[0]
+        items[0] = items[last]
+        items[last] = largest
+        _sift_down(items, 0, last)
+
+
+def partial_sort(items: list, k: int) -> None:
+    """Put the `k` smallest `items` in non-decreasing order at the start of `items`.
+
+    The other items are put after them, in no particular order.
+    The `k` smallest items are kept in a max-heap at the start of the list.
+    Each further item that is smaller than the largest one in the heap replaces it.
+    Finally, the heap is sorted.
+
+    Raise `ValueError` if `k` isn't a value from 0 to `len(items)`.
+
+    Complexity: O(n log k), with n = `len(items)`
+    """
+    if not (0 <= k <= len(items)):
+        msg = f"Cannot sort {k} smallest items of {len(items)} items"
+        raise ValueError(msg)
+    _heapify(items, k)
+    if k > 0:
+        for index in range(k, len(items)):
+            if items[index] < items[0]:
+                largest = items[0]
+                items[0] = items[index]
+                items[index] = largest
+                _sift_down(items, 0, k)
+    _sort_heap(items, k)
+
+
 def quick_sorted(items: Sequence) -> list:
     """Return a new list with `items` in non-decreasing order, using Quick Sort.
 
@@ -196,6 +545,9 @@ def quick_sorted(items: Sequence) -> list:
 
     Complexity: O(n²), with n = `len(items)`
     """
+    numbers = _numeric_array(items)
+    if numbers is not None:
+        return _quick_sorted_segments(numbers, three_way=False).tolist()
     # base case: sequences with 0 or 1 items are sorted
     if len(items) < 2:  # noqa: PLR2004
         return list(items)
@@ -222,6 +574,9 @@ def quick_sorted_3way(items: Sequence) -> list:
 
     Complexity: O(n²), with n = `len(items)`
     """
+    numbers = _numeric_array(items)
+    if numbers is not None:
+        return _quick_sorted_segments(numbers, three_way=True).tolist()
     if len(items) < 2:  # noqa: PLR2004
         return list(items)
     # reduce: partition the items into three groups according to a random pivot
@@ -254,6 +609,9 @@ def quick_select(items: Sequence, k: int) -> object:
     if not (0 < k <= len(items)):
         msg = f"Cannot select {k}th smallest item from {len(items)} items"  # noqa: S608
         raise ValueError(msg)
+    numbers = _numeric_array(items)
+    if numbers is not None:
+        return _quick_select_array(numbers, k).item()
     # reduce: select the pivot and create two partitions
     smaller = []
     larger = []
@@ -290,3 +648,418 @@ def selection_sort(items: list) -> None:
         unsorted_item = items[first_unsorted]
         items[first_unsorted] = items[smallest]
         items[smallest] = unsorted_item
+
+
+# Each function returns the gaps less than `length`, in descending order.
+
+
+def _ciura_gaps(length: int) -> list[int]:
+    """Return Ciura's gaps, extended by multiplying the last one by 2.25."""
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] < length:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in reversed(gaps) if gap < length]
+
+
+def _tokuda_gaps(length: int) -> list[int]:
+    """Return Tokuda's gaps, i.e. the ceiling of (9^k - 4^k) / (5·4^(k-1))."""
+    gaps = []
+    k = 1
+    gap = 1
+    while gap < length:
+        gaps.append(gap)
+        k = k + 1
+        gap = -(-(9**k - 4**k) // (5 * 4 ** (k - 1)))  # ceiling division
+    return list(reversed(gaps))
+
+
+def _sedgewick_gaps(length: int) -> list[int]:
+    """Return Sedgewick's gaps, i.e. 1 and 4^k + 3·2^(k-1) + 1."""
+    gaps = []
+    k = 0
+    gap = 1
+    while gap < length:
+        gaps.append(gap)
+        k = k + 1
+        gap = 4**k + 3 * 2 ** (k - 1) + 1
+    return list(reversed(gaps))
+
+
+GAP_SEQUENCES = {
+    "ciura": _ciura_gaps,
+    "tokuda": _tokuda_gaps,
+    "sedgewick": _sedgewick_gaps,
+}
+
+
+def shell_sort(items: list, gaps: str = "ciura") -> None:
+    """Put `items` in non-descending order, in-place, using Shell Sort.
+
+    [Shell Sort](https://en.wikipedia.org/wiki/Shellsort) does an Insertion Sort
+    of the items that are a gap apart, for a decreasing sequence of gaps.
+    Large gaps move items far in few steps; the last gap is 1, which sorts the list.
+
+    `gaps` is the name of the gap sequence: `"ciura"` (the default),
+    `"tokuda"` or `"sedgewick"`. Raise `ValueError` for any other name.
+
+    Complexity: O(n²), with n = `len(items)`. With Sedgewick's gaps, it's O(n^(4/3)).
+    The complexity with Ciura's and Tokuda's gaps is unknown,
+    but in practice they lead to fewer comparisons than Sedgewick's.
+    """
+    if gaps not in GAP_SEQUENCES:
+        msg = f"Cannot use unknown gap sequence {gaps!r}"
+        raise ValueError(msg)
+    for gap in GAP_SEQUENCES[gaps](len(items)):
+        for first_unsorted in range(gap, len(items)):
+            to_sort = items[first_unsorted]
+            index = first_unsorted
+            while index >= gap and items[index - gap] > to_sort:
+                items[index] = items[index - gap]
+                index = index - gap
+            items[index] = to_sort
+
+
+def smallest(items: Iterable, k: int) -> list:
+    """Return a new list with the `k` smallest `items` in non-decreasing order.
+
+    This works like `partial_sort`, but `items` can be any iterable, e.g. a generator.
+    Only the `k` smallest items so far are kept in memory, in a max-heap.
+    If there are fewer than `k` items, return all of them in non-decreasing order.
+
+    Raise `ValueError` if `k` is negative.
+
+    Complexity: O(n log k), with n the number of items
+    """
+    if k < 0:
+        msg = f"Cannot select {k} smallest items"
+        raise ValueError(msg)
+    remaining = iter(items)
+    heap = list(itertools.islice(remaining, k))
+    _heapify(heap, len(heap))
+    if k > 0:
+        for item in remaining:
+            if item < heap[0]:
+                heap[0] = item
+                _sift_down(heap, 0, k)
+    _sort_heap(heap, len(heap))
+    return heap
+
+
+# Instrumentation: count the operations done by the functions above.
+# The functions themselves aren't changed, so they have no overhead when not counted.
+
+
+class _Counted:
+    """A wrapper for an item that counts how often it's compared."""
+
+    __slots__ = ("counts", "item")
+
+    def __init__(self, item: Any, counts: dict[str, int]) -> None:
+        """Wrap `item`, to add its comparisons to `counts["comparisons"]`."""
+        self.item = item
+        self.counts = counts
+
+    def __lt__(self, other: "_Counted") -> bool:
+        """Count the comparison and check if this item is smaller than `other`."""
+        self.counts["comparisons"] += 1
+        return self.item < other.item
+
+    def __le__(self, other: "_Counted") -> bool:
+        """Count the comparison and check if this item is at most `other`."""
+        self.counts["comparisons"] += 1
+        return self.item <= other.item
+
+    def __gt__(self, other: "_Counted") -> bool:
+        """Count the comparison and check if this item is larger than `other`."""
+        self.counts["comparisons"] += 1
+        return self.item > other.item
+
+    def __ge__(self, other: "_Counted") -> bool:
+        """Count the comparison and check if this item is at least `other`."""
+        self.counts["comparisons"] += 1
+        return self.item >= other.item
+
+    def __eq__(self, other: object) -> bool:
+        """Count the comparison and check if this item is equal to `other`."""
+        self.counts["comparisons"] += 1
+        return isinstance(other, _Counted) and self.item == other.item
+
+    __hash__ = None
+
+
+class _CountingList(list):
+    """A list that counts how often an item is written into it."""
+
+    __slots__ = ("counts",)
+
+    def __setitem__(self, index: Any, item: Any) -> None:
+        """Count the move and put `item` at position `index`."""
+        self.counts["moves"] += 1
+        super().__setitem__(index, item)
+
+
+def _count_keys(args: tuple, counts: dict[str, int]) -> tuple:
+    """Return `args`, with the key function, if it's the first one, wrapped.
+
+    The wrapped key is called with a wrapped item. It calls the key with
+    the item itself and wraps the result, adding its comparisons to `counts`.
+    """
+    if not args or not callable(args[0]):
+        return args
+    key = args[0]
+
+    def counted_key(wrapper: _Counted) -> _Counted:
+        """Return the wrapped key of the wrapped item."""
+        return _Counted(key(wrapper.item), counts)
+
+    return (counted_key, *args[1:])
+
+
+def count_operations(
+    function: Callable, items: Sequence, *args: Any
+) -> tuple[Any, dict[str, int]]:
+    """Call `function(items, *args)` and count the operations it does.
+
+    Return the function's result and a dictionary with the following counts:
+    - `"comparisons"`: how many times two items were compared
+    - `"moves"`: how many times an item was written into `items`
+    - `"calls"`: how many times `function` was called, including recursive calls
+    - `"depth"`: the maximum recursion depth, which is 1 if there was no recursion.
+
+    If `function` returns an iterator, it's exhausted and its items are returned
+    in a list. For a generator function like `lazy_quick_sorted`, each time
+    the generator resumes counts as a call.
+
+    Moves are only counted for the in-place `..._sort` functions:
+    the `..._sorted` functions put the items in new lists, instead of moving them.
+    If `items` is a list and `function` sorts in-place, then `items` is sorted.
+
+    To count comparisons, each item is wrapped in an object that counts
+    how often it's compared. The wrapped items are processed as a list,
+    so the vectorized backend isn't used. If the first of `args` is a function,
+    like the key of `argsort`, `keyed_sort` and `keyed_sorted`, it's called
+    with the unwrapped items and its results are wrapped, to count how often
+    the keys are compared.
+
+    >>> from paddles.sorting import count_operations, merge_sorted
+    >>> count_operations(merge_sorted, [3, 1, 2])
+    ([1, 2, 3], {'comparisons': 3, 'moves': 0, 'calls': 5, 'depth': 3})
+
+    Complexity: O(c), with c the complexity of `function(items, *args)`
+    """
+    counts = {"comparisons": 0, "moves": 0, "calls": 0, "depth": 0}
+    counted = _CountingList(_Counted(item, counts) for item in items)
+    counted.counts = counts
+    args = _count_keys(args, counts)
+    depth = 0
+    # Built-in functions have no code object, so their calls aren't counted.
+    code = getattr(function, "__code__", None)
+
+    # Coverage tools can't trace a profiling function, hence the pragma.
+    def count_calls(frame: Any, event: str, _: Any) -> None:  # pragma: no cover
+        """Count the calls to `function` and track the recursion depth."""
+        nonlocal depth
+        if frame.f_code is code:
+            if event == "call":
+                counts["calls"] += 1
+                depth += 1
+                counts["depth"] = max(counts["depth"], depth)
+            elif event == "return":
+                depth -= 1
+
+    previous_profiler = sys.getprofile()
+    sys.setprofile(count_calls)
+    try:
+        result = function(counted, *args)
+        if isinstance(result, Iterator):
+            result = list(result)
+    finally:
+        sys.setprofile(previous_profiler)
+    # Unwrap the result and the input's items. A list, like the result of
+    # `argsort`, may have other values than the wrapped items.
+    if isinstance(result, _Counted):
+        result = result.item
+    elif isinstance(result, list):
+        result = [
+            member.item if isinstance(member, _Counted) else member for member in result
+        ]
+    elif result is None and isinstance(items, list):
+        items[:] = [wrapper.item for wrapper in counted]
+    return result, counts
+
+
+# Vectorized backend for arrays of numbers, used if NumPy is installed.
+# Each function does the same as the pure Python code of the corresponding
+# public function, but with NumPy operations on whole arrays instead of loops.
+
+
+def _numeric_array(items: Sequence) -> "np.ndarray | None":
+    """Return `items` as a NumPy array, or `None` if it isn't an array of numbers.
+
+    An `array.array` is viewed as a NumPy array, without copying its members.
+    Return `None` if NumPy isn't installed, or if the array has NaNs:
+    NumPy puts them last, but comparisons with NaN are always false,
+    so the pure Python code may put them anywhere.
+    """
+    if np is None:  # pragma: no cover
+        return None
+    if isinstance(items, array.array) and items.typecode in NUMERIC_TYPECODES:
+        numbers = np.frombuffer(items, dtype=items.typecode)
+    elif (
+        isinstance(items, np.ndarray) and items.ndim == 1 and items.dtype.kind in "iuf"
+    ):
+        numbers = items
+    else:
+        return None
+    if numbers.dtype.kind == "f" and np.isnan(numbers).any():
+        return None
+    return numbers
+
+
+def _merge_arrays(left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+    """Return a new non-decreasing array by merging two non-decreasing arrays.
+
+    Like `merge`, an item of `right` goes before the items of `left` equal to it.
+    """
+    merged = np.empty(len(left) + len(right), dtype=np.result_type(left, right))
+    # Each item's position in the merged array is its position in its own array
+    # plus the number of items of the other array that go before it.
+    left_positions = np.arange(len(left)) + np.searchsorted(right, left, "right")
+    right_positions = np.arange(len(right)) + np.searchsorted(left, right, "left")
+    merged[left_positions] = left
+    merged[right_positions] = right
+    return merged
+
+
+def _count_before(
+    runs: "np.ndarray", items: "np.ndarray", *, inclusive: bool
+) -> "np.ndarray":
+    """Count, for each item, how many numbers of the run in the same row go before it.
+
+    `runs` and `items` are 2-D arrays with the same number of rows, and
+    each row of `runs` is non-decreasing. A number goes before an item if
+    it's smaller or, if `inclusive` is true, equal. Like `np.searchsorted`,
+    the counts are found with a binary search, but in all rows at once:
+    each step tries to add the next lower power of two to all counts.
+    """
+    width = runs.shape[1]
+    rows = np.arange(len(runs))[:, np.newaxis]
+    counts = np.zeros(items.shape, dtype=np.intp)
+    step = 1 << (width.bit_length() - 1)  # the largest power of two up to width
+    while step:
+        candidates = np.minimum(counts + step, width)
+        last = runs[rows, candidates - 1]  # the last number that would be counted
+        goes_before = last <= items if inclusive else last < items
+        counts = np.where(goes_before, candidates, counts)
+        step = step // 2
+    return counts
+
+
+def _merge_sorted_array(numbers: "np.ndarray") -> "np.ndarray":
+    """Return a new non-decreasing array of `numbers`, like `merge_sorted`.
+
+    Halving the array recursively would take O(n) small NumPy operations,
+    so the runs are merged bottom-up instead: each pass merges all pairs of
+    adjacent sorted runs of the same width, doubling the width.
+    The pairs of runs are the rows of a 2-D view of the array. Like in
+    `_merge_arrays`, each number's position in its merged row is its position
+    in its run plus how many numbers of the other run go before it.
+    While there are many short runs, those counts are found for all rows
+    at once with `_count_before`. Once there are at most 16 times as many
+    pairs as numbers in a run, each pair is merged with `_merge_arrays`,
+    as `np.searchsorted` is faster than `_count_before` for long runs.
+    A last pair with a shorter run is merged with `_merge_arrays`.
+    This takes O(log n) passes over the whole array.
+    """
+    merged = numbers.copy()
+    length = len(merged)
+    width = 1
+    while width < length:
+        paired = length - length % (2 * width)  # the items in pairs of full runs
+        pairs = merged[:paired].reshape(-1, 2, width)
+        if len(pairs) <= 16 * width:
+            for pair in pairs:
+                pair.reshape(-1)[:] = _merge_arrays(pair[0], pair[1])
+        else:
+            left = pairs[:, 0].copy()
+            right = pairs[:, 1].copy()
+            rows = np.arange(len(pairs))[:, np.newaxis]
+            positions = np.arange(width)
+            # Like `merge`, a number of the right run goes before the numbers
+            # of the left run equal to it.
+            left_positions = positions + _count_before(right, left, inclusive=True)
+            right_positions = positions + _count_before(left, right, inclusive=False)
+            rows_merged = pairs.reshape(-1, 2 * width)
+            rows_merged[rows, left_positions] = left
+            rows_merged[rows, right_positions] = right
+        if length - paired > width:
+            merged[paired:] = _merge_arrays(
+                merged[paired : paired + width], merged[paired + width :]
+            )
+        width = 2 * width
+    return merged
+
+
+def _partition_array(numbers: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """Partition all but the first number into those smaller and not smaller than it.
+
+    The first number is the pivot, as in `quick_select`.
+    """
+    rest = numbers[1:]
+    is_smaller = rest < numbers[0]
+    return rest[is_smaller], rest[~is_smaller]
+
+
+def _quick_sorted_segments(numbers: "np.ndarray", *, three_way: bool) -> "np.ndarray":
+    """Return a new non-decreasing array of `numbers`, using Quick Sort.
+
+    Sorting each partition recursively would take O(n) small NumPy operations,
+    so all partitions at the same recursion depth are processed in one pass.
+    The array is divided in segments, initially one with all numbers.
+    Each pass partitions every segment with at least two numbers around a pivot:
+    its first number, like `quick_sorted`, or a random one if `three_way`
+    is true, like `quick_sorted_3way`. The numbers are put in three groups,
+    keeping their order: smaller than, equal to (only the pivot itself,
+    unless `three_way`) and larger than the pivot (or equal, unless `three_way`).
+    The smaller and larger groups are the segments of the next pass.
+    This takes as many passes as the recursion depth of Quick Sort.
+    """
+    result = numbers.copy()
+    starts = np.zeros(1, dtype=np.intp)
+    lengths = np.array([len(result)], dtype=np.intp)
+    while True:
+        unsorted = lengths > 1
+        starts = starts[unsorted]
+        lengths = lengths[unsorted]
+        if len(starts) == 0:
+            return result
+        # Gather the segments' numbers in one array, segment after segment.
+        offsets = np.cumsum(lengths) - lengths  # where each segment starts in it
+        segment = np.repeat(np.arange(len(starts)), lengths)  # of each number
+        indices = starts[segment] + np.arange(len(segment)) - offsets[segment]
+        values = result[indices]
+        if three_way:
+            # Seed the random pivots from the `random` module, like the pivots
+            # of `quick_sorted_3way`, so that `random.seed` makes them reproducible.
+            generator = np.random.default_rng(random.getrandbits(64))
+            pivots = values[offsets + generator.integers(lengths)][segment]
+            group = np.where(values < pivots, 0, np.where(values == pivots, 1, 2))
+        else:
+            group = np.where(values < values[offsets][segment], 0, 2)
+            group[offsets] = 1
+        # A stable sort by segment and group puts each segment's groups in order.
+        keys = segment * 3 + group
+        result[indices] = values[np.argsort(keys, kind="stable")]
+        counts = np.bincount(keys, minlength=3 * len(starts)).reshape(-1, 3)
+        starts = np.concatenate((starts, starts + counts[:, 0] + counts[:, 1]))
+        lengths = np.concatenate((counts[:, 0], counts[:, 2]))
+
+
+def _quick_select_array(numbers: "np.ndarray", k: int) -> "np.generic":
+    """Return the `k`-th smallest of `numbers`, like `quick_select`."""
+    smaller, larger = _partition_array(numbers)
+    if k <= len(smaller):
+        return _quick_select_array(smaller, k)
+    if k == len(smaller) + 1:
+        return numbers[0]
+    return _quick_select_array(larger, k - (len(smaller) + 1))
@@ -44,6 +44,20 @@ In both cases, the operations take constant time.
 A singly-linked list uses much more memory than a static array of the same length,
 but a dynamic array may have wasted capacity and requires resizing.
 
+If the maximum size of a stack is known in advance, the stack can be stored
+in a static array of that capacity (see `StaticArrayStack`). The array is
+created once, so adding and removing members never resizes it.
+
+A stack can also be stored in an unrolled linked list (see `ChunkedStack`):
+a singly-linked list of fixed-size arrays, called blocks.
+Only one node per block is needed, instead of one per member,
+and no array is ever resized.
+
+If all members are numbers of the same type, like integers or floats,
+a stack can be stored in a typed dynamic array (see `TypedArrayStack`).
+It stores the numbers themselves instead of references to number objects,
+which makes it several times smaller than the other implementations.
+
 ## Practice
 
 LeetCode has several [problems about stacks](https://leetcode.com/tag/stack).
@@ -53,18 +67,38 @@ Clicking on the up/down button and then on 'Tags' will show
 the algorithmic techniques and ADTs related to each problem.
 """
 
-from collections.abc import Sequence
+import array
+import itertools
+import struct
+import sys
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any
 
-__all__ = ["DynamicArrayStack", "LinkedListStack"]
+from ._util import short_repr
+
+__all__ = [
+    "ChunkedStack",
+    "DynamicArrayStack",
+    "LinkedListStack",
+    "StaticArrayStack",
+    "TypedArrayStack",
+]
+
+# How many members at each reachable end of a stack `repr` shows.
+REPR_MEMBERS = 3
 
 
 class DynamicArrayStack:
     """An implementation of the Stack ADT, using Python lists.
 
-    Besides the ADT's operations, this class provides two convenience operations:
+    Besides the ADT's operations, this class provides seven convenience operations:
     - create a non-empty stack from a given sequence
-    - convert a stack to a string, to see its members listed from bottom to top.
+    - convert a stack to a string, to see its members listed from bottom to top
+    - fork a stack, to change a copy of it independently of the original
+    - push several items at once
+    - pop several members at once
+    - compute the capacity of the stack (how many members fit without resizing)
+    - iterate over the members, from top to bottom, without removing them.
 
     >>> from paddles import DynamicArrayStack
     >>> stack = DynamicArrayStack("abc")    # create a non-empty stack
@@ -77,8 +111,25 @@ class DynamicArrayStack:
     >>> stack.push("C")                     # add a new member on top
     >>> print(stack)                        # str(stack) also possible
     DynamicArrayStack(['a', 'b', 'C'])
+    >>> copy = stack.fork()                 # an independent copy
+    >>> copy.pop()
+    'C'
+    >>> print(stack)                        # the original is unchanged
+    DynamicArrayStack(['a', 'b', 'C'])
+    >>> stack.push_many("de")               # push 'd' and then 'e'
+    >>> stack.pop_many(3)                   # pop 3 members, top member first
+    ['e', 'd', 'C']
+    >>> stack.capacity() >= stack.size()    # the capacity depends on past pushes
+    True
+    >>> list(stack)                         # iterate from top to bottom
+    ['b', 'a']
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_members",
+    )
+
     def __init__(self, sequence: Sequence[Any] = []) -> None:
         """Initialize the stack with the members of `sequence`.
 
@@ -88,8 +139,7 @@ class DynamicArrayStack:
         Complexity: O(n), with n = `len(sequence)`
         """
         self._members = []
-        for item in sequence:
-            self.push(item)
+        self.push_many(sequence)
 
     def __str__(self) -> str:
         """Return a string representation of the stack.
@@ -100,6 +150,40 @@ class DynamicArrayStack:
         """
         return f"DynamicArrayStack({self._members})"
 
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from top to bottom.
+
+        The members are produced in the order they would be popped,
+        without removing or copying them.
+        The stack must not be modified while iterating over it.
+
+        Complexity: O(1) per member
+        """
+        return reversed(self._members)
+
+    def __getstate__(self) -> tuple[list[Any]]:
+        """Return a 1-tuple with the list of members, from bottom to top, for pickling.
+
+        See `LinkedListStack.__getstate__` for why the list is in a tuple.
+
+        Complexity: O(1)
+        """
+        return (self._members,)
+
+    def __setstate__(self, state: tuple[list[Any]]) -> None:
+        """Restore the stack's members from the 1-tuple returned by `__getstate__`.
+
+        Complexity: O(1)
+        """
+        (self._members,) = state
+
+    def __copy__(self) -> "DynamicArrayStack":
+        """Return a shallow copy of the stack, i.e. a fork of it.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return self.fork()
+
     def size(self) -> int:
         """Return how many members the stack has.
 
@@ -138,6 +222,274 @@ class DynamicArrayStack:
             raise ValueError(msg)
         return self._members.pop()
 
+    def fork(self) -> "DynamicArrayStack":
+        """Return a new stack with the same members as this one.
+
+        Pushing and popping members on one stack doesn't affect the other.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        fork = DynamicArrayStack()
+        fork._members = self._members.copy()
+        return fork
+
+    def push_many(self, items: Iterable[Any]) -> None:
+        """Put the `items` on top of the stack, in the order they're given.
+
+        This is faster than pushing one item at a time.
+
+        Complexity: O(k), with k = `len(items)`
+        """
+        self._members.extend(items)
+
+    def pop_many(self, n: int) -> list[Any]:
+        """Remove and return the top `n` members, in the order they're popped.
+
+        The first member of the returned list is the top member of the stack.
+        This is faster than popping one member at a time.
+        Raise `ValueError` if `n` is negative or larger than the stack's size.
+
+        Complexity: O(n)
+        """
+        if not 0 <= n <= self.size():
+            msg = f"can't pop {n} members from a stack with {self.size()}"
+            raise ValueError(msg)
+        if n == 0:
+            return []
+        members = self._members[-n:]
+        del self._members[-n:]
+        members.reverse()
+        return members
+
+    def capacity(self) -> int:
+        """Return how many members the stack can have before it's resized.
+
+        Python lists can't be resized in advance: they grow when needed,
+        with some spare capacity to make future pushes faster.
+        The capacity is computed from the list's memory size in CPython,
+        so it can be used to check how much memory is wasted.
+
+        Complexity: O(1)
+        """
+        spare_bytes = sys.getsizeof(self._members) - sys.getsizeof([])
+        return spare_bytes // struct.calcsize("P")  # the size of a reference
+
+
+class StaticArrayStack:
+    """An implementation of the Stack ADT, using a fixed-capacity array.
+
+    The stack has a Python list, created with the given capacity, and
+    the number of members in it. The members are at the start of the list,
+    with the top member last, and the other slots are `None`.
+    The list never changes its length, unless the capacity is increased.
+
+    Besides the ADT's operations, this class provides eight convenience operations:
+    - create a non-empty stack from a given sequence
+    - convert a stack to a string, to see its members listed from bottom to top
+    - fork a stack, to change a copy of it independently of the original
+    - push several items at once
+    - pop several members at once
+    - compute the capacity of the stack (the maximum number of members)
+    - increase the capacity of the stack
+    - iterate over the members, from top to bottom, without removing them.
+
+    >>> from paddles import StaticArrayStack
+    >>> stack = StaticArrayStack(4, "abc")  # create a non-empty stack
+    >>> stack.size()                        # number of members
+    3
+    >>> stack.pop()                         # remove and return the top member
+    'c'
+    >>> stack.peek()                        # return but don't remove the top member
+    'b'
+    >>> stack.push("C")                     # add a new member on top
+    >>> print(stack)                        # str(stack) also possible
+    StaticArrayStack(['a', 'b', 'C'])
+    >>> copy = stack.fork()                 # an independent copy
+    >>> copy.pop()
+    'C'
+    >>> print(stack)                        # the original is unchanged
+    StaticArrayStack(['a', 'b', 'C'])
+    >>> stack.capacity()                    # the maximum number of members
+    4
+    >>> stack.reserve(5)                    # increase the capacity
+    >>> stack.push_many("de")               # push 'd' and then 'e'
+    >>> stack.pop_many(3)                   # pop 3 members, top member first
+    ['e', 'd', 'C']
+    >>> list(stack)                         # iterate from top to bottom
+    ['b', 'a']
+    """
+
+    __slots__ = ("__weakref__", "_members", "_top")
+
+    def __init__(self, capacity: int, sequence: Sequence[Any] = []) -> None:
+        """Initialize the stack with the given capacity and the members of `sequence`.
+
+        The members are added to the stack in the order they are in `sequence`.
+        To create an empty stack, call `StaticArrayStack(capacity)`.
+        Raise `ValueError` if `capacity` is negative or less than `len(sequence)`.
+
+        Complexity: O(c), with c = `capacity`
+        """
+        if capacity < 0:
+            msg = "can't create a stack with negative capacity"
+            raise ValueError(msg)
+        self._members = [None] * capacity
+        self._top = 0  # the number of members, and the index of the next free slot
+        self.push_many(sequence)
+
+    def __str__(self) -> str:
+        """Return a string representation of the stack.
+
+        The string is 'StaticArrayStack([bottom member, ..., top member])'.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return f"StaticArrayStack({self._members[: self._top]})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from top to bottom.
+
+        The members are produced in the order they would be popped,
+        without removing or copying them.
+        The stack must not be modified while iterating over it.
+
+        Complexity: O(1) per member
+        """
+        for index in range(self._top - 1, -1, -1):
+            yield self._members[index]
+
+    def __getstate__(self) -> tuple[list[Any], int]:
+        """Return the list of slots and the number of members, for pickling.
+
+        Complexity: O(1)
+        """
+        return self._members, self._top
+
+    def __setstate__(self, state: tuple[list[Any], int]) -> None:
+        """Restore the stack's slots and size from the pair of `__getstate__`.
+
+        Complexity: O(1)
+        """
+        self._members, self._top = state
+
+    def __copy__(self) -> "StaticArrayStack":
+        """Return a shallow copy of the stack, i.e. a fork of it.
+
+        Complexity: O(c), with c = `self.capacity()`
+        """
+        return self.fork()
+
+    def size(self) -> int:
+        """Return how many members the stack has.
+
+        Complexity: O(1)
+        """
+        return self._top
+
+    def capacity(self) -> int:
+        """Return how many members the stack can have.
+
+        Complexity: O(1)
+        """
+        return len(self._members)
+
+    def reserve(self, capacity: int) -> None:
+        """Increase the capacity of the stack to `capacity`, if it's less.
+
+        Complexity: O(c), with c = `capacity`
+        """
+        if capacity > len(self._members):
+            self._members.extend([None] * (capacity - len(self._members)))
+
+    def peek(self) -> Any:
+        """Return the member at the top of the stack, without removing it.
+
+        Raise `ValueError` if the stack is empty.
+
+        Complexity: O(1)
+        """
+        if self.size() == 0:
+            msg = "can't peek into an empty stack"
+            raise ValueError(msg)
+        return self._members[self._top - 1]
+
+    def push(self, item: Any) -> None:
+        """Put `item` on top of the stack.
+
+        Raise `ValueError` if the stack is full.
+
+        Complexity: O(1)
+        """
+        if self._top == len(self._members):
+            msg = "can't push a member onto a full stack"
+            raise ValueError(msg)
+        self._members[self._top] = item
+        self._top += 1
+
+    def pop(self) -> Any:
+        """Remove and return the member at the top of the stack.
+
+        Raise `ValueError` if the stack is empty.
+
+        Complexity: O(1)
+        """
+        if self.size() == 0:
+            msg = "can't pop a member from an empty stack"
+            raise ValueError(msg)
+        self._top -= 1
+        item = self._members[self._top]
+        self._members[self._top] = None  # don't keep a reference to the member
+        return item
+
+    def fork(self) -> "StaticArrayStack":
+        """Return a new stack with the same members and capacity as this one.
+
+        Pushing and popping members on one stack doesn't affect the other.
+
+        Complexity: O(c), with c = `self.capacity()`
+        """
+        fork = StaticArrayStack(0)
+        fork._members = self._members.copy()
+        fork._top = self._top
+        return fork
+
+    def push_many(self, items: Iterable[Any]) -> None:
+        """Put the `items` on top of the stack, in the order they're given.
+
+        This is faster than pushing one item at a time.
+        Raise `ValueError` if the stack doesn't have enough free capacity
+        for all items. In that case, no item is pushed.
+
+        Complexity: O(k), with k = `len(items)`
+        """
+        items = list(items)
+        top = self._top + len(items)
+        if top > len(self._members):
+            free = len(self._members) - self._top
+            msg = f"can't push {len(items)} members onto a stack with space for {free}"
+            raise ValueError(msg)
+        self._members[self._top : top] = items
+        self._top = top
+
+    def pop_many(self, n: int) -> list[Any]:
+        """Remove and return the top `n` members, in the order they're popped.
+
+        The first member of the returned list is the top member of the stack.
+        This is faster than popping one member at a time.
+        Raise `ValueError` if `n` is negative or larger than the stack's size.
+
+        Complexity: O(n)
+        """
+        if not 0 <= n <= self.size():
+            msg = f"can't pop {n} members from a stack with {self.size()}"
+            raise ValueError(msg)
+        bottom = self._top - n
+        members = self._members[bottom : self._top]
+        self._members[bottom : self._top] = [None] * n
+        self._top = bottom
+        members.reverse()
+        return members
+
 
 # Each linked list node is a tuple (data, next).
 # These constants make the code more readable.
@@ -148,9 +500,15 @@ NEXT = 1
 class LinkedListStack:
     """An implementation of the Stack ADT, using singly-linked lists.
 
-    Besides the ADT's operations, this class provides two convenience operations:
+    Besides the ADT's operations, this class provides eight convenience operations:
     - create a non-empty stack from a given sequence
-    - convert a stack to a string, to see its members listed from bottom to top.
+    - convert a stack to a string, to see its members listed from bottom to top
+    - fork a stack, to change a copy of it independently of the original
+    - push several items at once
+    - pop several members at once
+    - copy and pickle a stack, even with millions of members
+    - iterate over the members, from top to bottom, without removing them
+    - represent a stack briefly, with its size and its top members.
 
     >>> from paddles import LinkedListStack
     >>> stack = LinkedListStack("abc")      # create a non-empty stack
@@ -163,8 +521,22 @@ class LinkedListStack:
     >>> stack.push("C")                     # add a new member on top
     >>> print(stack)                        # str(stack) also possible
     LinkedListStack(['a', 'b', 'C'])
+    >>> copy = stack.fork()                 # an independent copy
+    >>> copy.pop()
+    'C'
+    >>> print(stack)                        # the original is unchanged
+    LinkedListStack(['a', 'b', 'C'])
+    >>> stack.push_many("de")               # push 'd' and then 'e'
+    >>> stack.pop_many(3)                   # pop 3 members, top member first
+    ['e', 'd', 'C']
+    >>> list(stack)                         # iterate from top to bottom
+    ['b', 'a']
+    >>> stack                               # repr(stack) shows the top members
+    <LinkedListStack: size 2, ['a', 'b']>
     """
 
+    __slots__ = ("__weakref__", "_head", "_length")
+
     def __init__(self, sequence: Sequence[Any] = []) -> None:
         """Initialize the stack with the members of `sequence`.
 
@@ -175,8 +547,7 @@ class LinkedListStack:
         """
         self._head = None
         self._length = 0
-        for item in sequence:
-            self.push(item)
+        self.push_many(sequence)
 
     def __str__(self) -> str:
         """Return a string representation of the stack.
@@ -192,6 +563,67 @@ class LinkedListStack:
             current = current[NEXT]
         return "LinkedListStack([" + ", ".join(reversed(strings)) + "])"
 
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from top to bottom.
+
+        The members are produced in the order they would be popped,
+        without removing or copying them.
+        As the nodes never change, pushing and popping members while iterating
+        doesn't affect the iteration.
+
+        Complexity: O(1) per member
+        """
+        current = self._head
+        while current:
+            yield current[DATA]
+            current = current[NEXT]
+
+    def __repr__(self) -> str:
+        """Return a short representation of the stack, for logging and debugging.
+
+        The string is '<LinkedListStack: size n, [..., member, top member]>',
+        with at most `REPR_MEMBERS` members, so that it's short for large stacks.
+
+        Complexity: O(1)
+        """
+        top = list(itertools.islice(self, REPR_MEMBERS))
+        top.reverse()
+        return short_repr("LinkedListStack", self.size(), [], top)
+
+    def __getstate__(self) -> tuple[list[Any]]:
+        """Return a 1-tuple with the list of members, from bottom to top, for pickling.
+
+        The nodes are visited in a loop, so that pickling and copying a stack
+        with many members doesn't exceed Python's recursion limit.
+        The list is in a tuple because pickle protocols 0 and 1 ignore
+        a false state, like an empty list, and then don't call `__setstate__`.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        members = []
+        current = self._head
+        while current:
+            members.append(current[DATA])
+            current = current[NEXT]
+        members.reverse()
+        return (members,)
+
+    def __setstate__(self, state: tuple[list[Any]]) -> None:
+        """Restore the stack's members from the 1-tuple returned by `__getstate__`.
+
+        Complexity: O(n), with n = `len(state)`
+        """
+        self._head = None
+        self._length = 0
+        self.push_many(state[0])
+
+    def __copy__(self) -> "LinkedListStack":
+        """Return a shallow copy of the stack, i.e. a fork of it.
+
+        Complexity: O(1)
+        """
+        return self.fork()
+
     def size(self) -> int:
         """Return how many members the stack has.
 
@@ -233,3 +665,566 @@ class LinkedListStack:
             msg = "can't peek into an empty stack"
             raise ValueError(msg)
         return self._head[DATA]
+
+    def fork(self) -> "LinkedListStack":
+        """Return a new stack with the same members as this one.
+
+        Pushing and popping members on one stack doesn't affect the other.
+        As the nodes are immutable tuples, both stacks share the existing nodes:
+        a push creates a node only in one stack, and a pop only changes its head.
+        This makes forking a stack, e.g. at each choice point of a
+        backtracking search, take constant time and no memory for the members.
+
+        Complexity: O(1)
+        """
+        fork = LinkedListStack()
+        fork._head = self._head
+        fork._length = self._length
+        return fork
+
+    def push_many(self, items: Iterable[Any]) -> None:
+        """Put the `items` on top of the stack, in the order they're given.
+
+        This is faster than pushing one item at a time.
+
+        Complexity: O(k), with k = `len(items)`
+        """
+        head = self._head
+        length = self._length
+        for item in items:
+            head = (item, head)
+            length += 1
+        self._head = head
+        self._length = length
+
+    def pop_many(self, n: int) -> list[Any]:
+        """Remove and return the top `n` members, in the order they're popped.
+
+        The first member of the returned list is the top member of the stack.
+        This is faster than popping one member at a time.
+        Raise `ValueError` if `n` is negative or larger than the stack's size.
+
+        Complexity: O(n)
+        """
+        if not 0 <= n <= self.size():
+            msg = f"can't pop {n} members from a stack with {self.size()}"
+            raise ValueError(msg)
+        members = []
+        head: Any = self._head  # there are at least `n` nodes
+        for _ in range(n):
+            members.append(head[DATA])
+            head = head[NEXT]
+        self._head = head
+        self._length -= n
+        return members
+
+
+# The number of members in each block of a ChunkedStack.
+BLOCK = 64
+
+
+class ChunkedStack:
+    """An implementation of the Stack ADT, using a linked list of fixed-size blocks.
+
+    Each node of the list is a tuple (block, next), where the block is a
+    Python list with `BLOCK` slots. The head node has the block with the top member.
+    Pushing and popping members only allocates or frees a node and its block
+    when crossing the boundary between blocks.
+
+    Besides the ADT's operations, this class provides eight convenience operations:
+    - create a non-empty stack from a given sequence
+    - convert a stack to a string, to see its members listed from bottom to top
+    - fork a stack, to change a copy of it independently of the original
+    - push several items at once
+    - pop several members at once
+    - copy and pickle a stack, even with millions of members
+    - iterate over the members, from top to bottom, without removing them
+    - represent a stack briefly, with its size and its top members.
+
+    >>> from paddles import ChunkedStack
+    >>> stack = ChunkedStack("abc")         # create a non-empty stack
+    >>> stack.size()                        # number of members
+    3
+    >>> stack.pop()                         # remove and return the top member
+    'c'
+    >>> stack.peek()                        # return but don't remove the top member
+    'b'
+    >>> stack.push("C")                     # add a new member on top
+    >>> print(stack)                        # str(stack) also possible
+    ChunkedStack(['a', 'b', 'C'])
+    >>> copy = stack.fork()                 # an independent copy
+    >>> copy.pop()
+    'C'
+    >>> print(stack)                        # the original is unchanged
+    ChunkedStack(['a', 'b', 'C'])
+    >>> stack.push_many("de")               # push 'd' and then 'e'
+    >>> stack.pop_many(3)                   # pop 3 members, top member first
+    ['e', 'd', 'C']
+    >>> list(stack)                         # iterate from top to bottom
+    ['b', 'a']
+    >>> stack                               # repr(stack) shows the top members
+    <ChunkedStack: size 2, ['a', 'b']>
+    """
+
+    __slots__ = ("__weakref__", "_head", "_length", "_spare", "_top")
+
+    def __init__(self, sequence: Sequence[Any] = []) -> None:
+        """Initialize the stack with the members of `sequence`.
+
+        The members are added to the stack in the order they are in `sequence`.
+        To create an empty stack, call `ChunkedStack()` or `ChunkedStack([])`.
+
+        Complexity: O(n), with n = `len(sequence)`
+        """
+        # The nodes are nested tuples, which the type checker can't follow.
+        self._head: Any = None
+        self._top = BLOCK  # the number of used slots in the head block
+        self._spare: list[Any] | None = None  # an empty block, kept to be reused
+        self._length = 0
+        self.push_many(sequence)
+
+    def __str__(self) -> str:
+        """Return a string representation of the stack.
+
+        The string is 'ChunkedStack([bottom member, ..., top member])'.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        blocks = []
+        current = self._head
+        used = self._top
+        while current:
+            blocks.append(current[DATA][:used])
+            current = current[NEXT]
+            used = BLOCK
+        members = []
+        for block in reversed(blocks):
+            members.extend(block)
+        return f"ChunkedStack({members})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from top to bottom.
+
+        The members are produced in the order they would be popped,
+        without removing or copying them.
+        The stack must not be modified while iterating over it.
+
+        Complexity: O(1) per member
+        """
+        current = self._head
+        used = self._top
+        while current:
+            block = current[DATA]
+            for index in range(used - 1, -1, -1):
+                yield block[index]
+            current = current[NEXT]
+            used = BLOCK
+
+    def __repr__(self) -> str:
+        """Return a short representation of the stack, for logging and debugging.
+
+        The string is '<ChunkedStack: size n, [..., member, top member]>',
+        with at most `REPR_MEMBERS` members, so that it's short for large stacks.
+
+        Complexity: O(1)
+        """
+        top = list(itertools.islice(self, REPR_MEMBERS))
+        top.reverse()
+        return short_repr("ChunkedStack", self.size(), [], top)
+
+    def __getstate__(self) -> tuple[list[Any]]:
+        """Return a 1-tuple with the list of members, from bottom to top, for pickling.
+
+        The nodes are visited in a loop, so that pickling and copying a stack
+        with many members doesn't exceed Python's recursion limit.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        members = []
+        current = self._head
+        used = self._top
+        while current:
+            members.extend(reversed(current[DATA][:used]))
+            current = current[NEXT]
+            used = BLOCK
+        members.reverse()
+        return (members,)
+
+    def __setstate__(self, state: tuple[list[Any]]) -> None:
+        """Restore the stack's members from the 1-tuple returned by `__getstate__`.
+
+        Complexity: O(n), with n = `len(state)`
+        """
+        self._head = None
+        self._top = BLOCK
+        self._spare = None
+        self._length = 0
+        self.push_many(state[0])
+
+    def __copy__(self) -> "ChunkedStack":
+        """Return a shallow copy of the stack, i.e. a fork of it.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return self.fork()
+
+    def size(self) -> int:
+        """Return how many members the stack has.
+
+        Complexity: O(1)
+        """
+        return self._length
+
+    def push(self, item: Any) -> None:
+        """Put `item` on top of the stack.
+
+        Complexity: O(1)
+        """
+        if self._top == BLOCK:
+            # The head block is full (or there's none): start a new block.
+            if self._spare is None:
+                block = [None] * BLOCK
+            else:
+                block = self._spare
+                self._spare = None
+            self._head = (block, self._head)
+            self._top = 0
+        self._head[DATA][self._top] = item
+        self._top += 1
+        self._length += 1
+
+    def pop(self) -> Any:
+        """Remove and return the member at the top of the stack.
+
+        Raise `ValueError` if the stack is empty.
+
+        Complexity: O(1)
+        """
+        if self.size() == 0:
+            msg = "can't pop a member from an empty stack"
+            raise ValueError(msg)
+        block = self._head[DATA]
+        self._top -= 1
+        item = block[self._top]
+        block[self._top] = None  # don't keep a reference to the popped member
+        self._length -= 1
+        if self._top == 0:
+            # The head block is empty: keep it as the spare block, so that
+            # alternating pushes and pops at a boundary don't allocate blocks.
+            self._spare = block
+            self._head = self._head[NEXT]
+            self._top = BLOCK
+        return item
+
+    def peek(self) -> Any:
+        """Return the member at the top of the stack.
+
+        Raise `ValueError` if the stack is empty.
+
+        Complexity: O(1)
+        """
+        if self.size() == 0:
+            msg = "can't peek into an empty stack"
+            raise ValueError(msg)
+        return self._head[DATA][self._top - 1]
+
+    def fork(self) -> "ChunkedStack":
+        """Return a new stack with the same members as this one.
+
+        Pushing and popping members on one stack doesn't affect the other.
+        As the blocks are changed by pushes and pops, they're all copied.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        blocks = []
+        current = self._head
+        while current:
+            blocks.append(current[DATA].copy())
+            current = current[NEXT]
+        fork = ChunkedStack()
+        for block in reversed(blocks):
+            fork._head = (block, fork._head)
+        fork._top = self._top
+        fork._length = self._length
+        return fork
+
+    def push_many(self, items: Iterable[Any]) -> None:
+        """Put the `items` on top of the stack, in the order they're given.
+
+        This is faster than pushing one item at a time,
+        because the blocks are filled with slice assignments.
+
+        Complexity: O(k), with k = `len(items)`
+        """
+        items = list(items)
+        start = 0
+        while start < len(items):
+            if self._top == BLOCK:
+                self.push(items[start])
+                start += 1
+            else:
+                end = min(len(items), start + BLOCK - self._top)
+                top = self._top + end - start
+                self._head[DATA][self._top : top] = items[start:end]
+                self._length += end - start
+                self._top = top
+                start = end
+
+    def pop_many(self, n: int) -> list[Any]:
+        """Remove and return the top `n` members, in the order they're popped.
+
+        The first member of the returned list is the top member of the stack.
+        This is faster than popping one member at a time,
+        because the blocks are emptied with slice operations.
+        Raise `ValueError` if `n` is negative or larger than the stack's size.
+
+        Complexity: O(n)
+        """
+        if not 0 <= n <= self.size():
+            msg = f"can't pop {n} members from a stack with {self.size()}"
+            raise ValueError(msg)
+        members = []
+        while len(members) < n:
+            block = self._head[DATA]
+            bottom = max(0, self._top - (n - len(members)))
+            members.extend(reversed(block[bottom : self._top]))
+            block[bottom : self._top] = [None] * (self._top - bottom)
+            self._length -= self._top - bottom
+            self._top = bottom
+            if bottom == 0:
+                self._spare = block
+                self._head = self._head[NEXT]
+                self._top = BLOCK
+        return members
+
+
+# The kind of number of each typecode of the array and struct modules.
+# Buffers with the same kind and item size as a typed stack are copied as bytes.
+KINDS = {
+    **dict.fromkeys("bhilqn", "signed"),
+    **dict.fromkeys("BHILQN", "unsigned"),
+    **dict.fromkeys("fd", "float"),
+}
+
+
+class TypedArrayStack:
+    """An implementation of the Stack ADT, using typed arrays.
+
+    The members are stored in an `array.array` with the typecode given
+    on creation, e.g. 'q' for 64-bit integers and 'd' for double precision floats.
+    See the `array` module for the typecodes and the range of values of each.
+    Pushing an item that isn't of the typecode's type or range raises
+    `TypeError` or `OverflowError`.
+
+    Besides the ADT's operations, this class provides eight convenience operations:
+    - create a non-empty stack from a given sequence
+    - convert a stack to a string, to see its members listed from bottom to top
+    - fork a stack, to change a copy of it independently of the original
+    - push several items at once, including from any object with the buffer protocol
+    - pop several members at once
+    - get the typecode of the members
+    - access the members, from bottom to top, without copying them
+    - iterate over the members, from top to bottom, without removing them.
+
+    >>> from paddles import TypedArrayStack
+    >>> stack = TypedArrayStack("q", [1, 2, 3])     # create a non-empty stack
+    >>> stack.size()                                # number of members
+    3
+    >>> stack.pop()                                 # remove and return the top member
+    3
+    >>> stack.peek()                                # return but don't remove the top
+    2
+    >>> stack.push(30)                              # add a new member on top
+    >>> print(stack)                                # str(stack) also possible
+    TypedArrayStack('q', [1, 2, 30])
+    >>> copy = stack.fork()                         # an independent copy
+    >>> copy.pop()
+    30
+    >>> print(stack)                                # the original is unchanged
+    TypedArrayStack('q', [1, 2, 30])
+    >>> stack.push_many([4, 5])                     # push 4 and then 5
+    >>> stack.pop_many(3)                           # pop 3 members, top member first
+    [5, 4, 30]
+    >>> stack.typecode()
+    'q'
+    >>> with stack.view() as members:               # release the view when done
+    ...     members.tolist()
+    [1, 2]
+    >>> list(stack)                                 # iterate from top to bottom
+    [2, 1]
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_members",
+    )
+
+    def __init__(self, typecode: str, sequence: Sequence[Any] = []) -> None:
+        """Initialize the stack with the members of `sequence`.
+
+        The members are added to the stack in the order they are in `sequence`.
+        To create an empty stack, call `TypedArrayStack(typecode)`.
+        Raise `ValueError` if `typecode` isn't one of the `array` module's typecodes.
+
+        Complexity: O(n), with n = `len(sequence)`
+        """
+        self._members = array.array(typecode)
+        self.push_many(sequence)
+
+    def __str__(self) -> str:
+        """Return a string representation of the stack.
+
+        The string is "TypedArrayStack('typecode', [bottom member, ..., top member])".
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return f"TypedArrayStack({self.typecode()!r}, {self._members.tolist()})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the members, from top to bottom.
+
+        The members are produced in the order they would be popped,
+        without removing or copying them.
+        The stack must not be modified while iterating over it.
+
+        Complexity: O(1) per member
+        """
+        return reversed(self._members)
+
+    def __getstate__(self) -> tuple[array.array]:
+        """Return a 1-tuple with the array of members, for pickling.
+
+        See `LinkedListStack.__getstate__` for why the array is in a tuple.
+
+        Complexity: O(1)
+        """
+        return (self._members,)
+
+    def __setstate__(self, state: tuple[array.array]) -> None:
+        """Restore the stack's members from the 1-tuple returned by `__getstate__`.
+
+        Complexity: O(1)
+        """
+        (self._members,) = state
+
+    def __copy__(self) -> "TypedArrayStack":
+        """Return a shallow copy of the stack, i.e. a fork of it.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        return self.fork()
+
+    def size(self) -> int:
+        """Return how many members the stack has.
+
+        Complexity: O(1)
+        """
+        return len(self._members)
+
+    def typecode(self) -> str:
+        """Return the typecode of the members.
+
+        Complexity: O(1)
+        """
+        return self._members.typecode
+
+    def peek(self) -> Any:
+        """Return the member at the top of the stack, without removing it.
+
+        Raise `ValueError` if the stack is empty.
+
+        Complexity: O(1)
+        """
+        if self.size() == 0:
+            msg = "can't peek into an empty stack"
+            raise ValueError(msg)
+        return self._members[-1]
+
+    def push(self, item: Any) -> None:
+        """Put `item` on top of the stack.
+
+        Complexity: O(1)
+        """
+        self._members.append(item)
+
+    def pop(self) -> Any:
+        """Remove and return the member at the top of the stack.
+
+        Raise `ValueError` if the stack is empty.
+
+        Complexity: O(1)
+        """
+        if self.size() == 0:
+            msg = "can't pop a member from an empty stack"
+            raise ValueError(msg)
+        return self._members.pop()
+
+    def fork(self) -> "TypedArrayStack":
+        """Return a new stack with the same members as this one.
+
+        Pushing and popping members on one stack doesn't affect the other.
+
+        Complexity: O(n), with n = `self.size()`
+        """
+        fork = TypedArrayStack(self.typecode())
+        fork._members = array.array(self.typecode(), self._members)
+        return fork
+
+    def push_many(self, items: Iterable[Any]) -> None:
+        """Put the `items` on top of the stack, in the order they're given.
+
+        This is faster than pushing one item at a time.
+        If `items` supports the buffer protocol, e.g. it's an `array.array`
+        or a NumPy array, and its items have the same C type as the members,
+        its contents are copied in one go, without creating Python number objects.
+
+        Complexity: O(k), with k = `len(items)`
+        """
+        try:
+            buffer = memoryview(items)  # ty: ignore[invalid-argument-type]
+        except TypeError:
+            self._members.extend(items)
+            return
+        with buffer:
+            kind = KINDS.get(self.typecode())
+            if (
+                kind is not None
+                and kind == KINDS.get(buffer.format.lstrip("@"))
+                and buffer.itemsize == self._members.itemsize
+                and buffer.c_contiguous
+            ):
+                self._members.frombytes(buffer.cast("B"))
+                return
+        self._members.extend(items)
+
+    def pop_many(self, n: int) -> list[Any]:
+        """Remove and return the top `n` members, in the order they're popped.
+
+        The first member of the returned list is the top member of the stack.
+        This is faster than popping one member at a time.
+        Raise `ValueError` if `n` is negative or larger than the stack's size.
+
+        Complexity: O(n)
+        """
+        if not 0 <= n <= self.size():
+            msg = f"can't pop {n} members from a stack with {self.size()}"
+            raise ValueError(msg)
+        if n == 0:
+            return []
+        members = self._members[-n:].tolist()
+        del self._members[-n:]
+        members.reverse()
+        return members
+
+    def view(self) -> memoryview:
+        """Return a read-only view of the members, from bottom to top.
+
+        The view gives access to the members without copying them,
+        e.g. to write them to a file or to create a NumPy array.
+        While the view isn't released, pushing and popping members raises
+        `BufferError`. Use the view in a `with` statement, or call its
+        `release()` method, to release it.
+
+        Complexity: O(1)
+        """
+        return memoryview(self._members).toreadonly()
@@ -1,6 +1,8 @@
 """Closed-box unit tests for all Bag ADT implementations."""
 
+import pickle
 import random
+import weakref
 from collections.abc import Hashable, Sequence
 
 import pytest
@@ -231,3 +233,20 @@ def test_equal_to(Bag: type[BagADT], items: Sequence[Hashable]) -> None:  # noqa
         subset = Bag(random.sample(items, n))
         assert not bag1.equal_to(subset)
         assert not subset.equal_to(bag1)
+
+
+# Test pickling.
+
+
+def test_pickle(Bag: type[BagADT], items: Sequence[Hashable]) -> None:  # noqa: N803
+    """Test that unpickled bags are equal to the original, with every protocol."""
+    bag = Bag(items)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(bag, protocol))  # noqa: S301 (the data isn't untrusted)
+        assert str(copied) == str(bag)
+        copied.add("new")
+        assert not copied.equal_to(bag)
+        assert bag.included_in(copied)
+    reference = weakref.ref(bag)
+    del bag
+    assert reference() is None
@@ -1,10 +1,16 @@
 """Closed-box unit tests for all implementations of the Deque ADT."""
 
+import asyncio
+import copy
+import itertools
+import pickle
+import weakref
 from collections.abc import Sequence
+from typing import Any
 
 import pytest
 
-from paddles import LinkedListDeque
+from paddles import AsyncDeque, LinkedListDeque, LinkedListQueue
 
 # Helper functions: can't be named test_... or pytest will call them directly.
 
@@ -25,22 +31,32 @@ def check_is_empty(deque: DequeADT) -> None:
     assert str(deque) == f"{deque.__class__.__name__}([])"
 
 
+def unpickle(data: bytes) -> DequeADT:
+    """Return the deque pickled in `data` by the tests."""
+    return pickle.loads(data)  # noqa: S301 (the data isn't untrusted)
+
+
+# Unpickling must work with every protocol, including the text protocol 0.
+PROTOCOLS = range(pickle.HIGHEST_PROTOCOL + 1)
+
+# The members of the deques in the tests.
+ITEMS = ["abcd", [3, 2, 1], (True, False, None), range(20)]
+
 # Execute each test for all combinations of these parameter values.
-pytestmark = [
-    pytest.mark.parametrize("Deque", [LinkedListDeque]),
-    pytest.mark.parametrize(
-        "items", ["abcd", [3, 2, 1], (True, False, None), range(20)]
-    ),
-]
+deque_cases = pytest.mark.parametrize(
+    ("Deque", "items"), list(itertools.product([LinkedListDeque], ITEMS))
+)
 
 # Test the creation method.
 
 
+@deque_cases
 def test_init_empty(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803 ARG001
     """Test the creation of empty deques. Ignore the items for this test."""
     check_is_empty(Deque())
 
 
+@deque_cases
 def test_init_iterable(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     """Test the creation of deques from itemss."""
     deque = Deque(items)
@@ -50,9 +66,17 @@ def test_init_iterable(Deque: type[DequeADT], items: Sequence) -> None:  # noqa:
     assert str(deque) == f"{Deque.__name__}({list(items)})"
 
 
+@deque_cases
+def test_init_pool_error(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that a deque can't be created with a negative pool size."""
+    with pytest.raises(ValueError, match="can't create a deque with pool size -1"):
+        Deque(items, pool_size=-1)
+
+
 # Test each modifier method separately.
 
 
+@deque_cases
 def test_add_front(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     """Test that `add_front(item)` adds `item` to the front."""
     deque = Deque()
@@ -65,6 +89,7 @@ def test_add_front(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N80
     assert str(deque) == f"{Deque.__name__}({list(reversed(items))})"
 
 
+@deque_cases
 def test_add_back(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     """Test that `add_back(item)` adds `item` to the back."""
     deque = Deque()
@@ -77,6 +102,7 @@ def test_add_back(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     assert str(deque) == f"{Deque.__name__}({list(items)})"
 
 
+@deque_cases
 def test_take_front(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     """Test that `take_front()` removes and returns the front item."""
     deque = Deque(items)
@@ -88,6 +114,7 @@ def test_take_front(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N8
     check_is_empty(deque)
 
 
+@deque_cases
 def test_take_back(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     """Test that `take_back()` removes and returns the back item."""
     deque = Deque(items)
@@ -99,9 +126,128 @@ def test_take_back(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N80
     check_is_empty(deque)
 
 
+@deque_cases
+def test_extend_from(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `extend_from(other)` moves the members of other to the back."""
+    deque = Deque()
+    other = Deque(items)
+    deque.extend_from(Deque())
+    check_is_empty(deque)
+    deque.extend_from(other)
+    check_is_empty(other)
+    other.add_back("new")
+    deque.extend_from(other)
+    deque.extend_from(Deque(items))
+    check_is_empty(other)
+    assert deque.size() == 2 * len(items) + 1
+    assert list(deque) == [*items, "new", *items]
+    assert list(reversed(deque)) == [*reversed(items), "new", *reversed(items)]
+
+
+@deque_cases
+def test_extend_from_error(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that a deque can't be extended with itself or a queue, which is kept."""
+    deque = Deque(items)
+    with pytest.raises(ValueError, match="can't extend a deque with itself"):
+        deque.extend_from(deque)
+    queue = LinkedListQueue(items)
+    with pytest.raises(TypeError, match="can't extend a deque with a LinkedListQueue"):
+        deque.extend_from(queue)  # ty: ignore[invalid-argument-type]
+    assert str(deque) == f"{Deque.__name__}({list(items)})"
+    assert str(queue) == f"LinkedListQueue({list(items)})"
+
+
+@deque_cases
+def test_split_at(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `split_at(k)` moves the members from position k to a new deque."""
+    for k in range(len(items) + 1):
+        front = Deque(items)
+        back = front.split_at(k)
+        assert front.size() == k
+        assert back.size() == len(items) - k
+        assert list(front) == list(items[:k])
+        assert list(back) == list(items[k:])
+        assert list(reversed(front)) == list(reversed(items[:k]))
+        assert list(reversed(back)) == list(reversed(items[k:]))
+        front.extend_from(back)
+        assert str(front) == f"{Deque.__name__}({list(items)})"
+    check_is_empty(Deque().split_at(0))
+
+
+@deque_cases
+def test_split_at_error(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `split_at(k)` fails if k isn't a position in the deque."""
+    deque = Deque(items)
+    for k in (-1, len(items) + 1):
+        with pytest.raises(ValueError, match=f"can't split a deque .* at position {k}"):
+            deque.split_at(k)
+    assert str(deque) == f"{Deque.__name__}({list(items)})"
+
+
+@deque_cases
+def test_pool(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that a deque with a pool of nodes keeps the right members."""
+    for pool_size in (1, len(items), 2 * len(items)):
+        deque = Deque(items, pool_size=pool_size)
+        for _ in range(3):
+            assert [deque.take_back() for _ in items] == list(reversed(items))
+            check_is_empty(deque)
+            for item in reversed(items):
+                deque.add_front(item)
+            assert [deque.take_front() for _ in items] == list(items)
+            for item in items:
+                deque.add_back(item)
+            assert list(reversed(deque)) == list(reversed(items))
+            assert str(deque) == f"{Deque.__name__}({list(items)})"
+        back = deque.split_at(1)
+        back.take_front()
+        back.add_front(items[1])
+        assert list(back) == list(items[1:])
+
+
+@deque_cases
+def test_iter(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test iterating over a deque in both directions, without taking members."""
+    deque = Deque(items)
+    assert list(deque) == list(items)
+    assert list(reversed(deque)) == list(reversed(items))
+    assert deque.size() == len(items)
+    assert list(Deque()) == list(reversed(Deque())) == []
+
+
+@deque_cases
+def test_repr(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that the repr of a deque has the size, the front and back members."""
+    members = [repr(item) for item in items]
+    if len(items) > 6:  # noqa: PLR2004
+        members = [*members[:3], "...", *members[-3:]]
+    expected = f"<{Deque.__name__}: size {len(items)}, [{', '.join(members)}]>"
+    assert repr(Deque(items)) == expected
+    assert repr(Deque()) == f"<{Deque.__name__}: size 0, []>"
+
+
+@deque_cases
+def test_sort(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `sort()` puts the members in non-decreasing order."""
+    comparable = [item for item in items if item is not None]
+    deque = Deque(comparable[::-1] + comparable)
+    deque.sort()
+    assert str(deque) == f"{Deque.__name__}({sorted(comparable * 2)})"
+    for item in sorted(comparable * 2, reverse=True):
+        assert deque.take_back() == item
+    check_is_empty(deque)
+    deque.sort()
+    check_is_empty(deque)
+    # Equal members like 1, True and 1.0 must keep their order.
+    deque = Deque([2, 1, True, 1.0, 0])
+    deque.sort()
+    assert str(deque) == f"{Deque.__name__}([0, 1, True, 1.0, 2])"
+
+
 # Test the combined behaviour of modifiers.
 
 
+@deque_cases
 def test_fifo(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     """Test that deques can act like queues (first-in first-out)."""
     # Add to the back, take from the front
@@ -119,6 +265,7 @@ def test_fifo(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     check_is_empty(deque)
 
 
+@deque_cases
 def test_lifo(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     """Test that deques can act like stacks (last-in first-out)."""
     # Add to the front, take from the front
@@ -134,3 +281,242 @@ def test_lifo(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
     for item in reversed(items):
         assert deque.take_back() == item
     check_is_empty(deque)
+
+
+# Test copying and pickling.
+
+
+@deque_cases
+def test_copy(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that copies and unpickled deques are independent of the original."""
+    deque = Deque(items, pool_size=2)
+    copies = [copy.copy(deque), copy.deepcopy(deque)]
+    copies += [unpickle(pickle.dumps(deque, protocol)) for protocol in PROTOCOLS]
+    for copied in copies:
+        assert str(copied) == str(deque)
+        copied.add_back(None)
+        for item in [*items, None]:
+            assert copied.take_front() == item
+        check_is_empty(copied)
+    assert str(deque) == f"{Deque.__name__}({list(items)})"
+    nested = Deque([[item] for item in items])
+    shallow = copy.copy(nested)
+    deep = copy.deepcopy(nested)
+    assert shallow.front() is nested.front()
+    assert deep.front() is not nested.front()
+    assert deep.front() == nested.front()
+
+
+@deque_cases
+def test_copy_large(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test copying and pickling deques with many members."""
+    large = list(items) * 5_000
+    deque = Deque(large)
+    for copied in (copy.deepcopy(deque), unpickle(pickle.dumps(deque))):
+        assert copied.size() == len(large)
+        assert str(copied) == str(deque)
+
+
+@deque_cases
+def test_weakref(Deque: type[DequeADT], items: Sequence) -> None:  # noqa: N803
+    """Test that deques can be weakly referenced, e.g. in caches."""
+    deque = Deque(items)
+    reference = weakref.ref(deque)
+    assert reference() is deque
+    del deque
+    assert reference() is None
+
+
+# Tests for `AsyncDeque`, shared by `asyncio` coroutines.
+
+
+async def check_async_is_empty(deque: AsyncDeque) -> None:
+    """Test that the deque is empty.
+
+    The deque's coroutines must only be awaited in one event loop.
+    """
+    assert deque.size() == 0
+    with pytest.raises(ValueError, match="can't access the front of an empty deque"):
+        deque.front()
+    with pytest.raises(ValueError, match="can't access the back of an empty deque"):
+        deque.back()
+    with pytest.raises(ValueError, match="can't remove a member from an empty deque"):
+        await deque.take_front(0.01)
+    with pytest.raises(ValueError, match="can't remove a member from an empty deque"):
+        await deque.take_back(0)
+    assert await deque.take_front_batch(2, 0) == []
+    assert str(deque) == "AsyncDeque([])"
+
+
+def new_capacity(spare: int | None, items: Sequence) -> int | None:
+    """Return the capacity for a deque of `items` with `spare` free places."""
+    return None if spare is None else len(items) + spare
+
+
+# Execute each test for all combinations of these parameter values.
+async_cases = pytest.mark.parametrize(
+    ("spare", "items"), list(itertools.product([None, 0, 5], ITEMS))
+)
+
+# Test the creation method.
+
+
+@async_cases
+def test_async_init_empty(spare: int | None, items: Sequence) -> None:
+    """Test the creation of empty deques."""
+    deque = AsyncDeque(new_capacity(spare, items))
+    assert deque.capacity() == new_capacity(spare, items)
+    asyncio.run(check_async_is_empty(deque))
+
+
+@async_cases
+def test_async_init_iterable(spare: int | None, items: Sequence) -> None:
+    """Test the creation of deques from items."""
+    deque = AsyncDeque(new_capacity(spare, items), items)
+    assert deque.size() == len(items)
+    assert deque.front() == items[0]
+    assert deque.back() == items[-1]
+    assert str(deque) == f"AsyncDeque({list(items)})"
+
+
+@async_cases
+def test_async_init_error(spare: int | None, items: Sequence) -> None:  # noqa: ARG001
+    """Test that a deque can't be created with too little capacity."""
+    with pytest.raises(ValueError, match="can't create a deque with capacity -1"):
+        AsyncDeque(-1)
+    with pytest.raises(ValueError, match="more members than its capacity"):
+        AsyncDeque(len(items) - 1, items)
+
+
+# Test the modifiers.
+
+
+@async_cases
+def test_async_fifo_lifo(spare: int | None, items: Sequence) -> None:
+    """Test the first-in first-out and last-in first-out behaviours of deques."""
+    deque = AsyncDeque(new_capacity(spare, items))
+
+    async def add_take() -> None:
+        """Add all items at one end and take them from each end."""
+        for item in items:
+            await deque.add_back(item)
+        assert [await deque.take_front() for _ in items] == list(items)
+        for item in items:
+            await deque.add_front(item)
+        assert [await deque.take_front() for _ in items] == list(reversed(items))
+        for item in items:
+            await deque.add_back(item)
+        assert [await deque.take_back() for _ in items] == list(reversed(items))
+        await check_async_is_empty(deque)
+
+    asyncio.run(add_take())
+
+
+@async_cases
+def test_async_full(spare: int | None, items: Sequence) -> None:
+    """Test that adding to a full deque fails after the timeout."""
+    if spare is None:
+        pytest.skip("a deque without capacity is never full")
+    deque = AsyncDeque(len(items), items)
+
+    async def add() -> None:
+        """Try to add at each end, then wait for space."""
+        with pytest.raises(ValueError, match="can't add a member to a full deque"):
+            await deque.add_front("new", 0.01)
+        with pytest.raises(ValueError, match="can't add a member to a full deque"):
+            await deque.add_back("new", 0)
+        taker = asyncio.create_task(deque.take_back())
+        await deque.add_front("new")
+        assert await taker == items[-1]
+
+    asyncio.run(add())
+    assert str(deque) == f"AsyncDeque({['new', *items[:-1]]})"
+
+
+@async_cases
+def test_async_waits(spare: int | None, items: Sequence) -> None:
+    """Test that operations wait for another coroutine to add or remove members."""
+    deque = AsyncDeque(None if spare is None else spare + 1)
+
+    async def produce() -> None:
+        """Add all items at the back, one at a time."""
+        for item in items:
+            await asyncio.sleep(0)
+            await deque.add_back(item)
+
+    async def consume() -> list:
+        """Start the producer and take the items it produces from the front."""
+        producer = asyncio.create_task(produce())
+        consumed = [await deque.take_front(1) for _ in items]
+        await producer
+        return consumed
+
+    assert asyncio.run(consume()) == list(items)
+    assert deque.size() == 0
+
+
+@async_cases
+def test_async_take_front_batch(spare: int | None, items: Sequence) -> None:
+    """Test taking members in batches, with and without a timeout."""
+    deque = AsyncDeque(new_capacity(spare, items), items)
+
+    async def produce() -> None:
+        """Add all items at the back, one at a time."""
+        for item in items:
+            await asyncio.sleep(0.001)
+            await deque.add_back(item)
+
+    async def consume() -> None:
+        """Take the initial members and then all produced items as one batch."""
+        assert await deque.take_front_batch(2, 0) == list(items[:2])
+        assert await deque.take_front_batch(len(items), 0.01) == list(items[2:])
+        await check_async_is_empty(deque)
+        producer = asyncio.create_task(produce())
+        assert await deque.take_front_batch(len(items)) == list(items)
+        await producer
+
+    asyncio.run(consume())
+
+
+@async_cases
+def test_async_cancelled_waiter(spare: int | None, items: Sequence) -> None:
+    """Test that a consumer cancelled after being notified doesn't lose the member."""
+    deque = AsyncDeque(new_capacity(spare, items))
+
+    async def consume() -> Any:
+        """Cancel the first of two waiting consumers once a member is added."""
+        cancelled = asyncio.create_task(deque.take_back())
+        waiting = asyncio.create_task(deque.take_front(1))
+        await asyncio.sleep(0)
+        await deque.add_back(items[0])
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        item = await waiting
+        await check_async_is_empty(deque)
+        return item
+
+    assert asyncio.run(consume()) == items[0]
+
+
+# Test pickling.
+
+
+@async_cases
+def test_async_pickle(spare: int | None, items: Sequence) -> None:
+    """Test that unpickled deques work in a new event loop, with every protocol."""
+    deque = AsyncDeque(new_capacity(spare, items), items)
+
+    async def take_all(copied: AsyncDeque) -> list:
+        """Take all members of the unpickled deque."""
+        return [await copied.take_front() for _ in items]
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(deque, protocol))  # noqa: S301 (the data isn't untrusted)
+        assert copied.capacity() == deque.capacity()
+        assert asyncio.run(take_all(copied)) == list(items)
+        asyncio.run(check_async_is_empty(copied))
+    assert str(deque) == f"AsyncDeque({list(items)})"
+    reference = weakref.ref(deque)
+    del deque
+    assert reference() is None
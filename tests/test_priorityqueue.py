@@ -0,0 +1,233 @@
+"""Closed-box unit tests for all Priority Queue ADT implementations."""
+
+import copy
+import itertools
+import pickle
+import random
+import weakref
+from collections.abc import Sequence
+
+import pytest
+
+from paddles import HeapPriorityQueue, IndexedHeapPriorityQueue
+
+# Helper functions: can't be named test_... or pytest will call them directly.
+
+QueueADT = HeapPriorityQueue | IndexedHeapPriorityQueue
+
+
+def check_is_empty(queue: QueueADT) -> None:
+    """Test that the priority queue is empty."""
+    assert queue.size() == 0
+    with pytest.raises(ValueError, match="can't peek into an empty priority queue"):
+        queue.peek()
+    with pytest.raises(ValueError, match="can't take the minimum of an empty"):
+        queue.take_min()
+    assert str(queue) == f"{queue.__class__.__name__}([])"
+
+
+def new_pairs(items: Sequence) -> list[tuple]:
+    """Return (item, priority) pairs, with repeated priorities in no order."""
+    return [(item, index * 7 % 5) for index, item in enumerate(items)]
+
+
+def by_priority(pairs: list[tuple]) -> list[tuple]:
+    """Return the pairs in the order their members should be removed."""
+    return sorted(pairs, key=lambda pair: pair[1])
+
+
+def take_all(queue: QueueADT) -> list[tuple]:
+    """Remove all members and return them with their priorities, in order."""
+    return [queue.take_min() for _ in range(queue.size())]
+
+
+# The members of the priority queues in the tests.
+ITEMS = ["abcd", [3, 2, 1], (True, False, None), range(20)]
+
+# Execute each test for all combinations of these parameter values.
+CLASSES = [HeapPriorityQueue, IndexedHeapPriorityQueue]
+ARITIES = [2, 3, 5]
+queue_cases = pytest.mark.parametrize(
+    ("Queue", "arity", "items"), list(itertools.product(CLASSES, ARITIES, ITEMS))
+)
+
+# Test the creation method.
+
+
+@queue_cases
+def test_init_empty(Queue: type[QueueADT], arity: int, items: Sequence) -> None:  # noqa: N803 ARG001
+    """Test the creation of empty priority queues. Ignore the items."""
+    queue = Queue(arity=arity)
+    assert queue.arity() == arity
+    check_is_empty(queue)
+
+
+@queue_cases
+def test_init_pairs(Queue: type[QueueADT], arity: int, items: Sequence) -> None:  # noqa: N803
+    """Test the creation of priority queues from pairs."""
+    pairs = new_pairs(items)
+    queue = Queue(iter(pairs), arity)
+    assert queue.size() == len(items)
+    assert queue.peek() == by_priority(pairs)[0]
+    assert str(queue) == f"{Queue.__name__}({by_priority(pairs)})"
+    assert take_all(queue) == by_priority(pairs)
+    check_is_empty(queue)
+
+
+@queue_cases
+def test_init_error(Queue: type[QueueADT], arity: int, items: Sequence) -> None:  # noqa: N803 ARG001
+    """Test that a heap must have at least two children per node. Ignore the arity."""
+    for wrong_arity in (0, 1):
+        message = f"can't create a heap with arity {wrong_arity}"
+        with pytest.raises(ValueError, match=message):
+            Queue(new_pairs(items), wrong_arity)
+
+
+# Test the modifiers.
+
+
+@queue_cases
+def test_add(Queue: type[QueueADT], arity: int, items: Sequence) -> None:  # noqa: N803
+    """Test that `add(item, priority)` adds one member at a time."""
+    queue = Queue(arity=arity)
+    pairs = new_pairs(items)
+    for item, priority in pairs:
+        queue.add(item, priority)
+        assert queue.peek() == by_priority(pairs[: queue.size()])[0]
+    assert queue.size() == len(items)
+    assert take_all(queue) == by_priority(pairs)
+    check_is_empty(queue)
+
+
+@queue_cases
+def test_add_take_min(Queue: type[QueueADT], arity: int, items: Sequence) -> None:  # noqa: N803
+    """Test adding and removing members in random order."""
+    random.seed(arity)
+    queue = Queue(new_pairs(items), arity)
+    # The expected members, in the order they were added.
+    expected = new_pairs(items)
+    for item, priority in new_pairs(items) * 3:
+        if random.randrange(2):  # noqa: S311
+            queue.add(item, -priority)
+            expected.append((item, -priority))
+        elif expected:
+            minimum = by_priority(expected)[0]
+            assert queue.take_min() == minimum
+            expected.remove(minimum)
+        assert queue.size() == len(expected)
+    assert take_all(queue) == by_priority(expected)
+
+
+# Test copying and pickling.
+
+
+@queue_cases
+def test_copy(Queue: type[QueueADT], arity: int, items: Sequence) -> None:  # noqa: N803
+    """Test that copies and unpickled priority queues are independent."""
+    pairs = new_pairs(items)
+    queue = Queue(pairs, arity)
+    copies = [copy.deepcopy(queue)]
+    # Unpickling must work with every protocol, including the text protocol 0.
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        data = pickle.dumps(queue, protocol)
+        copies += [pickle.loads(data)]  # noqa: S301 (the data isn't untrusted)
+    for copied in copies:
+        assert copied.arity() == arity
+        copied.add("new", -1)
+        assert take_all(copied) == [("new", -1), *by_priority(pairs)]
+    assert str(queue) == f"{Queue.__name__}({by_priority(pairs)})"
+
+
+@queue_cases
+def test_weakref(Queue: type[QueueADT], arity: int, items: Sequence) -> None:  # noqa: N803
+    """Test that priority queues can be weakly referenced, e.g. in caches."""
+    queue = Queue(new_pairs(items), arity)
+    reference = weakref.ref(queue)
+    assert reference() is queue
+    del queue
+    assert reference() is None
+
+
+# Tests for the operations on members given by their handles.
+
+# Execute each test for all combinations of these parameter values.
+indexed_cases = pytest.mark.parametrize(
+    ("arity", "items"), list(itertools.product(ARITIES, ITEMS))
+)
+
+
+@indexed_cases
+def test_indexed_handles(arity: int, items: Sequence) -> None:
+    """Test that handles identify the members until they're removed."""
+    pairs = new_pairs(items)
+    queue = IndexedHeapPriorityQueue(pairs, arity)
+    handles = [queue.add(item, priority) for item, priority in pairs]
+    assert handles == list(range(len(items), 2 * len(items)))
+    assert all(queue.has(handle) for handle in range(2 * len(items)))
+    assert not queue.has(-1)
+    assert not queue.has(2 * len(items))
+    removed = [queue.take_min() for _ in items]
+    assert removed == by_priority(pairs * 2)[: len(items)]
+    assert sum(queue.has(handle) for handle in range(2 * len(items))) == len(items)
+
+
+@indexed_cases
+def test_indexed_change_priority(arity: int, items: Sequence) -> None:
+    """Test that `change_priority(handle, priority)` moves the member."""
+    pairs = new_pairs(items)
+    queue = IndexedHeapPriorityQueue(pairs, arity)
+    # Make the members with even handles the smallest, in reverse order.
+    for handle in range(0, len(items), 2):
+        queue.change_priority(handle, -handle)
+        pairs[handle] = (items[handle], -handle)
+    # Make the members with odd handles the largest, keeping their order.
+    for handle in range(1, len(items), 2):
+        queue.change_priority(handle, 10)
+        pairs[handle] = (items[handle], 10)
+    assert queue.size() == len(items)
+    assert take_all(queue) == sorted(pairs, key=lambda pair: pair[1])
+
+
+@indexed_cases
+def test_indexed_remove(arity: int, items: Sequence) -> None:
+    """Test that `remove(handle)` removes any member."""
+    pairs = new_pairs(items)
+    queue = IndexedHeapPriorityQueue(pairs, arity)
+    # Remove every third member, from the last one to the first.
+    for handle in reversed(range(0, len(items), 3)):
+        assert queue.remove(handle) == pairs[handle]
+        assert not queue.has(handle)
+    kept = [pair for handle, pair in enumerate(pairs) if handle % 3]
+    assert queue.size() == len(kept)
+    assert str(queue) == f"IndexedHeapPriorityQueue({by_priority(kept)})"
+    assert take_all(queue) == by_priority(kept)
+
+
+@indexed_cases
+def test_indexed_unknown_handle(arity: int, items: Sequence) -> None:
+    """Test that members can't be changed or removed with unknown handles."""
+    queue = IndexedHeapPriorityQueue(new_pairs(items), arity)
+    queue.remove(0)
+    for handle in (-1, 0, len(items)):
+        message = f"can't change the priority of unknown handle {handle}"
+        with pytest.raises(ValueError, match=message):
+            queue.change_priority(handle, 0)
+        message = f"can't remove the member with unknown handle {handle}"
+        with pytest.raises(ValueError, match=message):
+            queue.remove(handle)
+    assert queue.size() == len(items) - 1
+
+
+@indexed_cases
+def test_indexed_pickle(arity: int, items: Sequence) -> None:
+    """Test that the handles still identify the members after unpickling."""
+    pairs = new_pairs(items)
+    queue = IndexedHeapPriorityQueue(pairs, arity)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(queue, protocol))  # noqa: S301 (the data isn't untrusted)
+        assert copied.remove(0) == pairs[0]
+        copied.change_priority(len(items) - 1, -1)
+        assert copied.add("new", -2) == len(items)
+        assert copied.take_min() == ("new", -2)
+        assert copied.take_min() == (items[-1], -1)
+    assert take_all(queue) == by_priority(pairs)
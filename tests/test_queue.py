@@ -1,10 +1,29 @@
 """Closed-box unit tests for all Queue ADT implementations."""
 
-from collections.abc import Sequence
+import asyncio
+import copy
+import itertools
+import multiprocessing
+import pickle
+import platform
+import struct
+import subprocess
+import sys
+import threading
+import weakref
+from collections.abc import Callable, Generator, Sequence
+from contextlib import contextmanager
+from typing import Any
 
 import pytest
 
-from paddles import LinkedListQueue
+from paddles import (
+    AsyncQueue,
+    BoundedQueue,
+    LinkedListDeque,
+    LinkedListQueue,
+    SharedMemoryQueue,
+)
 
 # Helper functions: can't be named test_... or pytest will call them directly.
 
@@ -21,23 +40,33 @@ def check_is_empty(queue: QueueADT) -> None:
     assert str(queue) == f"{queue.__class__.__name__}([])"
 
 
+def unpickle(data: bytes) -> QueueADT:
+    """Return the queue pickled in `data` by the tests."""
+    return pickle.loads(data)  # noqa: S301 (the data isn't untrusted)
+
+
+# Unpickling must work with every protocol, including the text protocol 0.
+PROTOCOLS = range(pickle.HIGHEST_PROTOCOL + 1)
+
+# The members of the queues in the tests.
+ITEMS = ["abcd", [3, 2, 1], (True, False, None), range(20)]
+
 # Execute each test for all combinations of these parameter values.
-pytestmark = [
-    pytest.mark.parametrize("Queue", [LinkedListQueue]),
-    pytest.mark.parametrize(
-        "items", ["abcd", [3, 2, 1], (True, False, None), range(20)]
-    ),
-]
+queue_cases = pytest.mark.parametrize(
+    ("Queue", "items"), list(itertools.product([LinkedListQueue], ITEMS))
+)
 
 
 # Test the creation method.
 
 
+@queue_cases
 def test_init_empty(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803 ARG001
     """Test the creation of empty queues. Ignore the items."""
     check_is_empty(Queue())
 
 
+@queue_cases
 def test_init_iterable(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
     """Test the creation of queues from itemss."""
     queue = Queue(items)
@@ -46,9 +75,17 @@ def test_init_iterable(Queue: type[QueueADT], items: Sequence) -> None:  # noqa:
     assert str(queue) == f"{Queue.__name__}({list(items)})"
 
 
+@queue_cases
+def test_init_pool_error(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that a queue can't be created with a negative pool size."""
+    with pytest.raises(ValueError, match="can't create a queue with pool size -1"):
+        Queue(items, pool_size=-1)
+
+
 # Test each modifier method separately.
 
 
+@queue_cases
 def test_enqueue(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
     """Test that `enqueue(item)` adds `item` to the back."""
     queue = Queue()
@@ -60,6 +97,7 @@ def test_enqueue(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
     assert str(queue) == f"{Queue.__name__}({list(items)})"
 
 
+@queue_cases
 def test_dequeue(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
     """Test that `dequeue()` removes and returns the front item."""
     queue = Queue(items)
@@ -70,9 +108,155 @@ def test_dequeue(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
     check_is_empty(queue)
 
 
+@queue_cases
+def test_enqueue_many(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `enqueue_many(items)` enqueues the items in order."""
+    queue = Queue()
+    queue.enqueue_many([])
+    check_is_empty(queue)
+    queue.enqueue_many(iter(items))
+    queue.enqueue_many(items)
+    assert queue.size() == 2 * len(items)
+    assert str(queue) == f"{Queue.__name__}({list(items) * 2})"
+    queue.enqueue("new")
+    assert list(queue) == [*items, *items, "new"]
+
+
+@queue_cases
+def test_dequeue_many(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `dequeue_many(n)` dequeues the front n members."""
+    queue = Queue(items)
+    assert queue.dequeue_many(0) == []
+    assert queue.dequeue_many(2) == list(items[:2])
+    assert queue.dequeue_many(queue.size()) == list(items[2:])
+    check_is_empty(queue)
+    queue.enqueue("new")
+    assert str(queue) == f"{Queue.__name__}(['new'])"
+
+
+@queue_cases
+def test_dequeue_many_error(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `dequeue_many(n)` fails if there aren't n members to dequeue."""
+    queue = Queue(items)
+    for n in (-1, len(items) + 1):
+        with pytest.raises(ValueError, match=f"can't dequeue {n} members from"):
+            queue.dequeue_many(n)
+    assert str(queue) == f"{Queue.__name__}({list(items)})"
+
+
+@queue_cases
+def test_drain(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `drain()` dequeues all members."""
+    queue = Queue(items)
+    assert queue.drain() == list(items)
+    check_is_empty(queue)
+    assert queue.drain() == []
+
+
+@queue_cases
+def test_extend_from(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `extend_from(other)` moves the members of other to the back."""
+    queue = Queue()
+    other = Queue(items)
+    queue.extend_from(Queue())
+    check_is_empty(queue)
+    queue.extend_from(other)
+    check_is_empty(other)
+    other.enqueue_many(items)
+    queue.extend_from(other)
+    check_is_empty(other)
+    queue.extend_from(other)
+    queue.enqueue("new")
+    assert queue.size() == 2 * len(items) + 1
+    assert list(queue) == [*items, *items, "new"]
+
+
+@queue_cases
+def test_extend_from_error(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that a queue can't be extended with itself or a deque, which is kept."""
+    queue = Queue(items)
+    with pytest.raises(ValueError, match="can't extend a queue with itself"):
+        queue.extend_from(queue)
+    deque = LinkedListDeque(items)
+    with pytest.raises(TypeError, match="can't extend a queue with a LinkedListDeque"):
+        queue.extend_from(deque)  # ty: ignore[invalid-argument-type]
+    assert str(queue) == f"{Queue.__name__}({list(items)})"
+    assert str(deque) == f"LinkedListDeque({list(items)})"
+
+
+@queue_cases
+def test_pool(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that a queue with a pool of nodes keeps the right members."""
+    for pool_size in (1, len(items), 2 * len(items)):
+        queue = Queue(items, pool_size=pool_size)
+        for _ in range(3):
+            assert [queue.dequeue() for _ in items] == list(items)
+            check_is_empty(queue)
+            for item in items:
+                queue.enqueue(item)
+            assert list(queue) == list(items)
+            assert str(queue) == f"{Queue.__name__}({list(items)})"
+
+
+@queue_cases
+def test_pool_many(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that the bulk operations of a queue with a pool keep the right members."""
+    for pool_size in (1, len(items), 2 * len(items)):
+        queue = Queue(items, pool_size=pool_size)
+        for _ in range(3):
+            assert queue.dequeue_many(2) == list(items[:2])
+            assert queue.drain() == list(items[2:])
+            check_is_empty(queue)
+            queue.enqueue_many(items)
+            assert list(queue) == list(items)
+        copied = unpickle(pickle.dumps(queue))
+        assert copied.drain() == list(items)
+        copied.enqueue_many(items)
+        assert str(copied) == f"{Queue.__name__}({list(items)})"
+
+
+@queue_cases
+def test_iter(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that iterating over a queue goes from front to back, without dequeuing."""
+    queue = Queue(items)
+    assert list(queue) == list(items)
+    assert queue.size() == len(items)
+    assert list(Queue()) == []
+
+
+@queue_cases
+def test_repr(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that the repr of a queue has the size, the front and back members."""
+    members = [repr(item) for item in items]
+    if len(items) > 4:  # noqa: PLR2004
+        members = [*members[:3], "...", members[-1]]
+    expected = f"<{Queue.__name__}: size {len(items)}, [{', '.join(members)}]>"
+    assert repr(Queue(items)) == expected
+    assert repr(Queue()) == f"<{Queue.__name__}: size 0, []>"
+
+
+@queue_cases
+def test_sort(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `sort()` puts the members in non-decreasing order."""
+    comparable = [item for item in items if item is not None]
+    queue = Queue(comparable[::-1] + comparable)
+    queue.sort()
+    assert str(queue) == f"{Queue.__name__}({sorted(comparable * 2)})"
+    for item in sorted(comparable * 2):
+        assert queue.dequeue() == item
+    check_is_empty(queue)
+    queue.sort()
+    check_is_empty(queue)
+    # Equal members like 1, True and 1.0 must keep their order.
+    queue = Queue([2, 1, True, 1.0, 0])
+    queue.sort()
+    assert str(queue) == f"{Queue.__name__}([0, 1, True, 1.0, 2])"
+
+
 # Test the combined behaviour of modifiers.
 
 
+@queue_cases
 def test_fifo(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
     """Test the first-in first-out behaviour of the queue."""
     queue = Queue()
@@ -81,3 +265,701 @@ def test_fifo(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
     for item in items:
         assert queue.dequeue() == item
     check_is_empty(queue)
+
+
+# Test copying and pickling.
+
+
+@queue_cases
+def test_copy(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that copies and unpickled queues are independent of the original."""
+    queue = Queue(items, pool_size=2)
+    copies = [copy.copy(queue), copy.deepcopy(queue)]
+    copies += [unpickle(pickle.dumps(queue, protocol)) for protocol in PROTOCOLS]
+    for copied in copies:
+        assert str(copied) == str(queue)
+        copied.enqueue(None)
+        for item in [*items, None]:
+            assert copied.dequeue() == item
+        check_is_empty(copied)
+    assert str(queue) == f"{Queue.__name__}({list(items)})"
+    nested = Queue([[item] for item in items])
+    shallow = copy.copy(nested)
+    deep = copy.deepcopy(nested)
+    assert shallow.front() is nested.front()
+    assert deep.front() is not nested.front()
+    assert deep.front() == nested.front()
+
+
+@queue_cases
+def test_copy_large(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test copying and pickling queues with many members."""
+    large = list(items) * 5_000
+    queue = Queue(large)
+    for copied in (copy.deepcopy(queue), unpickle(pickle.dumps(queue))):
+        assert copied.size() == len(large)
+        assert str(copied) == str(queue)
+
+
+@queue_cases
+def test_weakref(Queue: type[QueueADT], items: Sequence) -> None:  # noqa: N803
+    """Test that queues can be weakly referenced, e.g. in caches."""
+    queue = Queue(items)
+    reference = weakref.ref(queue)
+    assert reference() is queue
+    del queue
+    assert reference() is None
+
+
+# Tests for `AsyncQueue`, shared by `asyncio` coroutines.
+
+
+async def check_async_is_empty(queue: AsyncQueue) -> None:
+    """Test that the queue is empty.
+
+    The queue's coroutines must only be awaited in one event loop.
+    """
+    assert queue.size() == 0
+    with pytest.raises(ValueError, match="can't access the front of an empty queue"):
+        queue.front()
+    with pytest.raises(ValueError, match="can't dequeue from an empty queue"):
+        await queue.dequeue(0.01)
+    assert await queue.dequeue_batch(2, 0) == []
+    assert str(queue) == "AsyncQueue([])"
+
+
+def new_capacity(spare: int | None, items: Sequence) -> int | None:
+    """Return the capacity for a queue of `items` with `spare` free places."""
+    return None if spare is None else len(items) + spare
+
+
+# Execute each test for all combinations of these parameter values.
+async_cases = pytest.mark.parametrize(
+    ("spare", "items"), list(itertools.product([None, 0, 5], ITEMS))
+)
+
+# Test the creation method.
+
+
+@async_cases
+def test_async_init_empty(spare: int | None, items: Sequence) -> None:
+    """Test the creation of empty queues."""
+    queue = AsyncQueue(new_capacity(spare, items))
+    assert queue.capacity() == new_capacity(spare, items)
+    asyncio.run(check_async_is_empty(queue))
+
+
+@async_cases
+def test_async_init_iterable(spare: int | None, items: Sequence) -> None:
+    """Test the creation of queues from items."""
+    queue = AsyncQueue(new_capacity(spare, items), items)
+    assert queue.size() == len(items)
+    assert queue.front() == items[0]
+    assert str(queue) == f"AsyncQueue({list(items)})"
+
+
+@async_cases
+def test_async_init_error(spare: int | None, items: Sequence) -> None:  # noqa: ARG001
+    """Test that a queue can't be created with too little capacity."""
+    with pytest.raises(ValueError, match="can't create a queue with capacity 0"):
+        AsyncQueue(0)
+    with pytest.raises(ValueError, match="more members than its capacity"):
+        AsyncQueue(len(items) - 1, items)
+
+
+# Test the modifiers.
+
+
+@async_cases
+def test_async_fifo(spare: int | None, items: Sequence) -> None:
+    """Test the first-in first-out behaviour of queues."""
+    queue = AsyncQueue(new_capacity(spare, items))
+
+    async def enqueue_dequeue() -> None:
+        """Enqueue all items and then dequeue them."""
+        for item in items:
+            await queue.enqueue(item)
+        assert [await queue.dequeue() for _ in items] == list(items)
+        await check_async_is_empty(queue)
+
+    asyncio.run(enqueue_dequeue())
+
+
+@async_cases
+def test_async_full(spare: int | None, items: Sequence) -> None:
+    """Test that enqueuing onto a full queue fails after the timeout."""
+    if spare is None:
+        pytest.skip("a queue without capacity is never full")
+    queue = AsyncQueue(len(items), items)
+    with pytest.raises(ValueError, match="can't enqueue onto a full queue"):
+        asyncio.run(queue.enqueue("new", 0.01))
+    assert str(queue) == f"AsyncQueue({list(items)})"
+
+
+@async_cases
+def test_async_waits(spare: int | None, items: Sequence) -> None:
+    """Test that operations wait for another coroutine to enqueue or dequeue."""
+    queue = AsyncQueue(new_capacity(spare, items))
+
+    async def produce() -> None:
+        """Enqueue all items, one at a time, and then one more."""
+        for item in items:
+            await asyncio.sleep(0)
+            await queue.enqueue(item)
+        await queue.enqueue("last")
+
+    async def consume() -> list:
+        """Start the producer and dequeue the items it produces."""
+        producer = asyncio.create_task(produce())
+        consumed = [await queue.dequeue(1) for _ in items]
+        await producer
+        return consumed
+
+    assert asyncio.run(consume()) == list(items)
+    assert str(queue) == "AsyncQueue(['last'])"
+
+
+@async_cases
+def test_async_fairness(spare: int | None, items: Sequence) -> None:
+    """Test that waiting consumers get members in the order they started waiting."""
+    queue = AsyncQueue(new_capacity(spare, items))
+
+    async def consume() -> list:
+        """Start a consumer per item and enqueue the items once they all wait."""
+        consumers = []
+        for _ in items:
+            consumers.append(asyncio.create_task(queue.dequeue()))
+            await asyncio.sleep(0)
+        for item in items:
+            await queue.enqueue(item)
+        return [await consumer for consumer in consumers]
+
+    assert asyncio.run(consume()) == list(items)
+
+
+@async_cases
+def test_async_cancelled_waiter(spare: int | None, items: Sequence) -> None:
+    """Test that a consumer cancelled after being notified doesn't lose the member."""
+    queue = AsyncQueue(new_capacity(spare, items))
+
+    async def consume() -> Any:
+        """Cancel the first of two waiting consumers once a member is enqueued."""
+        cancelled = asyncio.create_task(queue.dequeue())
+        waiting = asyncio.create_task(queue.dequeue(1))
+        await asyncio.sleep(0)
+        await queue.enqueue(items[0])
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        item = await waiting
+        await check_async_is_empty(queue)
+        return item
+
+    assert asyncio.run(consume()) == items[0]
+
+
+@async_cases
+def test_async_dequeue_batch(spare: int | None, items: Sequence) -> None:
+    """Test dequeuing members in batches, with and without a timeout."""
+    queue = AsyncQueue(new_capacity(spare, items), items)
+
+    async def produce() -> None:
+        """Enqueue all items, one at a time."""
+        for item in items:
+            await asyncio.sleep(0.001)
+            await queue.enqueue(item)
+
+    async def consume() -> None:
+        """Dequeue the initial members and then all produced items as one batch."""
+        assert await queue.dequeue_batch(2, 0) == list(items[:2])
+        assert await queue.dequeue_batch(len(items), 0.01) == list(items[2:])
+        await check_async_is_empty(queue)
+        producer = asyncio.create_task(produce())
+        assert await queue.dequeue_batch(len(items)) == list(items)
+        await producer
+
+    asyncio.run(consume())
+
+
+@async_cases
+def test_async_producers_consumers(spare: int | None, items: Sequence) -> None:
+    """Test that all items go through a queue with several producers and consumers."""
+    queue = AsyncQueue(None if spare is None else spare + 1)
+
+    async def produce() -> None:
+        """Enqueue all items."""
+        for item in items:
+            await queue.enqueue(item)
+
+    async def consume() -> list:
+        """Dequeue as many members as one producer enqueues."""
+        return [await queue.dequeue() for _ in items]
+
+    async def run() -> list:
+        """Run 3 producers and 3 consumers concurrently."""
+        producers = [asyncio.create_task(produce()) for _ in range(3)]
+        batches = await asyncio.gather(*[consume() for _ in range(3)])
+        await asyncio.gather(*producers)
+        return [item for batch in batches for item in batch]
+
+    assert sorted(asyncio.run(run()), key=repr) == sorted(list(items) * 3, key=repr)
+    assert queue.size() == 0
+
+
+# Test pickling.
+
+
+@async_cases
+def test_async_pickle(spare: int | None, items: Sequence) -> None:
+    """Test that unpickled queues work in a new event loop, with every protocol."""
+    queue = AsyncQueue(new_capacity(spare, items), items)
+
+    async def take_all(copied: AsyncQueue) -> list:
+        """Take all members of the unpickled queue."""
+        return [await copied.dequeue() for _ in items]
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(queue, protocol))  # noqa: S301 (the data isn't untrusted)
+        assert copied.capacity() == queue.capacity()
+        assert asyncio.run(take_all(copied)) == list(items)
+        asyncio.run(check_async_is_empty(copied))
+    assert str(queue) == f"AsyncQueue({list(items)})"
+    reference = weakref.ref(queue)
+    del queue
+    assert reference() is None
+
+
+# Tests for `BoundedQueue`, shared by several threads.
+
+
+def check_bounded_is_empty(queue: BoundedQueue) -> None:
+    """Test that the queue is empty."""
+    assert queue.size() == 0
+    with pytest.raises(ValueError, match="can't access the front of an empty queue"):
+        queue.front()
+    with pytest.raises(ValueError, match="can't dequeue from an empty queue"):
+        queue.dequeue(0)
+    assert str(queue) == "BoundedQueue([])"
+
+
+def later(function: Callable, *args: Any) -> threading.Timer:
+    """Start a thread that calls `function(*args)` after a short delay."""
+    timer = threading.Timer(0.01, function, args)
+    timer.start()
+    return timer
+
+
+# Execute each test for all combinations of these parameter values.
+POLICIES = ["reject", "block", "drop_oldest", "drop_newest"]
+bounded_cases = pytest.mark.parametrize(
+    ("policy", "items"), list(itertools.product(POLICIES, ITEMS))
+)
+
+# Test the creation method.
+
+
+@bounded_cases
+def test_bounded_init_empty(policy: str, items: Sequence) -> None:  # noqa: ARG001
+    """Test the creation of empty queues.
+
+    Ignore `items` as it's not needed for this one test.
+    """
+    queue = BoundedQueue(1, policy)
+    assert queue.capacity() == 1
+    assert queue.high_water_mark() == queue.dropped() == 0
+    check_bounded_is_empty(queue)
+
+
+@bounded_cases
+def test_bounded_init_iterable(policy: str, items: Sequence) -> None:
+    """Test the creation of full queues from items."""
+    queue = BoundedQueue(len(items), policy, items)
+    assert queue.size() == queue.high_water_mark() == len(items)
+    assert queue.front() == items[0]
+    assert str(queue) == f"BoundedQueue({list(items)})"
+
+
+@bounded_cases
+def test_bounded_init_error(policy: str, items: Sequence) -> None:
+    """Test that a queue can't be created with wrong arguments."""
+    with pytest.raises(
+        ValueError, match="can't create a bounded queue with capacity 0"
+    ):
+        BoundedQueue(0, policy)
+    with pytest.raises(ValueError, match="can't use unknown overflow policy 'wait'"):
+        BoundedQueue(1, "wait", items)
+    if policy in ("reject", "block"):
+        with pytest.raises(ValueError, match="can't enqueue onto a full queue"):
+            BoundedQueue(len(items) - 1, policy, items)
+
+
+# Test the modifiers.
+
+
+@bounded_cases
+def test_bounded_fifo(policy: str, items: Sequence) -> None:
+    """Test the first-in first-out behaviour of queues."""
+    queue = BoundedQueue(len(items), policy)
+    for item in items:
+        queue.enqueue(item)
+    for item in items:
+        assert queue.dequeue() == item
+    check_bounded_is_empty(queue)
+    assert queue.high_water_mark() == len(items)
+    assert queue.dropped() == 0
+
+
+@bounded_cases
+def test_bounded_full(policy: str, items: Sequence) -> None:
+    """Test enqueuing onto a full queue, following each overflow policy."""
+    queue = BoundedQueue(len(items), policy, items)
+    if policy in ("reject", "block"):
+        with pytest.raises(ValueError, match="can't enqueue onto a full queue"):
+            queue.enqueue("new", 0.01)
+        expected = list(items)
+        dropped = 0
+    elif policy == "drop_oldest":
+        queue.enqueue("new")
+        expected = [*items[1:], "new"]
+        dropped = 1
+    else:
+        queue.enqueue("new")
+        expected = list(items)
+        dropped = 1
+    assert queue.dropped() == dropped
+    assert queue.high_water_mark() == len(items)
+    assert str(queue) == f"BoundedQueue({expected})"
+
+
+# Test the waiting of dequeue and enqueue.
+
+
+@bounded_cases
+def test_bounded_dequeue_waits(policy: str, items: Sequence) -> None:
+    """Test that dequeuing from an empty queue waits for an item to be enqueued."""
+    queue = BoundedQueue(len(items), policy)
+    later(queue.enqueue, items[0])
+    assert queue.dequeue(5) == items[0]
+    check_bounded_is_empty(queue)
+
+
+@bounded_cases
+def test_bounded_enqueue_waits(policy: str, items: Sequence) -> None:
+    """Test that enqueuing onto a full queue waits with the 'block' policy."""
+    if policy != "block":
+        pytest.skip("only the 'block' policy waits")
+    queue = BoundedQueue(len(items), policy, items)
+    later(queue.dequeue)
+    queue.enqueue("new", 5)
+    assert str(queue) == f"BoundedQueue({[*items[1:], 'new']})"
+
+
+@bounded_cases
+def test_bounded_producer_consumer(policy: str, items: Sequence) -> None:
+    """Test that all items go from a producer thread to a consumer thread."""
+    if policy != "block":
+        pytest.skip("only the 'block' policy doesn't lose items")
+    queue = BoundedQueue(2, policy)
+    consumed = []
+
+    def consume() -> None:
+        """Dequeue all items."""
+        for _ in items:
+            consumed.append(queue.dequeue(5))  # noqa: PERF401
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for item in items:
+        queue.enqueue(item, 5)
+    consumer.join()
+    assert consumed == list(items)
+    assert queue.high_water_mark() <= 2  # noqa: PLR2004
+    check_bounded_is_empty(queue)
+
+
+@bounded_cases
+def test_bounded_weakref(policy: str, items: Sequence) -> None:
+    """Test that queues can be weakly referenced, e.g. in caches."""
+    queue = BoundedQueue(len(items), policy, items)
+    reference = weakref.ref(queue)
+    assert reference() is queue
+    del queue
+    assert reference() is None
+
+
+# Test the inspectors.
+
+
+@bounded_cases
+def test_bounded_iter_repr(policy: str, items: Sequence) -> None:
+    """Test iterating over a queue and its short representation."""
+    queue = BoundedQueue(len(items), policy, items)
+    members = iter(queue)
+    queue.dequeue()
+    assert list(members) == list(items)
+    assert list(queue) == list(items[1:])
+    members = [repr(item) for item in items[1:]]
+    if len(members) > 4:  # noqa: PLR2004
+        members = [*members[:3], "...", members[-1]]
+    assert (
+        repr(queue) == f"<BoundedQueue: size {len(items) - 1}, [{', '.join(members)}]>"
+    )
+    assert repr(BoundedQueue(1, policy)) == "<BoundedQueue: size 0, []>"
+
+
+# Tests for `SharedMemoryQueue`, shared by two processes.
+
+
+@contextmanager
+def new_shared_queue(
+    capacity: int, record_size: int, sequence: Sequence[bytes] = []
+) -> Generator[SharedMemoryQueue]:
+    """Create a queue and free its shared memory after its use."""
+    queue = SharedMemoryQueue(capacity, record_size, sequence)
+    try:
+        yield queue
+    finally:
+        queue.close()
+        queue.unlink()
+
+
+def check_shared_is_empty(queue: SharedMemoryQueue) -> None:
+    """Test that the queue is empty."""
+    assert queue.size() == 0
+    with pytest.raises(ValueError, match="can't access the front of an empty queue"):
+        queue.front(0)
+    with pytest.raises(ValueError, match="can't dequeue from an empty queue"):
+        queue.dequeue(0)
+    with pytest.raises(ValueError, match="can't discard the front of an empty queue"):
+        queue.discard()
+    assert str(queue) == "SharedMemoryQueue([])"
+
+
+def produce_records(queue: SharedMemoryQueue, items: Sequence[bytes]) -> None:
+    """Enqueue the items, in another process, and stop using the queue."""
+    for item in items:
+        queue.enqueue(item, 5)
+    queue.close()
+
+
+# Execute each test for all combinations of these parameter values.
+RECORDS = [
+    [b"abcd", b"", b"xyz"],
+    [bytes(range(length)) for length in range(20)],
+    [struct.pack("<qd", number, number / 2) for number in range(5)],
+]
+shared_cases = pytest.mark.parametrize("items", RECORDS)
+
+# Test the creation methods.
+
+
+@shared_cases
+def test_shared_init_empty(items: Sequence[bytes]) -> None:
+    """Test the creation of empty queues."""
+    record_size = max(len(item) for item in items)
+    with new_shared_queue(1, record_size) as queue:
+        assert queue.capacity() == 1
+        assert queue.record_size() == record_size
+        check_shared_is_empty(queue)
+
+
+@shared_cases
+def test_shared_init_iterable(items: Sequence[bytes]) -> None:
+    """Test the creation of full queues from items."""
+    with new_shared_queue(len(items), 20, items) as queue:
+        assert queue.size() == len(items)
+        assert queue.front() == items[0]
+        assert str(queue) == f"SharedMemoryQueue({list(items)})"
+
+
+@shared_cases
+def test_shared_init_error(items: Sequence[bytes]) -> None:
+    """Test that a queue can't be created with wrong arguments."""
+    with pytest.raises(
+        ValueError, match="can't create a shared memory queue with capacity 0"
+    ):
+        SharedMemoryQueue(0, 1)
+    with pytest.raises(
+        ValueError, match="can't create a shared memory queue with record size 0"
+    ):
+        SharedMemoryQueue(1, 0)
+    with pytest.raises(ValueError, match="can't enqueue onto a full queue"):
+        SharedMemoryQueue(len(items) - 1, 20, items)
+
+
+@shared_cases
+def test_shared_attach(items: Sequence[bytes]) -> None:
+    """Test that queues attached to the same shared memory share the members."""
+    with new_shared_queue(len(items), 20) as queue:
+        other = SharedMemoryQueue.attach(queue.name())
+        copy = pickle.loads(pickle.dumps(queue))  # noqa: S301
+        for item in items:
+            other.enqueue(item)
+        assert copy.size() == queue.size() == len(items)
+        assert copy.dequeue() == items[0]
+        assert queue.size() == len(items) - 1
+        other.close()
+        copy.close()
+        reference = weakref.ref(copy)
+        del copy
+        assert reference() is None
+
+
+@shared_cases
+def test_shared_drop(items: Sequence[bytes], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a queue can be dropped without closing it, or closed by `with`."""
+    unraisable: list = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+    with new_shared_queue(len(items), 20, items) as queue:
+        other = SharedMemoryQueue.attach(queue.name())
+        assert other.front() == items[0]
+        del other
+        with SharedMemoryQueue.attach(queue.name()) as other:
+            assert other.dequeue() == items[0]
+        assert queue.size() == len(items) - 1
+    assert unraisable == []
+
+
+@shared_cases
+def test_shared_attach_process(items: Sequence[bytes]) -> None:
+    """Test that an unrelated process that attaches doesn't free the memory."""
+    with new_shared_queue(len(items), 20) as queue:
+        code = (
+            "from paddles import SharedMemoryQueue\n"
+            f"queue = SharedMemoryQueue.attach({queue.name()!r})\n"
+            f"for item in {list(items)!r}:\n"
+            "    queue.enqueue(item)\n"
+            "queue.close()\n"
+        )
+        # Capturing the output also waits for the process's resource tracker,
+        # which would free the memory and warn about it when the process ends.
+        process = subprocess.run(  # noqa: S603 (the code is the test's own)
+            [sys.executable, "-c", code], capture_output=True, check=True
+        )
+        assert process.stderr == b""
+        other = SharedMemoryQueue.attach(queue.name())
+        assert [other.dequeue() for _ in items] == list(items)
+        other.close()
+
+
+@shared_cases
+def test_shared_machine_warning(
+    items: Sequence[bytes], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that queues warn on processors that may reorder writes."""
+    with new_shared_queue(len(items), 20, items) as queue:
+        monkeypatch.setattr(platform, "machine", lambda: "arm64")
+        message = "records may be read before they're written on arm64 machines"
+        with pytest.warns(RuntimeWarning, match=message):
+            other = SharedMemoryQueue.attach(queue.name())
+        with pytest.warns(RuntimeWarning, match=message), new_shared_queue(1, 1):
+            pass
+        assert other.dequeue() == items[0]
+        other.close()
+
+
+# Test the modifiers.
+
+
+@shared_cases
+def test_shared_fifo(items: Sequence[bytes]) -> None:
+    """Test the first-in first-out behaviour of queues."""
+    with new_shared_queue(2, 20) as queue:
+        # The queue is smaller than the items, so that its slots are reused.
+        for item in items:
+            queue.enqueue(item)
+            assert queue.dequeue() == item
+        check_shared_is_empty(queue)
+
+
+@shared_cases
+def test_shared_front_discard(items: Sequence[bytes]) -> None:
+    """Test that the front member can be read and removed without copying it."""
+    with new_shared_queue(len(items), 20, items) as queue:
+        for item in items:
+            view = queue.front()
+            assert view.readonly
+            assert view == item
+            view.release()
+            queue.discard()
+        check_shared_is_empty(queue)
+
+
+@shared_cases
+def test_shared_iter_repr(items: Sequence[bytes]) -> None:
+    """Test iterating over a queue and its short representation."""
+    with new_shared_queue(len(items), 20, items) as queue:
+        # Move the members along the slots, so that the back one wraps around.
+        queue.enqueue(queue.dequeue())
+        rotated = [*items[1:], items[0]]
+        members = iter(queue)
+        queue.discard()
+        assert list(members) == rotated
+        assert list(queue) == rotated[1:]
+        members = [repr(item) for item in rotated[1:]]
+        if len(members) > 4:  # noqa: PLR2004
+            members = [*members[:3], "...", members[-1]]
+        assert repr(queue) == (
+            f"<SharedMemoryQueue: size {len(items) - 1}, [{', '.join(members)}]>"
+        )
+    with new_shared_queue(1, 1) as queue:
+        assert repr(queue) == "<SharedMemoryQueue: size 0, []>"
+
+
+@shared_cases
+def test_shared_full(items: Sequence[bytes]) -> None:
+    """Test that enqueuing onto a full queue fails after the timeout."""
+    with new_shared_queue(len(items), 20, items) as queue:
+        with pytest.raises(ValueError, match="can't enqueue onto a full queue"):
+            queue.enqueue(b"new", 0.01)
+        assert str(queue) == f"SharedMemoryQueue({list(items)})"
+
+
+@shared_cases
+def test_shared_record_size_error(items: Sequence[bytes]) -> None:
+    """Test that a queue can't have members larger than the record size."""
+    record_size = max(len(item) for item in items)
+    message = f"can't enqueue {record_size + 1} bytes into records of {record_size}"
+    with new_shared_queue(1, record_size) as queue:
+        with pytest.raises(ValueError, match=message):
+            queue.enqueue(bytes(record_size + 1))
+        check_shared_is_empty(queue)
+
+
+# Test the waiting of dequeue, front and enqueue.
+
+
+@shared_cases
+def test_shared_dequeue_waits(items: Sequence[bytes]) -> None:
+    """Test that dequeuing from an empty queue waits for an item to be enqueued."""
+    with new_shared_queue(len(items), 20) as queue:
+        later(queue.enqueue, items[0])
+        assert queue.front(5) == items[0]
+        later(queue.enqueue, items[-1])
+        assert queue.dequeue(5) == items[0]
+        assert queue.dequeue(5) == items[-1]
+        check_shared_is_empty(queue)
+
+
+@shared_cases
+def test_shared_enqueue_waits(items: Sequence[bytes]) -> None:
+    """Test that enqueuing onto a full queue waits for a member to be dequeued."""
+    with new_shared_queue(len(items), 20, items) as queue:
+        later(queue.dequeue)
+        queue.enqueue(b"new", 5)
+        assert str(queue) == f"SharedMemoryQueue({[*items[1:], b'new']})"
+
+
+@shared_cases
+def test_shared_producer_consumer(items: Sequence[bytes]) -> None:
+    """Test that all items go from a producer process to a consumer process."""
+    with new_shared_queue(2, 20) as queue:
+        # Spawn a new interpreter, to which the queue is passed by pickling.
+        context = multiprocessing.get_context("spawn")
+        producer = context.Process(target=produce_records, args=(queue, items))
+        producer.start()
+        consumed = [queue.dequeue(5) for _ in items]
+        producer.join()
+        assert consumed == list(items)
+        assert producer.exitcode == 0
+        check_shared_is_empty(queue)
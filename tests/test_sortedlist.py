@@ -0,0 +1,169 @@
+"""Closed-box unit tests for all Sorted List ADT implementations."""
+
+import pickle
+import random
+import weakref
+from collections.abc import Sequence
+
+import pytest
+
+from paddles import ChunkedSortedList
+
+# Helper functions: can't be named test_... or pytest will call them directly.
+
+SortedListADT = ChunkedSortedList
+
+
+def check_is_empty(sorted_list: SortedListADT) -> None:
+    """Test that the sorted list is empty."""
+    assert sorted_list.size() == 0
+    assert not sorted_list.has(0)
+    assert sorted_list.frequency(0) == 0
+    assert list(sorted_list.between(0, 1)) == []
+    with pytest.raises(ValueError, match="can't find the index of a non-member"):
+        sorted_list.index(0)
+    with pytest.raises(ValueError, match="can't remove a non-member"):
+        sorted_list.remove(0)
+    assert str(sorted_list) == f"{sorted_list.__class__.__name__}([])"
+
+
+def check_members(sorted_list: SortedListADT, members: list) -> None:
+    """Test that the sorted list has exactly the given members."""
+    members = sorted(members)
+    assert sorted_list.size() == len(members)
+    assert str(sorted_list) == f"{sorted_list.__class__.__name__}({members})"
+    first = 0  # the index of the first copy of the current member
+    for index in range(1, len(members) + 1):
+        if index == len(members) or members[index] != members[first]:
+            assert sorted_list.has(members[first])
+            assert sorted_list.frequency(members[first]) == index - first
+            assert sorted_list.index(members[first]) == first
+            first = index
+
+
+# Some tests use over 2000 members, so that chunks are split and joined.
+LARGE = list(range(2500)) * 2
+random.seed(0)
+random.shuffle(LARGE)
+
+pytestmark = [
+    pytest.mark.parametrize("SortedList", [ChunkedSortedList]),
+    pytest.mark.parametrize("items", [
+        "", [], "x", [1],                       # empty and singleton sequences
+        "picnic", range(20), [True] * 10,       # some/no/all items equal
+        [3, 1, 2, 3, 1], LARGE                  # duplicates, large
+    ]),
+]  # fmt: skip
+
+# Test the creation methods.
+
+
+def test_init_empty(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803 ARG001
+    """Test the creation of empty sorted lists. Ignore the items for this test."""
+    check_is_empty(SortedList())
+
+
+def test_init_iterable(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803
+    """Test the creation of sorted lists from sequences and iterators."""
+    check_members(SortedList(items), list(items))
+    check_members(SortedList(iter(items)), list(items))
+
+
+# Test each modifier method separately.
+
+
+def test_add(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `add(item)` puts `item` in its position."""
+    sorted_list = SortedList()
+    for item in items:
+        before = sorted_list.size()
+        sorted_list.add(item)
+        assert sorted_list.size() == before + 1
+        assert sorted_list.has(item)
+    check_members(sorted_list, list(items))
+
+
+def test_remove(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `remove(item)` removes one copy of `item`."""
+    sorted_list = SortedList(items)
+    remaining = sorted(items)
+    for item in items:
+        before = sorted_list.frequency(item)
+        sorted_list.remove(item)
+        assert sorted_list.frequency(item) == before - 1
+        remaining.remove(item)
+        assert sorted_list.size() == len(remaining)
+    check_is_empty(sorted_list)
+
+
+def test_update(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `update(items)` adds all items."""
+    sorted_list = SortedList(items)
+    sorted_list.update([])
+    check_members(sorted_list, list(items))
+    sorted_list.update(items)
+    check_members(sorted_list, list(items) * 2)
+
+
+# Test the combined behaviour of modifiers and the range iteration.
+
+
+def test_between(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `between(low, high)` iterates over the members in that range."""
+    sorted_list = SortedList()
+    for item in items:
+        sorted_list.add(item)
+    members = sorted(items)
+    # Use at most 20 values as bounds, including the smallest and largest members.
+    bounds = set(members[:: len(members) // 20 + 1] + members[-1:])
+    for low in bounds:
+        for high in bounds:
+            expected = [member for member in members if low <= member < high]
+            assert list(sorted_list.between(low, high)) == expected
+
+
+def test_add_remove(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803
+    """Test adding and removing members in turn."""
+    sorted_list = SortedList(items)
+    members = list(items)
+    for item in items[: len(items) // 2]:
+        sorted_list.remove(item)
+        members.remove(item)
+        sorted_list.add(item)
+        sorted_list.add(item)
+        members.extend([item, item])
+    check_members(sorted_list, members)
+
+
+def test_add_remove_many(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803 ARG001
+    """Test adding many members in one place and removing many in another.
+
+    Ignore the items: this test uses numbers, to add members in between others.
+    """
+    sorted_list = SortedList(range(2000))
+    members: list[float] = list(range(2000))
+    for number in range(1000, 2000):
+        sorted_list.add(number + 0.5)
+        members.append(number + 0.5)
+    for number in range(600):
+        sorted_list.remove(number)
+        members.remove(number)
+    check_members(sorted_list, members)
+
+
+# Test pickling.
+
+
+def test_pickle(SortedList: type[SortedListADT], items: Sequence) -> None:  # noqa: N803
+    """Test that unpickled sorted lists work like the original, with every protocol."""
+    sorted_list = SortedList(items)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(sorted_list, protocol))  # noqa: S301 (the data isn't untrusted)
+        check_members(copied, list(items))
+        for item in items:
+            copied.add(item)
+        check_members(copied, list(items) * 2)
+    check_members(sorted_list, list(items))
+    reference = weakref.ref(sorted_list)
+    del sorted_list
+    assert reference() is None
@@ -1,10 +1,16 @@
 """Closed-box unit tests for all sorting algorithms."""
 
+import array
+import itertools
+import logging
+import math
+import random
 from collections.abc import Callable, Iterable, Sequence
 
 import pytest
 
 from paddles.sorting import *
+from paddles.sorting import is_non_decreasing, merge
 
 # Functions named `..._sort` take a list and sort it in place.
 SortFunction = Callable[[list], None]
@@ -37,7 +43,8 @@ SEQUENCES = [
 
 
 @pytest.mark.parametrize(
-    "sort_function", [bogo_sort, bubble_sort, insertion_sort, selection_sort]
+    "sort_function",
+    [bogo_sort, bubble_sort, heap_sort, insertion_sort, selection_sort, shell_sort],
 )
 @pytest.mark.parametrize("to_sort", LISTS)
 def test_sort(sort_function: SortFunction, to_sort: list) -> None:
@@ -57,6 +64,43 @@ def test_sorted(sorted_function: SortedFunction, to_sort: Sequence) -> None:
     assert sorted_function(to_sort) == sorted(to_sort)
 
 
+@pytest.mark.parametrize("gaps", ["ciura", "tokuda", "sedgewick"])
+@pytest.mark.parametrize("to_sort", [*LISTS, list(range(2000, 0, -1))])
+def test_shell_sort(gaps: str, to_sort: list) -> None:
+    """Test Shell Sort with each gap sequence, including a list with large gaps."""
+    copied = list(to_sort)
+    shell_sort(copied, gaps)
+    assert copied == sorted(to_sort)
+
+
+def test_shell_sort_error() -> None:
+    """Test Shell Sort with an unknown gap sequence."""
+    with pytest.raises(ValueError, match="Cannot use unknown gap sequence 'pratt'"):
+        shell_sort([2, 1], "pratt")
+
+
+@pytest.mark.parametrize("items", LISTS + SEQUENCES)
+def test_lazy_quick_sorted(items: Sequence) -> None:
+    """Test generating all items of a sequence and of a generator in order."""
+    assert list(lazy_quick_sorted(items)) == sorted(items)
+    assert list(lazy_quick_sorted(item for item in items)) == sorted(items)
+
+
+def test_lazy_quick_sorted_early_stop() -> None:
+    """Test that generating only the smallest items does less work than sorting."""
+    random.seed(0)
+    items = random.sample(range(10_000), 10_000)
+
+    def first_ten(items: list) -> list:
+        """Return the 10 smallest items."""
+        return list(itertools.islice(lazy_quick_sorted(items), 10))
+
+    smallest_ten, counts = count_operations(first_ten, items)
+    assert smallest_ten == list(range(10))
+    _, all_counts = count_operations(lazy_quick_sorted, items)
+    assert counts["comparisons"] < all_counts["comparisons"] / 3
+
+
 @pytest.mark.parametrize("items", LISTS + SEQUENCES)
 def test_quick_select(items: Sequence) -> None:
     """Select the k-th smallest item of a non-empty sequence, for all possible k."""
@@ -71,3 +115,284 @@ def test_quick_select_error(items: Sequence) -> None:
     for k in (-1, 0, len(items) + 1):
         with pytest.raises(ValueError):  # noqa: PT011
             quick_select(items, k)
+
+
+@pytest.mark.parametrize("items", LISTS + SEQUENCES)
+def test_smallest(items: Sequence) -> None:
+    """Select the k smallest items of a sequence and a generator, for all k."""
+    for k in range(len(items) + 2):
+        assert smallest(items, k) == sorted(items)[:k]
+        assert smallest((item for item in items), k) == sorted(items)[:k]
+    with pytest.raises(ValueError, match="Cannot select -1 smallest items"):
+        smallest(items, -1)
+
+
+@pytest.mark.parametrize("to_sort", LISTS)
+def test_partial_sort(to_sort: list) -> None:
+    """Sort the k smallest items of a list in-place, for all possible k."""
+    for k in range(len(to_sort) + 1):
+        copied = list(to_sort)
+        partial_sort(copied, k)
+        assert copied[:k] == sorted(to_sort)[:k]
+        assert sorted(copied) == sorted(to_sort)
+    for k in (-1, len(to_sort) + 1):
+        with pytest.raises(ValueError):  # noqa: PT011
+            partial_sort(list(to_sort), k)
+
+
+ALGORITHMS = [
+    bubble_sort, heap_sort, insertion_sort, selection_sort, shell_sort,
+    merge_sorted, quick_sorted, quick_sorted_3way, None,
+]  # fmt: skip
+
+WORDS = ["pear", "fig", "apple", "kiwi", "date", "banana", "plum", "lime", "", "b"]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_keyed_sorted(algorithm: Callable | None) -> None:
+    """Test sorting by a key, which must be called once per item."""
+    calls = []
+
+    def length(word: str) -> int:
+        """Return the length of `word` and record the call."""
+        calls.append(word)
+        return len(word)
+
+    assert keyed_sorted(WORDS, length, algorithm) == sorted(WORDS, key=len)
+    assert sorted(calls) == sorted(WORDS)
+    copied = list(WORDS)
+    keyed_sort(copied, len, algorithm)
+    assert copied == sorted(WORDS, key=len)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("items", LISTS + SEQUENCES)
+def test_argsort(algorithm: Callable | None, items: Sequence) -> None:
+    """Test computing the sorting order of items, with and without a key."""
+    indices = list(range(len(items)))
+    assert argsort(items, algorithm=algorithm) == sorted(
+        indices, key=lambda index: items[index]
+    )
+    assert argsort(items, str, algorithm) == sorted(
+        indices, key=lambda index: str(items[index])
+    )
+
+
+@pytest.mark.parametrize("to_sort", [*LISTS, list(range(1000)), [2, 1, 1] * 500])
+def test_auto_sort(to_sort: list, caplog: pytest.LogCaptureFixture) -> None:
+    """Test sorting with the automatically chosen algorithm."""
+    with caplog.at_level(logging.DEBUG, logger="paddles.sorting"):
+        before = list(to_sort)
+        assert auto_sorted(to_sort) == sorted(to_sort)
+        assert to_sort == before
+        copied = list(to_sort)
+        auto_sort(copied)
+        assert copied == sorted(to_sort)
+    assert caplog.messages[0].startswith("auto_sorted chose ")
+    assert caplog.messages[1].startswith("auto_sort chose ")
+
+
+def test_auto_sorted_with_algorithm() -> None:
+    """Test that the chosen algorithm is returned with the sorted items."""
+    random.seed(0)
+    shuffled = random.sample(range(1000), 1000)
+    few_unique = [item % 3 for item in shuffled]
+    assert auto_sorted_with_algorithm([3, 2, 1]) == ([1, 2, 3], insertion_sort)
+    assert auto_sorted_with_algorithm(shuffled) == (sorted(shuffled), merge_sorted)
+    assert auto_sorted_with_algorithm(few_unique) == (
+        sorted(few_unique),
+        quick_sorted_3way,
+    )
+
+
+def test_choose_algorithm() -> None:
+    """Test the algorithm chosen for various inputs."""
+    random.seed(0)
+    shuffled = random.sample(range(1000), 1000)
+    assert choose_algorithm([3, 2, 1]) == insertion_sort
+    assert choose_algorithm(range(1000)) == insertion_sort
+    assert choose_algorithm(shuffled) == merge_sorted
+    assert choose_algorithm([item % 3 for item in shuffled]) == quick_sorted_3way
+
+
+def test_choose_algorithm_nearly_sorted() -> None:
+    """Test that long, nearly sorted sequences don't get a quadratic algorithm."""
+    random.seed(0)
+    for size in [1_000, 10_000, 100_000]:
+        # Swap 1% of random pairs of items, like the benchmark's nearly sorted input.
+        nearly_sorted = list(range(size))
+        for _ in range(size // 100):
+            first, second = random.sample(range(size), 2)
+            nearly_sorted[first], nearly_sorted[second] = (
+                nearly_sorted[second],
+                nearly_sorted[first],
+            )
+        for _ in range(50):
+            assert choose_algorithm(nearly_sorted) == merge_sorted
+
+
+# Test the instrumentation.
+
+
+@pytest.mark.parametrize(
+    "sort_function",
+    [bogo_sort, bubble_sort, heap_sort, insertion_sort, selection_sort, shell_sort],
+)
+@pytest.mark.parametrize("to_sort", LISTS)
+def test_count_operations_sort(sort_function: SortFunction, to_sort: list) -> None:
+    """Test that counting the operations of an in-place sort still sorts the list."""
+    copied = list(to_sort)
+    result, counts = count_operations(sort_function, copied)
+    assert result is None
+    assert copied == sorted(to_sort)
+    assert counts["calls"] == counts["depth"] == 1
+
+
+@pytest.mark.parametrize(
+    "sorted_function", [bogo_sorted, merge_sorted, quick_sorted, quick_sorted_3way]
+)
+@pytest.mark.parametrize("to_sort", LISTS + SEQUENCES)
+def test_count_operations_sorted(
+    sorted_function: SortedFunction, to_sort: Sequence
+) -> None:
+    """Test that counting the operations of a function returns its result."""
+    result, counts = count_operations(sorted_function, to_sort)
+    assert result == sorted(to_sort)
+    assert counts["moves"] == 0
+    assert counts["calls"] >= counts["depth"] >= 1
+
+
+@pytest.mark.parametrize("to_sort", LISTS + SEQUENCES)
+def test_count_operations_argsort(to_sort: Sequence) -> None:
+    """Test that counting the operations of `argsort` returns the indices."""
+    result, counts = count_operations(argsort, to_sort)
+    assert result == sorted(range(len(to_sort)), key=lambda index: to_sort[index])
+    assert counts["moves"] == 0
+    assert counts["calls"] == counts["depth"] == 1
+
+
+@pytest.mark.parametrize("keyed_function", [keyed_sort, keyed_sorted])
+def test_count_operations_keyed(keyed_function: Callable) -> None:
+    """Test that the key gets the items, not the wrappers that count comparisons."""
+    items = ["bb", "c", "aaa", "d"]
+    result, counts = count_operations(keyed_function, items, len, heap_sort)
+    if result is None:  # the function sorted the items in-place
+        result = items
+    assert result == ["c", "d", "bb", "aaa"]
+    assert counts["comparisons"] > 0
+    assert counts["calls"] == 1
+    assert count_operations(argsort, ["bb", "c", "aaa"], len)[0] == [1, 0, 2]
+
+
+def test_count_operations() -> None:
+    """Test the counts for a few functions and inputs."""
+    _, counts = count_operations(bubble_sort, [3, 2, 1])
+    assert counts == {"comparisons": 3, "moves": 6, "calls": 1, "depth": 1}
+    _, counts = count_operations(insertion_sort, [1, 2, 3, 4])
+    assert counts == {"comparisons": 3, "moves": 3, "calls": 1, "depth": 1}
+    _, counts = count_operations(quick_sorted, [1, 2, 3])
+    assert counts == {"comparisons": 3, "moves": 0, "calls": 5, "depth": 3}
+    assert count_operations(quick_select, [5, 1, 4, 3], 2)[0] == 3  # noqa: PLR2004
+    result, counts = count_operations(
+        lambda items: items[0] <= items[1] >= items[0], "ab"
+    )
+    assert result is True
+    assert counts["comparisons"] == 2  # noqa: PLR2004
+
+
+# Test the vectorized backend, if NumPy is installed.
+
+
+def numeric_arrays(items: list) -> list:
+    """Return NumPy arrays and `array.array`s with the `items`."""
+    np = pytest.importorskip("numpy")
+    return [
+        np.array(items, dtype=int),
+        np.array(items, dtype=float),
+        array.array("q", items),
+        array.array("d", items),
+    ]
+
+
+# Longer lists, for the backend to process several runs and partitions at once.
+LONG_LISTS = [
+    random.Random(0).choices(range(100), k=1000),  # noqa: S311
+    list(range(1000, 0, -3)),
+]
+
+
+@pytest.mark.parametrize(
+    "sorted_function", [merge_sorted, quick_sorted, quick_sorted_3way]
+)
+@pytest.mark.parametrize("to_sort", LISTS + LONG_LISTS)
+def test_sorted_array(sorted_function: SortedFunction, to_sort: list) -> None:
+    """Test that sorting an array of numbers returns a new sorted list."""
+    for numbers in numeric_arrays(to_sort):
+        before = list(numbers)
+        result = sorted_function(numbers)
+        assert type(result) is list
+        assert result == sorted(to_sort)
+        assert list(numbers) == before
+
+
+def test_choose_algorithm_array() -> None:
+    """Test that the vectorized backend is chosen for arrays of numbers."""
+    for numbers in numeric_arrays(list(range(100, 0, -1))):
+        assert choose_algorithm(numbers) == merge_sorted
+
+
+@pytest.mark.parametrize("to_sort", LISTS)
+def test_quick_select_array(to_sort: list) -> None:
+    """Select the k-th smallest number of an array, for all possible k."""
+    for numbers in numeric_arrays(to_sort):
+        for k, expected in enumerate(sorted(to_sort)):
+            selected = quick_select(numbers, k + 1)
+            assert selected == expected
+            assert type(selected) in (int, float)
+
+
+@pytest.mark.parametrize("to_sort", LISTS)
+def test_bogo_sort_array(to_sort: list) -> None:
+    """Test sorting an array of numbers in-place."""
+    for numbers in numeric_arrays(to_sort):
+        bogo_sort(numbers)
+        assert list(numbers) == sorted(to_sort)
+
+
+@pytest.mark.parametrize("to_sort", LISTS)
+def test_merge_array(to_sort: list) -> None:
+    """Test merging two sorted arrays of numbers into a new sorted array."""
+    middle = len(to_sort) // 2
+    left = sorted(to_sort[:middle])
+    right = sorted(to_sort[middle:])
+    for left_numbers, right_numbers in zip(
+        numeric_arrays(left), numeric_arrays(right), strict=True
+    ):
+        merged = merge(left_numbers, right_numbers)
+        assert type(merged) is list
+        assert merged == merge(left, right)
+        assert is_non_decreasing(merged)
+
+
+def test_merge_mixed_arrays() -> None:
+    """Test merging arrays that NumPy would convert to floats, losing precision."""
+    np = pytest.importorskip("numpy")
+    signed = np.array([-1, 2**62], dtype=np.int64)
+    unsigned = np.array([2**63 - 1, 2**63], dtype=np.uint64)
+    merged = merge(signed, unsigned)
+    assert merged == [-1, 2**62, 2**63 - 1, 2**63]
+    assert all(type(number) is int for number in merged)
+    merged = merge(array.array("q", [2**53 + 1]), array.array("d", [2.0**53]))
+    assert merged == [2.0**53, 2**53 + 1]
+    assert type(merged[1]) is int
+
+
+@pytest.mark.parametrize("sorted_function", [merge_sorted, quick_sorted])
+def test_sorted_array_nan(sorted_function: SortedFunction) -> None:
+    """Test that arrays with NaNs, which aren't ordered, are sorted like lists."""
+    np = pytest.importorskip("numpy")
+    to_sort = [3.0, math.nan, 1.0, 2.0, math.nan, 0.5]
+    expected = str(sorted_function(to_sort))
+    for numbers in [np.array(to_sort), array.array("d", to_sort)]:
+        result = sorted_function(numbers)
+        assert str([float(number) for number in result]) == expected
@@ -1,14 +1,25 @@
 """Closed-box unit tests for all Stack ADT implementations."""
 
+import array
+import copy
+import itertools
+import pickle
+import weakref
 from collections.abc import Sequence
 
 import pytest
 
-from paddles import DynamicArrayStack, LinkedListStack
+from paddles import (
+    ChunkedStack,
+    DynamicArrayStack,
+    LinkedListStack,
+    StaticArrayStack,
+    TypedArrayStack,
+)
 
 # Helper functions: can't be named test_... or pytest will call them directly.
 
-StackADT = DynamicArrayStack | LinkedListStack
+StackADT = ChunkedStack | DynamicArrayStack | LinkedListStack
 
 
 def check_is_empty(stack: StackADT) -> None:
@@ -21,25 +32,38 @@ def check_is_empty(stack: StackADT) -> None:
     assert str(stack) == f"{stack.__class__.__name__}([])"
 
 
+def unpickle(data: bytes) -> StackADT:
+    """Return the stack pickled in `data` by the tests."""
+    return pickle.loads(data)  # noqa: S301 (the data isn't untrusted)
+
+
+# Unpickling must work with every protocol, including the text protocol 0.
+PROTOCOLS = range(pickle.HIGHEST_PROTOCOL + 1)
+
+# The members of the stacks in the tests.
+ITEMS = ["abcd", [3, 2, 1], (True, False, None), range(20)]
+
 # Execute each test for all combinations of these parameter values.
-pytestmark = [
-    pytest.mark.parametrize("Stack", [LinkedListStack, DynamicArrayStack]),
-    pytest.mark.parametrize(
-        "items", ["abcd", [3, 2, 1], (True, False, None), range(20)]
-    ),
-]
+stack_cases = pytest.mark.parametrize(
+    ("Stack", "items"),
+    list(itertools.product([LinkedListStack, DynamicArrayStack, ChunkedStack], ITEMS)),
+)
 
 # Test the creation methods.
 
 
+@stack_cases
 def test_init_empty(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803 ARG001
-    """Test the creation of empty stacks.
+    """Test the creation of empty stacks, also by unpickling.
 
     Ignore `items` as it's not needed for this one test.
     """
     check_is_empty(Stack())
+    for protocol in PROTOCOLS:
+        check_is_empty(unpickle(pickle.dumps(Stack(), protocol)))
 
 
+@stack_cases
 def test_init_iterable(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
     """Test the creation of stacks from itemss."""
     stack = Stack(items)
@@ -51,6 +75,7 @@ def test_init_iterable(Stack: type[StackADT], items: Sequence) -> None:  # noqa:
 # Test each modifier method separately.
 
 
+@stack_cases
 def test_push(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
     """Test that `push(item)` adds `item` to the top."""
     stack = Stack()
@@ -62,6 +87,7 @@ def test_push(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
     assert str(stack) == f"{Stack.__name__}({list(items)})"
 
 
+@stack_cases
 def test_pop(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
     """Test that `pop()` removes and returns the top item."""
     stack = Stack(items)
@@ -72,9 +98,93 @@ def test_pop(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
     check_is_empty(stack)
 
 
+@stack_cases
+def test_push_many(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `push_many(items)` pushes the items in order."""
+    stack = Stack(items)
+    stack.push_many(iter(items))
+    stack.push_many([])
+    assert stack.size() == 2 * len(items)
+    assert str(stack) == f"{Stack.__name__}({list(items) * 2})"
+
+
+@stack_cases
+def test_pop_many(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `pop_many(n)` pops the top n members."""
+    stack = Stack(items)
+    assert stack.pop_many(0) == []
+    assert stack.pop_many(2) == list(reversed(items[-2:]))
+    assert stack.pop_many(stack.size()) == list(reversed(items[:-2]))
+    check_is_empty(stack)
+
+
+@stack_cases
+def test_pop_many_error(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that `pop_many(n)` fails if there aren't n members to pop."""
+    stack = Stack(items)
+    for n in (-1, len(items) + 1):
+        with pytest.raises(ValueError, match=f"can't pop {n} members from a stack"):
+            stack.pop_many(n)
+    assert str(stack) == f"{Stack.__name__}({list(items)})"
+
+
+@stack_cases
+def test_capacity(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that the capacity of a dynamic array stack is at least its size."""
+    if Stack is not DynamicArrayStack:
+        pytest.skip(f"{Stack.__name__} has no capacity")
+    stack = DynamicArrayStack()
+    for item in items:
+        stack.push(item)
+        assert stack.capacity() >= stack.size()
+
+
+@stack_cases
+def test_iter(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that iterating over a stack goes from top to bottom, without popping."""
+    stack = Stack(items)
+    assert list(stack) == list(reversed(items))
+    assert stack.size() == len(items)
+    assert list(Stack()) == []
+
+
+@stack_cases
+def test_repr(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that the repr of a linked stack has the size and the top members."""
+    if Stack is DynamicArrayStack:
+        pytest.skip("DynamicArrayStack has the default repr")
+    top = ", ".join(repr(item) for item in items[-3:])
+    if len(items) > 3:  # noqa: PLR2004
+        top = "..., " + top
+    assert repr(Stack(items)) == f"<{Stack.__name__}: size {len(items)}, [{top}]>"
+    assert repr(Stack()) == f"<{Stack.__name__}: size 0, []>"
+
+
+@stack_cases
+def test_fork(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that a fork and the original stack can be changed independently."""
+    stack = Stack(items)
+    fork = stack.fork()
+    assert str(fork) == str(stack)
+    fork.push("fork")
+    stack.pop()
+    assert fork.size() == len(items) + 1
+    assert fork.peek() == "fork"
+    assert str(stack) == f"{Stack.__name__}({list(items[:-1])})"
+    for item in reversed(items[:-1]):
+        assert stack.pop() == item
+    check_is_empty(stack)
+    assert fork.pop() == "fork"
+    for item in reversed(items):
+        assert fork.pop() == item
+    check_is_empty(fork)
+    check_is_empty(Stack().fork())
+
+
 # Test the combined behaviour of modifiers.
 
 
+@stack_cases
 def test_lifo(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
     """Test the last-in first-out behaviour of stacks."""
     stack = Stack()
@@ -83,3 +193,316 @@ def test_lifo(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
     for item in reversed(items):
         assert stack.pop() == item
     check_is_empty(stack)
+
+
+@stack_cases
+def test_lifo_large(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test the last-in first-out behaviour with many members.
+
+    Push and pop the members several times, alternating the two operations
+    at a block boundary of chunked stacks.
+    """
+    large = list(items) * 50
+    stack = Stack(large)
+    assert str(stack) == f"{Stack.__name__}({large})"
+    for item in reversed(large[-70:]):
+        assert stack.pop() == item
+    for item in large[-70:]:
+        stack.push(item)
+        assert stack.pop() == item
+        stack.push(item)
+    fork = stack.fork()
+    assert stack.pop_many(100) == list(reversed(large[-100:]))
+    stack.push_many(large[-100:])
+    for item in reversed(large):
+        assert stack.pop() == item
+    check_is_empty(stack)
+    stack.push_many(large)
+    assert stack.pop_many(len(large)) == list(reversed(large))
+    check_is_empty(stack)
+    for item in reversed(large):
+        assert fork.pop() == item
+    check_is_empty(fork)
+
+
+# Test copying and pickling.
+
+
+@stack_cases
+def test_copy(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that copies and unpickled stacks are independent of the original."""
+    stack = Stack(items)
+    copies = [copy.copy(stack), copy.deepcopy(stack)]
+    copies += [unpickle(pickle.dumps(stack, protocol)) for protocol in PROTOCOLS]
+    for copied in copies:
+        assert str(copied) == str(stack)
+        copied.push(None)
+        assert copied.pop_many(len(items) + 1) == [None, *reversed(items)]
+        check_is_empty(copied)
+    assert str(stack) == f"{Stack.__name__}({list(items)})"
+    nested = Stack([[item] for item in items])
+    shallow = copy.copy(nested)
+    deep = copy.deepcopy(nested)
+    assert shallow.peek() is nested.peek()
+    assert deep.peek() is not nested.peek()
+    assert deep.peek() == nested.peek()
+
+
+@stack_cases
+def test_copy_large(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test copying and pickling stacks with many members."""
+    large = list(items) * 5_000
+    stack = Stack(large)
+    for copied in (copy.deepcopy(stack), unpickle(pickle.dumps(stack))):
+        assert copied.size() == len(large)
+        assert str(copied) == str(stack)
+
+
+@stack_cases
+def test_weakref(Stack: type[StackADT], items: Sequence) -> None:  # noqa: N803
+    """Test that stacks can be weakly referenced, e.g. in caches."""
+    stack = Stack(items)
+    reference = weakref.ref(stack)
+    assert reference() is stack
+    del stack
+    assert reference() is None
+
+
+# Tests for `StaticArrayStack`, which has a fixed capacity.
+
+
+def check_static_is_empty(stack: StaticArrayStack) -> None:
+    """Test that the stack is empty."""
+    assert stack.size() == 0
+    with pytest.raises(ValueError, match="can't peek into an empty stack"):
+        stack.peek()
+    with pytest.raises(ValueError, match="can't pop a member from an empty stack"):
+        stack.pop()
+    assert str(stack) == "StaticArrayStack([])"
+
+
+def check_is_full(stack: StaticArrayStack) -> None:
+    """Test that the stack is full and that pushing leaves it unchanged."""
+    before = str(stack)
+    assert stack.size() == stack.capacity()
+    with pytest.raises(ValueError, match="can't push a member onto a full stack"):
+        stack.push(None)
+    with pytest.raises(ValueError, match="can't push 2 members onto a stack with"):
+        stack.push_many([None, None])
+    assert str(stack) == before
+
+
+# Execute each test for all combinations of these parameter values.
+static_cases = pytest.mark.parametrize(
+    ("spare", "items"), list(itertools.product([0, 1, 10], ITEMS))
+)
+
+
+@static_cases
+def test_static_init_empty(spare: int, items: Sequence) -> None:  # noqa: ARG001
+    """Test the creation of empty stacks.
+
+    Ignore `items` as it's not needed for this one test.
+    """
+    stack = StaticArrayStack(spare)
+    assert stack.capacity() == spare
+    check_static_is_empty(stack)
+
+
+@static_cases
+def test_static_init_iterable(spare: int, items: Sequence) -> None:
+    """Test the creation of stacks from items."""
+    stack = StaticArrayStack(len(items) + spare, items)
+    assert stack.size() == len(items)
+    assert stack.capacity() == len(items) + spare
+    assert stack.peek() == items[-1]
+    assert str(stack) == f"StaticArrayStack({list(items)})"
+
+
+@static_cases
+def test_static_init_error(spare: int, items: Sequence) -> None:
+    """Test that a stack can't be created with too little capacity."""
+    with pytest.raises(ValueError, match="can't create a stack with negative"):
+        StaticArrayStack(-spare - 1)
+    with pytest.raises(ValueError, match="onto a stack with space for"):
+        StaticArrayStack(len(items) - 1, items)
+
+
+@static_cases
+def test_static_lifo(spare: int, items: Sequence) -> None:
+    """Test the last-in first-out behaviour until the stack is full."""
+    stack = StaticArrayStack(len(items) + spare)
+    for item in items:
+        stack.push(item)
+        assert stack.peek() == item
+    stack.push_many([None] * spare)
+    check_is_full(stack)
+    assert stack.pop_many(spare) == [None] * spare
+    fork = copy.copy(stack)
+    assert list(fork) == list(reversed(items))
+    for item in reversed(items):
+        assert stack.pop() == item
+    check_static_is_empty(stack)
+    assert fork.capacity() == len(items) + spare
+    assert fork.pop_many(len(items)) == list(reversed(items))
+    check_static_is_empty(fork)
+    with pytest.raises(ValueError, match="can't pop 1 members from a stack with 0"):
+        fork.pop_many(1)
+
+
+@static_cases
+def test_static_reserve(spare: int, items: Sequence) -> None:
+    """Test that `reserve(capacity)` only increases the capacity."""
+    stack = StaticArrayStack(len(items), items)
+    check_is_full(stack)
+    stack.reserve(len(items) - 1)
+    assert stack.capacity() == len(items)
+    stack.reserve(len(items) + spare)
+    assert stack.capacity() == len(items) + spare
+    stack.push_many(items[:spare])
+    assert str(stack) == f"StaticArrayStack({list(items) + list(items[:spare])})"
+
+
+@static_cases
+def test_static_pickle(spare: int, items: Sequence) -> None:
+    """Test that unpickled stacks keep their capacity, with every protocol."""
+    stack = StaticArrayStack(len(items) + spare, items)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(stack, protocol))  # noqa: S301 (the data isn't untrusted)
+        assert copied.capacity() == stack.capacity()
+        copied.push_many([None] * spare)
+        check_is_full(copied)
+        assert copied.pop_many(len(items) + spare) == [None] * spare + list(
+            reversed(items)
+        )
+    assert str(stack) == f"StaticArrayStack({list(items)})"
+    reference = weakref.ref(stack)
+    del stack
+    assert reference() is None
+
+
+# Tests for `TypedArrayStack`, which only stores numbers.
+
+
+def check_typed_is_empty(stack: TypedArrayStack) -> None:
+    """Test that the stack is empty."""
+    assert stack.size() == 0
+    with pytest.raises(ValueError, match="can't peek into an empty stack"):
+        stack.peek()
+    with pytest.raises(ValueError, match="can't pop a member from an empty stack"):
+        stack.pop()
+    assert str(stack) == f"TypedArrayStack({stack.typecode()!r}, [])"
+
+
+# Execute each test for all combinations of these parameter values.
+typed_cases = pytest.mark.parametrize(
+    ("typecode", "items"),
+    [
+        ("b", [3, -2, 1]),
+        ("Q", range(20)),
+        ("d", [0.5, -1.0, 2.25, 1e300]),
+        ("f", [0.5, 0.25]),
+        ("u", "abcd"),
+    ],
+)
+
+
+@typed_cases
+def test_typed_init_empty(typecode: str, items: Sequence) -> None:  # noqa: ARG001
+    """Test the creation of empty stacks.
+
+    Ignore `items` as it's not needed for this one test.
+    """
+    check_typed_is_empty(TypedArrayStack(typecode))
+
+
+@typed_cases
+def test_typed_init_iterable(typecode: str, items: Sequence) -> None:
+    """Test the creation of stacks from items."""
+    stack = TypedArrayStack(typecode, items)
+    assert stack.size() == len(items)
+    assert stack.peek() == items[-1]
+    assert stack.typecode() == typecode
+    assert str(stack) == f"TypedArrayStack({typecode!r}, {list(items)})"
+
+
+@typed_cases
+def test_typed_init_error(typecode: str, items: Sequence) -> None:  # noqa: ARG001
+    """Test that creating a stack fails for an unknown typecode."""
+    with pytest.raises(ValueError, match="bad typecode"):
+        TypedArrayStack("x", items)
+
+
+@typed_cases
+def test_typed_lifo(typecode: str, items: Sequence) -> None:
+    """Test the last-in first-out behaviour of stacks."""
+    stack = TypedArrayStack(typecode)
+    for item in items:
+        stack.push(item)
+        assert stack.peek() == item
+    fork = copy.copy(stack)
+    assert list(fork) == list(reversed(items))
+    for item in reversed(items):
+        assert stack.pop() == item
+    check_typed_is_empty(stack)
+    assert fork.pop_many(len(items)) == list(reversed(items))
+    check_typed_is_empty(fork)
+
+
+@typed_cases
+def test_typed_push_many(typecode: str, items: Sequence) -> None:
+    """Test pushing items from iterables and from buffers."""
+    stack = TypedArrayStack(typecode)
+    stack.push_many(iter(items))
+    stack.push_many(array.array(typecode, items))
+    stack.push_many(array.array(typecode, reversed(items)))
+    assert stack.pop_many(len(items)) == list(items)
+    assert stack.pop_many(0) == []
+    assert str(stack) == f"TypedArrayStack({typecode!r}, {list(items) * 2})"
+    with pytest.raises(ValueError, match="can't pop -1 members from a stack with"):
+        stack.pop_many(-1)
+
+
+@typed_cases
+def test_typed_push_many_numpy(typecode: str, items: Sequence) -> None:
+    """Test pushing items from NumPy arrays, with the same type or not."""
+    np = pytest.importorskip("numpy")
+    if typecode == "u":
+        pytest.skip("NumPy arrays can't have Unicode characters as items")
+    stack = TypedArrayStack(typecode)
+    numbers = np.array(items, dtype=typecode)
+    stack.push_many(numbers)
+    stack.push_many(numbers.astype(object))
+    stack.push_many(numbers[::-1])  # not contiguous
+    assert str(stack) == (
+        f"TypedArrayStack({typecode!r}, {list(items) * 2 + list(reversed(items))})"
+    )
+
+
+@typed_cases
+def test_typed_view(typecode: str, items: Sequence) -> None:
+    """Test that a view has the members and prevents changing the stack."""
+    stack = TypedArrayStack(typecode, items)
+    with stack.view() as members:
+        assert members.tobytes() == array.array(typecode, items).tobytes()
+        assert members.readonly
+        with pytest.raises(BufferError):
+            stack.push(items[0])
+    stack.push(items[0])
+    assert stack.size() == len(items) + 1
+
+
+@typed_cases
+def test_typed_pickle(typecode: str, items: Sequence) -> None:
+    """Test that unpickled stacks keep their type code, with every protocol."""
+    stack = TypedArrayStack(typecode, items)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copied = pickle.loads(pickle.dumps(stack, protocol))  # noqa: S301 (the data isn't untrusted)
+        assert copied.typecode() == typecode
+        copied.push(items[0])
+        assert copied.pop_many(len(items) + 1) == [items[0], *reversed(items)]
+        check_typed_is_empty(copied)
+    assert str(stack) == f"TypedArrayStack({typecode!r}, {list(items)})"
+    reference = weakref.ref(stack)
+    del stack
+    assert reference() is None